@@ -47,6 +47,7 @@ from falcon.util import *  # NOQA
 from falcon.hooks import before, after  # NOQA
 from falcon.request import Request, RequestOptions, Forwarded  # NOQA
 from falcon.response import Response, ResponseOptions  # NOQA
+from falcon.params import Param, query_params  # NOQA
 
 
 ASGI_SUPPORTED = _sys.version_info.minor > 5
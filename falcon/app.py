@@ -189,14 +189,22 @@ class App:
                  '_error_handlers', '_router', '_sinks',
                  '_serialize_error', 'req_options', 'resp_options',
                  '_middleware', '_independent_middleware', '_router_search',
-                 '_static_routes', '_cors_enable', '_unprepared_middleware')
+                 '_static_routes', '_cors_enable', '_unprepared_middleware',
+                 '_sink_matchers', '_static_route_matchers', '_url_routes',
+                 '_url_names', '_url_builders', '_resource_url_builders')
 
     def __init__(self, media_type=DEFAULT_MEDIA_TYPE,
                  request_type=Request, response_type=Response,
                  middleware=None, router=None,
                  independent_middleware=True, cors_enable=False):
         self._sinks = []
+        self._sink_matchers = []
         self._static_routes = []
+        self._static_route_matchers = []
+        self._url_routes = {}
+        self._url_names = {}
+        self._url_builders = None
+        self._resource_url_builders = None
 
         if cors_enable:
             cm = CORSMiddleware()
@@ -334,19 +342,13 @@ class App:
         body = []
         length = 0
 
-        try:
-            body, length = self._get_body(resp, env.get('wsgi.file_wrapper'))
-        except Exception as ex:
-            if not self._handle_exception(req, resp, ex, params):
-                raise
-
-            req_succeeded = False
-
         resp_status = resp.status
         default_media_type = self.resp_options.default_media_type
 
         if req.method == 'HEAD' or resp_status in _BODILESS_STATUS_CODES:
-            body = []
+            # PERF: The body is not going to be sent anyway, so only render it
+            #   when there is no other way to determine the Content-Length
+            #   of a HEAD response, and never open or iterate resp.stream.
 
             # PERF(vytas): move check for the less common and much faster path
             # of resp_status being in {204, 304} here; NB: this builds on the
@@ -359,18 +361,40 @@ class App:
             if resp_status in _TYPELESS_STATUS_CODES:
                 default_media_type = None
             elif (
-                length is not None and
                 req.method == 'HEAD' and
                 resp_status not in _BODILESS_STATUS_CODES and
                 'content-length' not in resp._headers
             ):
+                try:
+                    length = self._get_body_length(resp)
+                except Exception as ex:
+                    if not self._handle_exception(req, resp, ex, params):
+                        raise
+
+                    req_succeeded = False
+                    resp_status = resp.status
+
                 # NOTE(kgriffs): We really should be returning a Content-Length
                 #   in this case according to my reading of the RFCs. By
                 #   optionally using len(data) we let a resource simulate HEAD
                 #   by turning around and calling it's own on_get().
-                resp._headers['content-length'] = str(length)
+                if length is not None:
+                    resp._headers['content-length'] = str(length)
+
+            stream = resp.stream
+            if stream is not None and hasattr(stream, 'close'):
+                stream.close()
 
         else:
+            try:
+                body, length = self._get_body(resp, env.get('wsgi.file_wrapper'))
+            except Exception as ex:
+                if not self._handle_exception(req, resp, ex, params):
+                    raise
+
+                req_succeeded = False
+                resp_status = resp.status
+
             # PERF(kgriffs): Böse mußt sein. Operate directly on resp._headers
             #   to reduce overhead since this is a hot/critical code path.
             # NOTE(kgriffs): We always set content-length to match the
@@ -474,6 +498,14 @@ class App:
                 :class:`.CompiledRouter` to compile the routing logic on this call,
                 since it will otherwise delay compilation until the first request
                 is routed. See :meth:`.CompiledRouter.add_route` for further details.
+            host (str): Optional host name that can be provided when using the
+                default :class:`.CompiledRouter` in order to only match this
+                route for requests to the given host. See
+                :meth:`.CompiledRouter.add_route` for further details.
+            name (str): Optional name for the route, which may be passed to
+                :meth:`~.url_for` in order to build a path from the route's
+                URI template (only supported when using the default
+                :class:`.CompiledRouter`).
 
         Note:
             Any additional keyword arguments not defined above are passed
@@ -498,6 +530,93 @@ class App:
 
         self._router.add_route(uri_template, resource, **kwargs)
 
+        # NOTE: Custom routers may accept templates that use a different
+        #   syntax, so url_for() is only supported for the default router.
+        if isinstance(self._router, routing.CompiledRouter):
+            # NOTE: Re-adding a template replaces the earlier route, the
+            #   same as it does in the router itself.
+            self._url_routes[(kwargs.get('host'), uri_template)] = resource
+
+            name = kwargs.get('name')
+            if name is not None:
+                self._url_names[name] = uri_template
+
+            # NOTE: The builders are compiled lazily by url_for(), so that
+            #   apps that never call it do not pay for the compilation.
+            self._url_builders = self._resource_url_builders = None
+
+    def url_for(self, resource_or_name, **fields):
+        """Build a path from the URI template of a previously added route.
+
+        The route may be identified either by the name that was passed to
+        :meth:`~.add_route`, or by its resource. In the latter case, the
+        first route that was added for the resource with the exact same set
+        of fields as the given keyword arguments is used; thus, suffixed
+        routes are naturally disambiguated::
+
+            app.add_route('/things', things)
+            app.add_route('/things/{thing_id:int}', things, suffix='item')
+
+            # '/things/42'
+            location = app.url_for(things, thing_id=42)
+
+        Each field value is converted to a ``str`` (if it is not one
+        already), and then percent-encoded with
+        :func:`falcon.uri.encode_value`.
+
+        Note:
+            Only routes added while using the default
+            :class:`.CompiledRouter` may be looked up by this method.
+
+        Note:
+            The resulting path is relative to the root of the app. When the
+            app is mounted under a path prefix, the request's
+            :attr:`~falcon.Request.root_path` (or
+            :attr:`~falcon.Request.prefix`) should be prepended in order to
+            construct an absolute path (or URL, respectively).
+
+        Args:
+            resource_or_name: The name of the route, or the resource
+                instance that was passed to :meth:`~.add_route`.
+
+        Keyword Args:
+            **fields: Values for the fields in the route's URI template.
+
+        Returns:
+            str: The resulting path.
+
+        Raises:
+            ValueError: No matching route was found, or the given fields do
+                not match the fields in the route's URI template.
+        """
+
+        if self._resource_url_builders is None:
+            self._compile_url_builders()
+
+        if isinstance(resource_or_name, str):
+            try:
+                field_names, build = self._url_builders[self._url_names[resource_or_name]]
+            except KeyError:
+                msg = 'No route was added with the name "{0}"'.format(resource_or_name)
+                raise ValueError(msg)
+
+            if field_names != fields.keys():
+                msg = 'Fields do not match the URI template of the "{0}" route: {1}'.format(
+                    resource_or_name, ', '.join(sorted(field_names)) or '(none)')
+                raise ValueError(msg)
+
+        else:
+            for resource, field_names, build in self._resource_url_builders.get(
+                    id(resource_or_name), ()):
+                if resource is resource_or_name and field_names == fields.keys():
+                    break
+            else:
+                msg = 'No route was added for {0!r} with the fields: {1}'.format(
+                    resource_or_name, ', '.join(sorted(fields)) or '(none)')
+                raise ValueError(msg)
+
+        return build(fields)
+
     def add_static_route(self, prefix, directory, downloadable=False, fallback_filename=None):
         """Add a route to a directory of static files.
 
@@ -555,6 +674,10 @@ class App:
                                     fallback_filename=fallback_filename)
         )
 
+        # PERF: Combine the prefixes so that they can be checked in a single
+        #   pass, regardless of the number of static routes.
+        self._static_route_matchers = helpers.prepare_static_routes(self._static_routes)
+
     def add_sink(self, sink, prefix=r'/'):
         """Register a sink method for the App.
 
@@ -597,6 +720,10 @@ class App:
         # is preferred.
         self._sinks.insert(0, (prefix, sink))
 
+        # PERF: Combine the prefixes so that they can be matched in a single
+        #   pass, regardless of the number of sinks.
+        self._sink_matchers = helpers.prepare_sinks(self._sinks)
+
     def add_error_handler(self, exception, handler=None):
         """Register a handler for one or more exception types.
 
@@ -780,6 +907,23 @@ class App:
             independent_middleware=independent_middleware
         )
 
+    def _compile_url_builders(self):
+        builders = {}
+        resource_builders = {}
+
+        for (__, uri_template), resource in self._url_routes.items():
+            try:
+                builder = builders[uri_template]
+            except KeyError:
+                builder = builders[uri_template] = routing.compile_uri_builder(uri_template)
+
+            # NOTE: Hold a reference to the resource, since its id may
+            #   otherwise be reused if the route is later overridden.
+            resource_builders.setdefault(id(resource), []).append((resource,) + builder)
+
+        self._url_builders = builders
+        self._resource_url_builders = resource_builders
+
     def _get_responder(self, req):
         """Search routes for a matching responder.
 
@@ -838,18 +982,23 @@ class App:
         else:
             params = {}
 
-            for pattern, sink in self._sinks:
-                m = pattern.match(path)
+            for match, sink, sink_map in self._sink_matchers:
+                m = match(path)
                 if m:
-                    params = m.groupdict()
-                    responder = sink
+                    if sink_map is None:
+                        params = m.groupdict()
+                        responder = sink
+                    else:
+                        responder, fields = sink_map[m.lastgroup]
+                        params = {name: m.group(group) for name, group in fields}
 
                     break
             else:
 
-                for sr in self._static_routes:
-                    if sr.match(path):
-                        responder = sr
+                for match, sr, route_map in self._static_route_matchers:
+                    m = match(path)
+                    if m:
+                        responder = sr if route_map is None else route_map[m.lastgroup]
                         break
                 else:
                     responder = self.__class__._default_responder_path_not_found
@@ -944,6 +1093,29 @@ class App:
         # handlers.
         return False
 
+    def _get_body_length(self, resp):
+        """Determine the length of the response body without sending it.
+
+        This method is used in lieu of :meth:`_get_body` when the body is
+        going to be discarded, such as in the case of a HEAD request.
+
+        Args:
+            resp: Instance of falcon.Response
+
+        Returns:
+            int: The length of the rendered body, ``0`` in the case of an
+            empty body, or ``None`` if the body is a stream of unknown length.
+        """
+
+        data = resp.render_body()
+        if data is not None:
+            return len(data)
+
+        if resp.stream is not None:
+            return None
+
+        return 0
+
     # PERF(kgriffs): Moved from api_helpers since it is slightly faster
     # to call using self, and this function is called for most
     # requests.
@@ -15,12 +15,30 @@
 """Utilities for the App class."""
 
 from inspect import iscoroutinefunction
+import re
 
 from falcon import util
 from falcon.errors import CompatibilityError
+from falcon.routing.static import StaticRoute
 from falcon.util.sync import _wrap_non_coroutine_unsafe
 
 
+# NOTE: re.Pattern is not available under Python 3.5-3.6
+_PATTERN_TYPE = type(re.compile(''))
+
+# NOTE: Numbered backreferences and conditionals would refer to the wrong
+#   group once the pattern is embedded into a combined one.
+_NUMBERED_GROUP_REF_PATTERN = re.compile(r'\\[1-9]|\(\?\(\d')
+
+# NOTE: Tokenizes a regex just enough to reliably locate any group names
+#   (i.e., the openers of named groups, named backreferences, and named
+#   conditionals), skipping over escapes and character sets.
+_PATTERN_TOKENS = re.compile(
+    r'\\.|\[\^?\]?(?:\\.|[^\]\\])*\]|\(\?P[<=](?=\w)|\(\?\((?=\w)|.',
+    re.DOTALL
+)
+
+
 def prepare_middleware(middleware, independent_middleware=False, asgi=False):
     """Check middleware interfaces and prepare the methods for request handling.
 
@@ -133,6 +151,129 @@ def prepare_middleware(middleware, independent_middleware=False, asgi=False):
     return (tuple(request_mw), tuple(resource_mw), tuple(response_mw))
 
 
+def prepare_sinks(sinks):
+    """Combine sink prefixes in order to match them in a single pass.
+
+    Consecutive prefix patterns that can be safely embedded into a larger
+    regex are combined into a single alternation, wrapping each alternative
+    in a named group. The matching sink is then identified by the name of
+    the last group that was matched, i.e., the wrapping group of the
+    matching alternative. Since alternatives are attempted in order, the
+    precedence of sinks is preserved.
+
+    Any named groups are renamed in the combined pattern in order to keep
+    them unique, so different sinks are free to use the same field names.
+
+    Args:
+        sinks (list): A list of (prefix, sink) tuples, in the order of
+            precedence.
+
+    Returns:
+        list: A list of (match, sink, sink_map) tuples, where `match` is the
+        method to call on the requested path. For a combined pattern, `sink`
+        is ``None``, and `sink_map` maps the name of each alternative to a
+        tuple of the form (sink, fields), where `fields` is a tuple of
+        (field_name, group_name) pairs. Otherwise, `sink_map` is ``None``,
+        and `sink` is the only sink associated with the pattern.
+    """
+
+    alternatives = []
+    for idx, (prefix, sink) in enumerate(sinks):
+        if (
+            isinstance(prefix, _PATTERN_TYPE) and
+            prefix.flags == re.UNICODE and
+            not _NUMBERED_GROUP_REF_PATTERN.search(prefix.pattern)
+        ):
+            name = '_falcon_prefix_{0}'.format(idx)
+            group_prefix = name + '_'
+            pattern_text = ''.join(
+                token + group_prefix if token.startswith('(?') else token
+                for token in _PATTERN_TOKENS.findall(prefix.pattern)
+            )
+            fields = tuple(
+                (field_name, group_prefix + field_name)
+                for field_name in prefix.groupindex
+            )
+            alternatives.append((name, pattern_text, (sink, fields)))
+        else:
+            alternatives.append((None, prefix.match, sink))
+
+    return _combine_alternatives(alternatives)
+
+
+def prepare_static_routes(static_routes):
+    """Combine static route prefixes in order to match them in a single pass.
+
+    This function works similarly to :func:`prepare_sinks`, except that only
+    instances of :class:`~.StaticRoute` (or its subclasses) that do not
+    override the :meth:`~.StaticRoute.match` method are combined.
+
+    Args:
+        static_routes (list): A list of static routes, in the order of
+            precedence.
+
+    Returns:
+        list: A list of (match, static_route, route_map) tuples, where
+        `route_map` maps the name of each alternative to a static route
+        for a combined pattern, and is ``None`` otherwise.
+    """
+
+    alternatives = []
+    for idx, sr in enumerate(static_routes):
+        if type(sr).match is StaticRoute.match:
+            pattern_text = re.escape(sr._prefix)
+
+            # NOTE: StaticRoute also matches the prefix without the trailing
+            #   slash when a fallback filename is configured.
+            if sr._fallback_filename is not None:
+                pattern_text += '|' + re.escape(sr._prefix[:-1]) + r'\Z'
+
+            alternatives.append(('_falcon_prefix_{0}'.format(idx), pattern_text, sr))
+        else:
+            alternatives.append((None, sr.match, sr))
+
+    return _combine_alternatives(alternatives)
+
+
+def _combine_alternatives(alternatives):
+    """Combine consecutive regex strings into alternation patterns.
+
+    Args:
+        alternatives (list): A list of (name, pattern, target) tuples, where
+            `pattern` is either a regex string to be wrapped in a group with
+            the given name, or a match method (in which case `name` is
+            ``None``) if it can not be combined with other patterns.
+
+    Returns:
+        list: A list of (match, target, target_map) tuples, as described in
+        :func:`prepare_sinks`.
+    """
+
+    matchers = []
+    pending = []
+
+    def combine():
+        if pending:
+            pattern_text = '|'.join(
+                '(?P<{0}>{1})'.format(name, text) for name, text, __ in pending
+            )
+            target_map = {name: target for name, __, target in pending}
+            matchers.append((re.compile(pattern_text).match, None, target_map))
+
+            pending.clear()
+
+    for name, pattern, target in alternatives:
+        if name is None:
+            combine()
+            matchers.append((pattern, target, None))
+        else:
+            pending.append((name, pattern, target))
+
+    combine()
+
+    return matchers
+
+
 def default_serialize_error(req, resp, exception):
     """Serialize the given instance of HTTPError.
 
@@ -393,18 +393,14 @@ class App(falcon.app.App):
 
         data = b''
 
-        try:
-            data = await resp.render_body()
-        except Exception as ex:
-            if not await self._handle_exception(req, resp, ex, params):
-                raise
-
-            req_succeeded = False
-
         resp_status = http_status_to_code(resp.status)
         default_media_type = self.resp_options.default_media_type
 
         if req.method == 'HEAD' or resp_status in _BODILESS_STATUS_CODES:
+            #
+            # PERF: The body is not going to be sent anyway, so only render
+            #   it when there is no other way to determine the Content-Length
+            #   of a HEAD response, and never read from resp.stream.
             #
             # PERF(vytas): move check for the less common and much faster path
             # of resp_status being in {204, 304} here; NB: this builds on the
@@ -420,20 +416,33 @@ class App(falcon.app.App):
             if resp_status in _TYPELESS_STATUS_CODES:
                 default_media_type = None
             elif (
-                # NOTE(kgriffs): If they are going to stream using an
-                #   async generator, we can't know in advance what the
-                #   content length will be.
-                (data is not None or not resp.stream) and
-
                 req.method == 'HEAD' and
                 resp_status not in _BODILESS_STATUS_CODES and
                 'content-length' not in resp._headers
             ):
-                # NOTE(kgriffs): We really should be returning a Content-Length
-                #   in this case according to my reading of the RFCs. By
-                #   optionally using len(data) we let a resource simulate HEAD
-                #   by turning around and calling it's own on_get().
-                resp._headers['content-length'] = str(len(data)) if data else '0'
+                try:
+                    data = await resp.render_body()
+                except Exception as ex:
+                    if not await self._handle_exception(req, resp, ex, params):
+                        raise
+
+                    req_succeeded = False
+                    resp_status = http_status_to_code(resp.status)
+
+                # NOTE(kgriffs): If they are going to stream using an
+                #   async generator, we can't know in advance what the
+                #   content length will be.
+                if data is not None or not resp.stream:
+                    # NOTE(kgriffs): We really should be returning a
+                    #   Content-Length in this case according to my reading
+                    #   of the RFCs. By optionally using len(data) we let a
+                    #   resource simulate HEAD by turning around and calling
+                    #   it's own on_get().
+                    resp._headers['content-length'] = str(len(data)) if data else '0'
+
+            stream = resp.stream
+            if stream and hasattr(stream, 'close'):
+                await stream.close()
 
             await send({
                 'type': 'http.response.start',
@@ -445,6 +454,15 @@ class App(falcon.app.App):
             self._schedule_callbacks(resp)
             return
 
+        try:
+            data = await resp.render_body()
+        except Exception as ex:
+            if not await self._handle_exception(req, resp, ex, params):
+                raise
+
+            req_succeeded = False
+            resp_status = http_status_to_code(resp.status)
+
         sse_emitter = resp.sse
         if sse_emitter:
             if isasyncgenfunction(sse_emitter):
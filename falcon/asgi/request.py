@@ -14,19 +14,23 @@
 
 """ASGI Request class."""
 
+import tempfile
+
 from falcon import errors
 from falcon import request_helpers as helpers  # NOQA: Required by fixed up WSGI Request attrs
 from falcon.constants import SINGLETON_HEADERS
 from falcon.forwarded import _parse_forwarded_header  # NOQA: Req. by fixed up WSGI Request attrs
 from falcon.forwarded import Forwarded  # NOQA
 import falcon.request
-from falcon.util.uri import parse_host, parse_query_string
+from falcon.util.uri import parse_host
 from . import _request_helpers as asgi_helpers
 from .stream import BoundedStream
 
 
 __all__ = ['Request']
 
+_SPOOL_CHUNK_SIZE = 64 * 1024
+
 
 class Request(falcon.request.Request):
     """Represents a client's HTTP request.
@@ -395,15 +399,10 @@ class Request(falcon.request.Request):
 
         query_string = scope['query_string'].decode()
         self.query_string = query_string
-        if query_string:
-            self._params = parse_query_string(
-                query_string,
-                keep_blank=self.options.keep_blank_qs_values,
-                csv=self.options.auto_parse_qs_csv,
-            )
 
-        else:
-            self._params = {}
+        # PERF: The query string is only parsed once the params are
+        #   accessed for the first time (see also: the params property).
+        self._params = None if query_string else {}
 
         self._cached_access_route = None
         self._cached_forwarded = None
@@ -444,6 +443,7 @@ class Request(falcon.request.Request):
 
         self._stream = None
         self._receive = receive
+        self._spooled_body = None
 
         # =====================================================================
         # Create a context object
@@ -723,6 +723,62 @@ class Request(falcon.request.Request):
 
     media = property(get_media)
 
+    async def spool_body(self):
+        """Buffer the request body so that it can be read more than once.
+
+        The first time this method is called, the remainder of the request
+        body is copied from :attr:`stream` to a seekable file-like
+        object. Bodies that do not exceed the
+        :attr:`~falcon.RequestOptions.body_spool_threshold` are kept in
+        memory, while larger ones are spilled to a temporary file on disk.
+
+        Every call returns a new reader for the spooled body, positioned at
+        the beginning of the data, and also replaces :attr:`stream` with a
+        new stream that replays the body. Therefore, a middleware component
+        may inspect the body without preventing the responder from consuming
+        it via :attr:`stream` or :meth:`get_media`::
+
+            body = (await req.spool_body()).read()
+
+        Note:
+            The returned object is a regular (synchronous) file-like object.
+            Reading a body that was spilled to disk will block the event loop
+            while the data is being read.
+
+        Warning:
+            Any data consumed from the request stream before this method is
+            first called is not included in the spooled body.
+
+        Returns:
+            object: A seekable file-like object for reading the request body.
+        """
+
+        body = self._spooled_body
+        if body is None:
+            threshold = self.options.body_spool_threshold
+            content_length = self.content_length
+            stream = self.stream
+
+            if content_length is not None and content_length <= threshold:
+                body = await stream.read()
+            else:
+                body = tempfile.SpooledTemporaryFile(max_size=threshold)
+                while True:
+                    chunk = await stream.read(_SPOOL_CHUNK_SIZE)
+                    if not chunk:
+                        break
+
+                    body.write(chunk)
+
+            self._spooled_body = body
+
+        self._stream = BoundedStream(
+            _replay_receiver(body),
+            helpers._spooled_body_length(body),
+        )
+
+        return helpers._open_spooled_body(body)
+
     @property
     def if_match(self):
         # TODO(kgriffs): It may make sense at some point to create a
@@ -874,3 +930,25 @@ class Request(falcon.request.Request):
                 self._asgi_server_cached = ('localhost', default_port)
 
         return self._asgi_server_cached
+
+
+def _replay_receiver(body):
+    """Create an ASGI receive() callable that replays a spooled body."""
+
+    if type(body) is bytes:
+        async def receive():
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        return receive
+
+    reader = helpers._open_spooled_body(body)
+
+    async def receive():
+        chunk = reader.read(_SPOOL_CHUNK_SIZE)
+        return {
+            'type': 'http.request',
+            'body': chunk,
+            'more_body': len(chunk) == _SPOOL_CHUNK_SIZE,
+        }
+
+    return receive
@@ -46,6 +46,12 @@ class Response(falcon.response.Response):
         media (object): A serializable object supported by the media handlers
             configured via :class:`falcon.RequestOptions`.
 
+            When set to an iterator or an async iterator (such as an async
+            generator), the items are serialized incrementally and streamed
+            as a collection, rather than being rendered all at once
+            (provided that the media handler supports it, as is the case
+            with :class:`~falcon.media.JSONHandler`).
+
             Note:
                 See also :ref:`media` for more information regarding media
                 handling.
@@ -242,6 +248,11 @@ class Response(falcon.response.Response):
             This method ignores :attr:`~.stream`; the caller must check
             and handle that attribute directly.
 
+        Note:
+            If :attr:`~.media` is set to an iterator, it is serialized
+            incrementally: the serializing iterator is assigned to
+            :attr:`~.stream` instead, and ``None`` is returned.
+
         Returns:
             bytes: The UTF-8 encoded value of the `body` attribute, if
             set. Otherwise, the value of the `data` attribute if set, or
@@ -265,10 +276,17 @@ class Response(falcon.response.Response):
                         self.options.default_media_type
                     )
 
-                    self._media_rendered = await handler.serialize_async(
-                        self._media,
-                        self.content_type
-                    )
+                    media = self._media
+                    if hasattr(media, '__anext__') or hasattr(media, '__next__'):
+                        # NOTE: Iterators are serialized incrementally, as
+                        #   the response stream is being consumed.
+                        self.stream = handler.serialize_stream_async(media, self.content_type)
+                        self._media_rendered = None
+                    else:
+                        self._media_rendered = await handler.serialize_async(
+                            media,
+                            self.content_type
+                        )
 
                 data = self._media_rendered
         else:
@@ -24,6 +24,7 @@ import random
 import sys
 import tempfile
 import timeit
+import tracemalloc
 
 try:
     import cProfile
@@ -49,6 +50,7 @@ except ImportError:
     vmprof = None
 
 from falcon.bench import create  # NOQA
+from falcon.bench import router
 import falcon.testing as helpers
 
 
@@ -64,6 +66,9 @@ ITER_DETECTION_DURATION_MAX = 6.0
 
 JIT_WARMING_MULTIPLIER = 30
 
+# NOTE: Number of requests to sample when measuring allocations
+ALLOCATION_SAMPLES = 100
+
 PYPY = platform.python_implementation() == 'PyPy'
 
 BODY = helpers.rand_string(10240, 10240).encode('utf-8') # NOQA
@@ -110,6 +115,33 @@ def bench(func, iterations, stat_memory):
     return (sec_per_req, heap_diff)
 
 
+def measure_allocations(func, samples=ALLOCATION_SAMPLES):
+    """Measure the peak memory allocated while serving a single request.
+
+    Returns:
+        float: The number of bytes traced at peak, averaged over `samples`
+        requests.
+    """
+
+    # NOTE: Warm up any lazily-initialized state so that it is not
+    #   attributed to the first sample.
+    func()
+    gc.collect()
+
+    total = 0
+    for __ in range(samples):
+        tracemalloc.start()
+        try:
+            func()
+            __, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        total += peak
+
+    return total / samples
+
+
 def determine_iterations(func):
     # NOTE(kgriffs): Algorithm adapted from IPython's magic timeit
     # function to determine iterations so that 0.2 <= total time < 2.0
@@ -352,6 +384,14 @@ def main():
     ]
 
     parser = argparse.ArgumentParser(description='Falcon benchmark runner')
+    parser.add_argument('-s', '--suite', type=str, default='frameworks',
+                        choices=['frameworks', 'router'],
+                        help='Benchmark WSGI apps (default) or the router alone')
+    parser.add_argument('-r', '--routes', type=int, nargs='+',
+                        dest='route_table_sizes',
+                        help='Route table sizes for the router suite '
+                             '(default: %s)' % ' '.join(
+                                 str(size) for size in router.ROUTE_TABLE_SIZES))
     parser.add_argument('-b', '--benchmark', type=str, action='append',
                         choices=frameworks, dest='frameworks', nargs='+')
     parser.add_argument('-i', '--iterations', type=int, default=0)
@@ -378,6 +418,10 @@ def main():
 
     frameworks = normalized_frameworks
 
+    if args.suite == 'router':
+        router.main(args.route_table_sizes, min(args.trials, 3), args.iterations)
+        return
+
     # Profile?
     if args.profile:
         framework = 'falcon-ext'
@@ -413,6 +457,13 @@ def main():
         print('{3}. {0:.<20s}{1:.>06d} req/sec or {2: >3.2f} μs/req ({4}x)'.
               format(name, req_per_sec, us_per_req, i + 1, factor))
 
+    if args.stat_memory:
+        print('\nPeak memory allocated per request:\n')
+
+        for name, _ in dataset:
+            allocated = measure_allocations(create_bench(name, get_env(name)))
+            print('{0:.<20s}{1:.>10.2f} KiB/req'.format(name, allocated / 1024))
+
     if heapy and args.stat_memory:
         print()
 
@@ -0,0 +1,182 @@
+"""Benchmarks for routing against large, synthetic route tables."""
+
+import functools
+import gc
+import sys
+import time
+import timeit
+import tracemalloc
+
+from falcon.routing import CompiledRouter
+
+
+ROUTE_TABLE_SIZES = (10, 1000, 10000, 50000)
+
+# NOTE: Each group of templates is added for a distinct first segment, in
+#   order to exercise literal, simple field, converter, and complex
+#   segment nodes.
+TEMPLATES = (
+    '/r{0}/items',
+    '/r{0}/items/{{item_id}}',
+    '/r{0}/items/{{item_id}}/tags/{{tag}}/links/{{link_id:int}}',
+    '/r{0}/versions/{{version:int(min=1)}}',
+    '/r{0}/files/{{name}}.{{ext}}',
+)
+
+# NOTE: The paths are formatted with the last group of templates, which
+#   is the worst case for any linear search.
+PATHS = (
+    ('hit', '/r{0}/items/42'),
+    ('converter', '/r{0}/versions/3'),
+    ('complex', '/r{0}/files/report.pdf'),
+    ('deep', '/r{0}/items/42/tags/falcon/links/7'),
+    ('miss', '/r{0}/items/42/tags'),
+    ('root miss', '/unknown/items/42'),
+)
+
+# NOTE: Minimum duration of a single timing run, in seconds
+ITER_DETECTION_DURATION_MIN = 0.2
+
+
+class Resource:
+    def on_get(self, req, resp):
+        pass
+
+
+def create_templates(size):
+    templates = []
+    group = 0
+
+    while len(templates) < size:
+        templates.extend(template.format(group) for template in TEMPLATES)
+        group += 1
+
+    return templates[:size]
+
+
+def create_router(templates):
+    router = CompiledRouter()
+    resource = Resource()
+
+    for template in templates:
+        router.add_route(template, resource)
+
+    return router
+
+
+def measure_memory(templates):
+    """Measure the memory retained by the routing tree and compiled finder.
+
+    Returns:
+        tuple: The number of bytes retained by the routing tree alone, and
+        the number of additional bytes retained once the router has been
+        compiled (including the return values, patterns and converters
+        referenced by the generated code).
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        baseline, __ = tracemalloc.get_traced_memory()
+
+        router = create_router(templates)
+        gc.collect()
+        tree, __ = tracemalloc.get_traced_memory()
+
+        router.find('/')
+        gc.collect()
+        compiled, __ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return tree - baseline, compiled - tree
+
+
+def measure_find(router, path, iterations):
+    timer = timeit.Timer(functools.partial(router.find, path), setup=gc.enable)
+
+    if not iterations:
+        iterations = 1
+        while timer.timeit(iterations) < ITER_DETECTION_DURATION_MIN:
+            iterations *= 2
+
+    return timer.timeit(iterations) / iterations
+
+
+def bench_size(size, trials, iterations):
+    templates = create_templates(size)
+    group = (len(templates) - 1) // len(TEMPLATES)
+
+    gc.collect()
+
+    start = time.perf_counter()
+    router = create_router(templates)
+    registration_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    router.find('/')
+    compile_sec = time.perf_counter() - start
+
+    lookups = []
+    for name, path in PATHS:
+        path = path.format(group)
+        sec_per_find = min(
+            measure_find(router, path, iterations)
+            for __ in range(trials)
+        )
+        lookups.append((name, path, sec_per_find))
+
+        sys.stdout.write('.')
+        sys.stdout.flush()
+
+    memory = measure_memory(templates)
+
+    return {
+        'size': len(templates),
+        'registration_sec': registration_sec,
+        'compile_sec': compile_sec,
+        'lookups': lookups,
+        'memory': memory,
+    }
+
+
+def run(sizes=None, trials=3, iterations=0):
+    results = []
+
+    for size in sizes or ROUTE_TABLE_SIZES:
+        sys.stdout.write('Benchmarking {} routes'.format(size))
+        sys.stdout.flush()
+
+        results.append(bench_size(size, trials, iterations))
+        print('done.')
+
+    return results
+
+
+def report(results):
+    for result in results:
+        title = '{} routes'.format(result['size'])
+        print()
+        print(title)
+        print('=' * len(title))
+
+        print('{0:.<24s}{1: >10.2f} ms'.format(
+            'add_route() total', result['registration_sec'] * 1000))
+        print('{0:.<24s}{1: >10.2f} ms'.format(
+            'first compile', result['compile_sec'] * 1000))
+
+        tree, compiled = result['memory']
+        print('{0:.<24s}{1: >10.1f} KiB'.format('routing tree', tree / 1024))
+        print('{0:.<24s}{1: >10.1f} KiB'.format('compiled finder', compiled / 1024))
+
+        for name, path, sec_per_find in result['lookups']:
+            print('{0:.<24s}{1: >10.0f} ns/op  ({2})'.format(
+                'find() ' + name, sec_per_find * 10 ** 9, path))
+
+
+def main(sizes=None, trials=3, iterations=0):
+    print()
+    results = run(sizes, trials, iterations)
+    report(results)
+    print()
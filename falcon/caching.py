@@ -0,0 +1,213 @@
+# Copyright 2026 by Falcon Contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache backends for use with :class:`~falcon.middlewares.ResponseCacheMiddleware`."""
+
+import abc
+from collections import OrderedDict
+import hashlib
+import mmap
+import struct
+import threading
+import time
+
+__all__ = ['BaseCache', 'MemoryCache', 'SharedMemoryCache']
+
+
+class BaseCache(metaclass=abc.ABCMeta):
+    """Abstract base class for a key-value cache backend.
+
+    Keys are strings, and values are byte strings. Since cache lookups are
+    performed in the request path of both WSGI and ASGI apps, implementations
+    must not block for any significant amount of time.
+    """
+
+    @abc.abstractmethod
+    def get(self, key):
+        """Get the value stored for the given key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            bytes: The value stored for the key, or ``None`` if the key is
+            not present in the cache, or if its entry has expired.
+        """
+
+    @abc.abstractmethod
+    def set(self, key, value, ttl):
+        """Store a value for the given key.
+
+        Implementations are free to evict other entries, or to silently
+        refuse to store the value (e.g., when it is too large).
+
+        Args:
+            key (str): The key to store the value under.
+            value (bytes): The value to store.
+            ttl (float): Time in seconds after which the entry expires.
+        """
+
+
+class MemoryCache(BaseCache):
+    """A thread-safe, bounded LRU cache held in the memory of the process.
+
+    Keyword Arguments:
+        max_entries (int): Maximum number of entries to keep; the least
+            recently used entries are evicted in order to make room for
+            new ones (default ``1024``).
+    """
+
+    def __init__(self, max_entries=1024):
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        entries = self._entries
+
+        with self._lock:
+            entries[key] = (value, time.monotonic() + ttl)
+            entries.move_to_end(key)
+
+            while len(entries) > self._max_entries:
+                entries.popitem(last=False)
+
+
+class SharedMemoryCache(BaseCache):
+    """A bounded cache that is shared by forked worker processes.
+
+    The cache is backed by an anonymous shared memory map, divided into
+    fixed-size slots. Each key hashes to a small set of slots; when all of
+    them are taken, the least recently used one is evicted. The memory is
+    mapped (but, on most platforms, not committed) up front, so the
+    footprint of the cache is bounded by ``capacity * max_entry_size``.
+
+    In order to be shared, the cache must be instantiated in the parent
+    process before the workers are forked (for instance, when the app is
+    preloaded by the server); otherwise, each process ends up with a
+    private copy.
+
+    Keyword Arguments:
+        capacity (int): Maximum number of entries (default ``1024``). The
+            value is rounded up to a multiple of the set size (8).
+        max_entry_size (int): Maximum combined size of an entry's UTF-8
+            encoded key and its value, in bytes. Larger values are not
+            cached (default ``65536``).
+    """
+
+    _WAYS = 8
+
+    # NOTE: Each slot starts with a header of the form:
+    #   key hash, expiry time, last access time, key length, value length
+    _SLOT_HEADER = struct.Struct('=QddII')
+    _SLOT_ACCESSED = struct.Struct('=d')
+    _SLOT_ACCESSED_OFFSET = 16
+
+    def __init__(self, capacity=1024, max_entry_size=64 * 1024):
+        # NOTE: Imported here since this module is only rarely needed, and
+        #   importing it has a noticeable cost.
+        import multiprocessing
+
+        self._sets = max(1, (capacity + self._WAYS - 1) // self._WAYS)
+        self._max_entry_size = max_entry_size
+        self._slot_size = self._SLOT_HEADER.size + max_entry_size
+        self._mmap = mmap.mmap(-1, self._sets * self._WAYS * self._slot_size)
+        self._lock = multiprocessing.Lock()
+
+    def get(self, key):
+        key = key.encode()
+        key_hash = self._hash(key)
+        key_len = len(key)
+        now = time.time()
+
+        with self._lock:
+            for offset in self._slot_offsets(key_hash):
+                slot_hash, expires, _, slot_key_len, value_len = (
+                    self._SLOT_HEADER.unpack_from(self._mmap, offset))
+
+                if slot_hash != key_hash or slot_key_len != key_len or expires <= now:
+                    continue
+
+                start = offset + self._SLOT_HEADER.size
+                if self._mmap[start:start + key_len] != key:
+                    continue
+
+                self._SLOT_ACCESSED.pack_into(
+                    self._mmap, offset + self._SLOT_ACCESSED_OFFSET, now)
+
+                start += key_len
+                return self._mmap[start:start + value_len]
+
+        return None
+
+    def set(self, key, value, ttl):
+        key = key.encode()
+        if len(key) + len(value) > self._max_entry_size:
+            return
+
+        key_hash = self._hash(key)
+        now = time.time()
+
+        with self._lock:
+            target = None
+            oldest = None
+
+            for offset in self._slot_offsets(key_hash):
+                slot_hash, expires, accessed, slot_key_len, _ = (
+                    self._SLOT_HEADER.unpack_from(self._mmap, offset))
+
+                start = offset + self._SLOT_HEADER.size
+                if (slot_hash == key_hash and slot_key_len == len(key) and
+                        self._mmap[start:start + slot_key_len] == key):
+                    target = offset
+                    break
+
+                if expires <= now:
+                    accessed = float('-inf')
+
+                if oldest is None or accessed < oldest:
+                    target = offset
+                    oldest = accessed
+
+            self._SLOT_HEADER.pack_into(
+                self._mmap, target, key_hash, now + ttl, now, len(key), len(value))
+
+            start = target + self._SLOT_HEADER.size
+            self._mmap[start:start + len(key)] = key
+            start += len(key)
+            self._mmap[start:start + len(value)] = value
+
+    def _hash(self, key):
+        # NOTE: The built-in hash() is randomized per interpreter, so it can
+        #   not be relied upon to agree between processes.
+        return int.from_bytes(hashlib.sha1(key).digest()[:8], 'little')
+
+    def _slot_offsets(self, key_hash):
+        slot_size = self._slot_size
+        first = (key_hash % self._sets) * self._WAYS
+        return range(first * slot_size, (first + self._WAYS) * slot_size, slot_size)
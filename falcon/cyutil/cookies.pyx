@@ -0,0 +1,96 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from http import cookies as http_cookies
+
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+
+
+cdef extern from "Python.h":
+    Py_ssize_t PyUnicode_Find(object string, object substring,
+                              Py_ssize_t start, Py_ssize_t end,
+                              int direction) except -2
+    Py_ssize_t PyUnicode_FindChar(object string, Py_UCS4 ch,
+                                  Py_ssize_t start, Py_ssize_t end,
+                                  int direction) except -2
+
+
+cdef Py_ssize_t cy_skip_whitespace(unicode string, Py_ssize_t pos,
+                                   Py_ssize_t end):
+    while pos < end and Py_UNICODE_ISSPACE(string[pos]):
+        pos += 1
+
+    return pos
+
+
+def scan_cookie_values(unicode header_value not None, unicode name not None):
+    """Find all values of a single named cookie in a Cookie header value.
+
+    This is a Cython variant of the scan performed by
+    ``falcon.request_helpers._parse_cookie_values()``. The caller is
+    responsible for making sure that `name` is a valid cookie name.
+
+    Args:
+        header_value (str): Value of a Cookie header
+        name (str): Cookie name, case-sensitive.
+
+    Returns:
+        list: Ordered list of all values found in the header for the named
+        cookie, or ``None`` if the cookie was not found.
+    """
+
+    cdef Py_ssize_t length = len(header_value)
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t start
+    cdef Py_ssize_t end
+    cdef list values = None
+    cdef unicode value
+
+    # PERF: Only look at the cookie-pairs where the name occurs at all,
+    #   leaving the heavy lifting to CPython's fast substring search.
+    pos = PyUnicode_Find(header_value, name, 0, length, 1)
+    while pos >= 0:
+        start = PyUnicode_FindChar(header_value, u';', 0, pos, -1) + 1
+        end = PyUnicode_FindChar(header_value, u';', pos, length, 1)
+        if end < 0:
+            end = length
+
+        # NOTE: The name matches only if it is the first non-whitespace
+        #   part of the cookie-pair, and is followed by optional whitespace,
+        #   and then either the end of the pair, or "=".
+        if cy_skip_whitespace(header_value, start, pos) == pos:
+            start = cy_skip_whitespace(header_value, pos + len(name), end)
+
+            if start == end:
+                value = u''
+            elif header_value[start] == u'=':
+                value = header_value[start + 1:end].strip()
+
+                # NOTE: See also the comments in
+                #   falcon.request_helpers.parse_cookie_header().
+                if len(value) > 2 and value[0] == u'"' and value[-1] == u'"':
+                    value = http_cookies._unquote(value)
+            else:
+                value = None
+
+            if value is not None:
+                if values is None:
+                    values = [value]
+                else:
+                    values.append(value)
+
+        if end >= length:
+            break
+
+        pos = PyUnicode_Find(header_value, name, end, length, 1)
+
+    return values
@@ -14,7 +14,9 @@
 
 """Buffered stream reader (cythonized variant)."""
 
+from cpython.buffer cimport PyBUF_WRITABLE, PyBuffer_Release, PyObject_GetBuffer
 from libc.stdint cimport uint32_t
+from libc.string cimport memcpy
 
 import functools
 import io
@@ -158,6 +160,64 @@ cdef class BufferedReader:
         self._buffer_pos = read_size
         return result + self._buffer[:read_size]
 
+    def readinto(self, buffer):
+        cdef Py_buffer view
+        cdef unsigned char* target
+        cdef const unsigned char* source
+        cdef Py_ssize_t size
+        cdef Py_ssize_t available
+        cdef Py_ssize_t pos
+        cdef bytes chunk
+        cdef Py_ssize_t chunk_len
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE)
+        try:
+            target = <unsigned char*>view.buf
+            size = self._normalize_size(view.len)
+            available = self._buffer_len - self._buffer_pos
+            source = self._buffer
+
+            # NOTE: Copy directly from the buffer without slicing it first.
+            if size <= available:
+                memcpy(target, source + self._buffer_pos, size)
+                self._buffer_pos += size
+                return size
+
+            memcpy(target, source + self._buffer_pos, available)
+            self._buffer = b''
+            self._buffer_len = 0
+            self._buffer_pos = 0
+
+            # NOTE: Pass the rest through, copying each chunk just once.
+            pos = available
+            while pos < size:
+                chunk = self._read_func(size - pos)
+                chunk_len = len(chunk)
+                if chunk_len == 0:
+                    # NOTE: The EOF.
+                    self._max_bytes_remaining = 0
+                    break
+
+                self._max_bytes_remaining -= chunk_len
+                source = chunk
+
+                # NOTE: Never trust the read function to honor the size
+                #   requested; retain any excess data in the buffer rather
+                #   than writing past the end of the target.
+                if chunk_len > size - pos:
+                    memcpy(target + pos, source, size - pos)
+                    self._buffer = chunk
+                    self._buffer_len = chunk_len
+                    self._buffer_pos = size - pos
+                    return size
+
+                memcpy(target + pos, source, chunk_len)
+                pos += chunk_len
+
+            return pos
+        finally:
+            PyBuffer_Release(&view)
+
     def read_until(self, bytes delimiter not None, size=-1,
                    consume_delimiter=False):
         cdef Py_ssize_t read_size = self._normalize_size(size)
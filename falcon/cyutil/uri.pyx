@@ -42,100 +42,149 @@ cdef inline int cy_decode_hex(unsigned char nibble1, unsigned char nibble2):
 
 
 cdef unicode cy_decode(unsigned char* data, Py_ssize_t start, Py_ssize_t end,
-                       Py_ssize_t encoded_start, bint unquote_plus):
+                       Py_ssize_t encoded_start, bint unquote_plus,
+                       unsigned char* buffer=NULL):
     # PERF(vytas): encoded_start being -1 signifies that the caller
     #   (cy_parse_query_string) has already verified that no encoding
     #   characters exist in the provided substring data[start:end].
     if encoded_start < 0:
         return data[start:end].decode()
 
-    cdef unsigned char* result
+    # PERF: The caller may provide a scratch buffer (of at least end - start
+    #   bytes) to decode into, in order to avoid allocating one for every
+    #   single key and value.
+    if buffer:
+        return cy_decode_into(buffer, data, start, end, encoded_start,
+                              unquote_plus)
+
+    cdef unsigned char* result = <unsigned char*> PyMem_Malloc(end - start)
+    if not result:
+        raise MemoryError()
+
+    try:
+        return cy_decode_into(result, data, start, end, encoded_start,
+                              unquote_plus)
+    finally:
+        PyMem_Free(result)
+
+
+cdef unicode cy_decode_into(unsigned char* result, unsigned char* data,
+                            Py_ssize_t start, Py_ssize_t end,
+                            Py_ssize_t encoded_start, bint unquote_plus):
     cdef Py_ssize_t src_start = start
     cdef Py_ssize_t dst_start = 0
     cdef Py_ssize_t pos
     cdef int decoded
 
-    result = <unsigned char*> PyMem_Malloc(end - start)
-    if not result:
-        raise MemoryError()
+    for pos in range(encoded_start, end):
+        if data[pos] not in b'+%':
+            continue
 
-    try:
-        for pos in range(encoded_start, end):
-            if data[pos] not in b'+%':
-                continue
+        if src_start < pos:
+            memcpy(result + dst_start, data + src_start,
+                   pos - src_start)
 
-            if src_start < pos:
-                memcpy(result + dst_start, data + src_start,
-                       pos - src_start)
+        dst_start += pos - src_start
+        src_start = pos
 
-            dst_start += pos - src_start
-            src_start = pos
+        if data[pos] == b'+' and unquote_plus:
+            result[dst_start] = b' '
+            dst_start += 1
+            src_start += 1
+            continue
 
-            if data[pos] == b'+' and unquote_plus:
-                result[dst_start] = b' '
-                dst_start += 1
-                src_start += 1
+        # NOTE(vytas): Else %
+        if pos < end - 2:
+            decoded = cy_decode_hex(data[pos+1], data[pos+2])
+            if decoded < 0:
                 continue
 
-            # NOTE(vytas): Else %
-            if pos < end - 2:
-                decoded = cy_decode_hex(data[pos+1], data[pos+2])
-                if decoded < 0:
-                    continue
-
-                # NOTE(vytas): Succeeded decoding a byte
-                result[dst_start] = decoded
-                dst_start += 1
-                src_start += 3
-                # NOTE(vytas): It is somewhat ugly to wind the loop variable
-                #   like that, but hopefully it is a lesser sin in C.
-                pos += 2
-
-        if src_start < end:
-            memcpy(result + dst_start, data + src_start,
-                   end - src_start)
+            # NOTE(vytas): Succeeded decoding a byte
+            result[dst_start] = decoded
+            dst_start += 1
+            src_start += 3
+            # NOTE(vytas): It is somewhat ugly to wind the loop variable
+            #   like that, but hopefully it is a lesser sin in C.
+            pos += 2
 
-        return result[:dst_start + end - src_start].decode('utf-8', 'replace')
+    if src_start < end:
+        memcpy(result + dst_start, data + src_start,
+               end - src_start)
 
-    finally:
-        PyMem_Free(result)
+    return result[:dst_start + end - src_start].decode('utf-8', 'replace')
 
 
-cdef cy_handle_csv(dict result, bint keep_blank, unicode key, unicode value):
+cdef cy_handle_csv(dict result, bint keep_blank, unicode key,
+                   unsigned char* data, Py_ssize_t start, Py_ssize_t end,
+                   unsigned char* buffer):
     # NOTE(kgriffs): Falcon supports a more compact form of lists, in which the
     # elements are comma-separated and assigned to a single param instance. If
     # it turns out that very few people use this, it can be deprecated at some
     # point.
 
-    # NOTE(vytas): This case of csv=True is no longer the default request
-    # option so we largely reimplement the unoptimized Python version here.
-
     cdef old_value = result.get(key)
+    cdef list elements
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t element_start = start
 
     # NOTE(steffgrez): Falcon decodes value at the last moment. So query parser
     # won't mix up between percent-encoded comma (as value) and comma-separated
     # list (as reserved character for sub-delimiter).
     if old_value is None:
-        if ',' in value:
-            if not keep_blank:
-                # NOTE(kgriffs): Normalize the result in the case that some
-                # elements are empty strings, such that the result will be the
-                # same for 'foo=1,,3' as 'foo=1&foo=&foo=3'.
-                result[key] = [decode(element) for element in value.split(',')
-                               if element]
-            else:
-                result[key] = [decode(element) for element in value.split(',')]
-        else:
-            result[key] = decode(value)
+        # PERF: Split on the raw bytes, decoding each element straight from
+        #   the query string into the scratch buffer.
+        elements = None
+
+        for pos in range(start, end + 1):
+            if pos < end and data[pos] != b',':
+                continue
+
+            if elements is None:
+                if pos == end:
+                    result[key] = cy_decode(data, start, end, start, True,
+                                            buffer)
+                    return
+
+                elements = []
+
+            # NOTE(kgriffs): Normalize the result in the case that some
+            # elements are empty strings, such that the result will be the
+            # same for 'foo=1,,3' as 'foo=1&foo=&foo=3'.
+            if pos > element_start or keep_blank:
+                elements.append(cy_decode(data, element_start, pos,
+                                          element_start, True, buffer))
+
+            element_start = pos + 1
+
+        result[key] = elements
 
     elif isinstance(old_value, list):
-        old_value.append(decode(value))
+        old_value.append(cy_decode(data, start, end, start, True, buffer))
     else:
-        result[key] = [old_value, decode(value)]
+        result[key] = [old_value, cy_decode(data, start, end, start, True,
+                                            buffer)]
 
 
 cdef cy_parse_query_string(unsigned char* data, Py_ssize_t length,
                            bint keep_blank, bint csv):
+    cdef dict result = {}
+
+    # PERF: A single scratch buffer is sufficient to decode any key or value,
+    #   since none of them can be longer than the query string itself.
+    cdef unsigned char* buffer = <unsigned char*> PyMem_Malloc(length or 1)
+    if not buffer:
+        raise MemoryError()
+
+    try:
+        cy_parse_into(result, data, length, keep_blank, csv, buffer)
+    finally:
+        PyMem_Free(buffer)
+
+    return result
+
+
+cdef cy_parse_into(dict result, unsigned char* data, Py_ssize_t length,
+                   bint keep_blank, bint csv, unsigned char* buffer):
     cdef Py_ssize_t pos
     cdef unsigned char current
 
@@ -147,7 +196,6 @@ cdef cy_parse_query_string(unsigned char* data, Py_ssize_t length,
     cdef unicode key
     cdef unicode value
     cdef old_value
-    cdef dict result = {}
 
     for pos in range(length):
         # PERF(vytas): Quick check if we need to do anything special with the
@@ -163,19 +211,22 @@ cdef cy_parse_query_string(unsigned char* data, Py_ssize_t length,
             #   Keep them in sync until they are improved to share code.
             if pos > start:
                 if partition >= 0:
-                    key = cy_decode(data, start, partition, encoded_start_key, True)
+                    key = cy_decode(data, start, partition, encoded_start_key,
+                                    True, buffer)
                     if csv and encoded_start_val >= 0:
                         cy_handle_csv(result, keep_blank, key,
-                                      data[partition+1:pos].decode())
+                                      data, partition+1, pos, buffer)
                         start = pos + 1
                         encoded_start_key = -1
                         encoded_start_val = -1
                         partition = -1
                         continue
 
-                    value = cy_decode(data, partition+1, pos, encoded_start_val, True)
+                    value = cy_decode(data, partition+1, pos, encoded_start_val,
+                                      True, buffer)
                 else:
-                    key = cy_decode(data, start, pos, encoded_start_key, True)
+                    key = cy_decode(data, start, pos, encoded_start_key, True,
+                                    buffer)
                     value = EMPTY_STRING
 
                 if value is not EMPTY_STRING or keep_blank:
@@ -216,15 +267,18 @@ cdef cy_parse_query_string(unsigned char* data, Py_ssize_t length,
     #   Keep them in sync until they are improved to share code.
     if length > start:
         if partition >= 0:
-            key = cy_decode(data, start, partition, encoded_start_key, True)
+            key = cy_decode(data, start, partition, encoded_start_key, True,
+                            buffer)
             if csv and encoded_start_val >= 0:
                 cy_handle_csv(result, keep_blank, key,
-                              data[partition+1:length].decode())
-                return result
+                              data, partition+1, length, buffer)
+                return
 
-            value = cy_decode(data, partition+1, length, encoded_start_val, True)
+            value = cy_decode(data, partition+1, length, encoded_start_val,
+                              True, buffer)
         else:
-            key = cy_decode(data, start, length, encoded_start_key, True)
+            key = cy_decode(data, start, length, encoded_start_key, True,
+                            buffer)
             value = EMPTY_STRING
 
         if value is not EMPTY_STRING or keep_blank:
@@ -237,8 +291,6 @@ cdef cy_parse_query_string(unsigned char* data, Py_ssize_t length,
             else:
                 result[key] = [old_value, value]
 
-    return result
-
 
 def parse_query_string(unicode query_string not None, bint keep_blank=False,
                        bint csv=True):
@@ -208,7 +208,7 @@ def inspect_compiled_router(router: CompiledRouter) -> 'List[RouteInfo]':
         List[RouteInfo]: A list of :class:`~.RouteInfo`.
     """
 
-    def _traverse(roots, parent):
+    def _traverse(roots, parent, host=None):
         for root in roots:
             path = parent + '/' + root.raw_segment
             if root.resource is not None:
@@ -229,14 +229,16 @@ def inspect_compiled_router(router: CompiledRouter) -> 'List[RouteInfo]':
                         methods.append(method_info)
                 source_info, class_name = _get_source_info_and_name(root.resource)
 
-                route_info = RouteInfo(path, class_name, source_info, methods)
+                route_info = RouteInfo(path, class_name, source_info, methods, host)
                 routes.append(route_info)
 
             if root.children:
-                _traverse(root.children, path)
+                _traverse(root.children, path, host)
 
     routes = []  # type: List[RouteInfo]
     _traverse(router._roots, '')
+    for host, roots in router._host_roots.items():
+        _traverse(roots, '', host)
     return routes
 
 
@@ -305,6 +307,8 @@ class RouteInfo(_Traversable):
         class_name (str): The class name of the responder of this route.
         source_info (str): The source path where this responder was defined.
         methods (List[RouteMethodInfo]): List of methods defined in the route.
+        host (str or None): The host name this route is restricted to, if
+            any (see also: :meth:`.CompiledRouter.add_route`).
     """
 
     __visit_name__ = 'route'
@@ -315,11 +319,13 @@ class RouteInfo(_Traversable):
         class_name: str,
         source_info: str,
         methods: List[RouteMethodInfo],
+        host: Optional[str] = None,
     ):
         self.path = path
         self.class_name = class_name
         self.source_info = source_info
         self.methods = methods
+        self.host = host
 
 
 class StaticRouteInfo(_Traversable):
@@ -601,7 +607,10 @@ class StringVisitor(InspectVisitor):
 
     def visit_route(self, route: RouteInfo) -> str:
         """Visit a RouteInfo instance. Usually called by `process`"""
-        text = '{0}⇒ {1.path} - {1.class_name}'.format(self.tab, route)
+        text = '{0}⇒ {1.path}'.format(self.tab, route)
+        if route.host is not None:
+            text += ' (host={0.host!r})'.format(route)
+        text += ' - {0.class_name}'.format(route)
         if self.verbose:
             text += ' ({0.source_info})'.format(route)
 
@@ -51,6 +51,47 @@ class BaseHandler(metaclass=abc.ABCMeta):
         """
         return self.serialize(media, content_type)
 
+    def serialize_stream(self, media, content_type):
+        """Serialize an iterator of items on a :any:`falcon.Response` as a stream.
+
+        This method is used in lieu of :py:meth:`~.BaseHandler.serialize`
+        when the media object is an iterator (such as a generator), in
+        which case the result is assigned to :attr:`falcon.Response.stream`.
+        The default implementation simply collects the items into a list,
+        and serializes the latter in one go. Handlers that are able to
+        serialize a collection incrementally should override this method
+        in order to avoid materializing it in memory.
+
+        Args:
+            media (iterator): An iterator over serializable objects.
+            content_type (str): Type of response content.
+
+        Returns:
+            iterable: An iterable over chunks of the serialized collection
+            (as ``bytes``).
+        """
+        return [self.serialize(list(media), content_type)]
+
+    def serialize_stream_async(self, media, content_type):
+        """Serialize an iterator of items on a :any:`falcon.asgi.Response` as a stream.
+
+        This method is similar to :py:meth:`~.BaseHandler.serialize_stream`
+        except that it returns an asynchronous iterator, and that `media`
+        may also be an asynchronous iterator (such as an async generator).
+        The default implementation collects the items into a list, and
+        serializes the latter via :py:meth:`~.BaseHandler.serialize_async`.
+
+        Args:
+            media (iterator): An iterator or an async iterator over
+                serializable objects.
+            content_type (str): Type of response content.
+
+        Returns:
+            object: An async iterator over chunks of the serialized
+            collection (as ``bytes``).
+        """
+        return _SerializedAsyncStream(self, media, content_type)
+
     def deserialize(self, stream, content_type, content_length):
         """Deserialize the :any:`falcon.Request` body.
 
@@ -112,3 +153,32 @@ class BaseHandler(metaclass=abc.ABCMeta):
     consume the whole stream, but the deserialized media object is complete and
     does not involve further streaming.
     """
+
+
+class _SerializedAsyncStream:
+    """Async iterator over the result of serializing a collected iterator."""
+
+    def __init__(self, handler, items, content_type):
+        self._handler = handler
+        self._items = items
+        self._content_type = content_type
+        self._done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+
+        self._done = True
+
+        items = self._items
+        if hasattr(items, '__anext__'):
+            collected = []
+            async for item in items:
+                collected.append(item)
+        else:
+            collected = list(items)
+
+        return await self._handler.serialize_async(collected, self._content_type)
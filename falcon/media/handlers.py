@@ -8,9 +8,20 @@ from falcon.media.urlencoded import URLEncodedFormHandler
 from falcon.vendor import mimeparse
 
 
+# NOTE: Upper bound on the number of distinct (raw) media types for which the
+#   resolved handler is memoized by Handlers.find_by_media_type().
+_RESOLVED_CACHE_SIZE = 64
+
+
 class Handlers(UserDict):
     """A :class:`dict`-like object that manages Internet media type handlers."""
     def __init__(self, initial=None):
+        # NOTE: Memo of media types that are not registered verbatim, mapped
+        #   onto the resolved handler, or None if the media type is not
+        #   supported. It must be set before UserDict.__init__() calls
+        #   self.update(...).
+        self._resolved = {}
+
         handlers = initial or {
             'application/json': JSONHandler(),
             'application/json; charset=UTF-8': JSONHandler(),
@@ -22,6 +33,17 @@ class Handlers(UserDict):
         # Also, this results in self.update(...) being called.
         UserDict.__init__(self, handlers)
 
+    def __setitem__(self, key, value):
+        UserDict.__setitem__(self, key, value)
+
+        # NOTE: Rebind rather than clear(), since a copy() of this instance
+        #   initially shares the same memo.
+        self._resolved = {}
+
+    def __delitem__(self, key):
+        UserDict.__delitem__(self, key)
+        self._resolved = {}
+
     def _resolve_media_type(self, media_type, all_media_types):
         resolved = None
 
@@ -47,15 +69,28 @@ class Handlers(UserDict):
         except KeyError:
             pass
 
-        # PERF(jmvrbanac): Fallback to the slower method
-        resolved = self._resolve_media_type(media_type, self.data.keys())
+        # PERF: Check whether this media type has already been resolved
+        #   before falling back to full-blown parsing.
+        resolved_handlers = self._resolved
+        try:
+            handler = resolved_handlers[media_type]
+        except KeyError:
+            # PERF(jmvrbanac): Fallback to the slower method
+            resolved = self._resolve_media_type(media_type, self.data.keys())
+            handler = self.data[resolved] if resolved else None
+
+            # NOTE: Simply start over once the memo is full; the client
+            #   controls the media type, and the memo must stay bounded.
+            if len(resolved_handlers) >= _RESOLVED_CACHE_SIZE:
+                resolved_handlers.clear()
+            resolved_handlers[media_type] = handler
 
-        if not resolved:
+        if handler is None:
             raise errors.HTTPUnsupportedMediaType(
                 description='{0} is an unsupported media type.'.format(media_type)
             )
 
-        return self.data[resolved]
+        return handler
 
 
 # NOTE(vytas): An ugly way to work around circular imports.
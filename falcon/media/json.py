@@ -1,4 +1,5 @@
 from functools import partial
+from itertools import islice
 
 from falcon import errors
 from falcon.media import BaseHandler
@@ -60,6 +61,16 @@ class JSONHandler(BaseHandler):
             ),
         )
 
+    When :attr:`~falcon.Response.media` is set to an iterator (such as a
+    generator), the items are serialized as a JSON array in batches, and
+    streamed to the client as they are being produced, rather than being
+    accumulated in memory first::
+
+        def on_get(self, req, resp):
+            resp.media = (row._asdict() for row in self._db.query_rows())
+
+    In the case of an ASGI app, async iterators are supported as well.
+
     Keyword Arguments:
         dumps (func): Function to use when serializing JSON responses.
         loads (func): Function to use when deserializing JSON requests.
@@ -110,3 +121,96 @@ class JSONHandler(BaseHandler):
             return result.encode('utf-8')
 
         return result
+
+    def serialize_stream(self, media, content_type):
+        dumps = self.dumps
+        prefix = b'['
+        batch = []
+
+        for item in media:
+            batch.append(item)
+
+            if len(batch) == _STREAM_BATCH_SIZE:
+                yield prefix + _dumps_batch(dumps, batch)
+                prefix = b','
+                batch = []
+
+        if batch:
+            yield prefix + _dumps_batch(dumps, batch) + b']'
+        else:
+            yield b'[]' if prefix == b'[' else b']'
+
+    def serialize_stream_async(self, media, content_type):
+        return _AsyncJSONArrayStream(self.dumps, media)
+
+
+class _AsyncJSONArrayStream:
+    """Async iterator that serializes the items of an (async) iterator as a JSON array."""
+
+    def __init__(self, dumps, items):
+        self._dumps = dumps
+        self._items = items
+        self._prefix = b'['
+        self._done = False
+
+        if hasattr(items, '__anext__'):
+            self._items = items.__aiter__()
+            self._next_batch = self._next_batch_async
+        else:
+            self._next_batch = self._next_batch_sync
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+
+        batch = await self._next_batch()
+        prefix = self._prefix
+
+        if len(batch) == _STREAM_BATCH_SIZE:
+            self._prefix = b','
+            return prefix + _dumps_batch(self._dumps, batch)
+
+        self._done = True
+
+        if batch:
+            return prefix + _dumps_batch(self._dumps, batch) + b']'
+
+        return b'[]' if prefix == b'[' else b']'
+
+    async def close(self):
+        items = self._items
+        if hasattr(items, 'aclose'):
+            await items.aclose()
+        elif hasattr(items, 'close'):
+            items.close()
+
+    async def _next_batch_async(self):
+        batch = []
+
+        async for item in self._items:
+            batch.append(item)
+            if len(batch) == _STREAM_BATCH_SIZE:
+                break
+
+        return batch
+
+    async def _next_batch_sync(self):
+        return list(islice(self._items, _STREAM_BATCH_SIZE))
+
+
+def _dumps_batch(dumps, batch):
+    # PERF: Serializing the whole batch in a single call is much faster than
+    #   serializing each item separately; the enclosing brackets of the
+    #   resulting array are simply sliced off.
+    result = dumps(batch)[1:-1]
+
+    try:
+        return result.encode('utf-8')
+    except AttributeError:  # pragma: nocover
+        return result
+
+
+_STREAM_BATCH_SIZE = 1000
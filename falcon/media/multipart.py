@@ -40,6 +40,11 @@ _FILENAME_STAR_RFC5987 = re.compile(r"([\w-]+)'[\w]*'(.+)")
 _CRLF = b'\r\n'
 _CRLF_CRLF = _CRLF + _CRLF
 
+# NOTE: Upper bound for a BufferedReader over a stream of unknown length. It
+#   must leave enough headroom for the buffer length to be added to it
+#   without overflowing a Py_ssize_t in the Cython implementation.
+_UNKNOWN_STREAM_LEN = 2 ** 62
+
 
 class MultipartParseError(errors.HTTPBadRequest):
     """Represents a multipart form parsing error.
@@ -252,7 +257,12 @@ class MultipartForm:
         #   streams easier within the same test/benchmark suite.
         if not hasattr(stream, 'read_until'):
             if isinstance(stream, request_helpers.BoundedStream):
-                stream = BufferedReader(stream.stream.read, content_length)
+                if stream.stream_len is None:
+                    # NOTE: The length of the body is unknown, so let the
+                    #   bounded stream detect EOF, and enforce its limit.
+                    stream = BufferedReader(stream.read, _UNKNOWN_STREAM_LEN)
+                else:
+                    stream = BufferedReader(stream.stream.read, content_length)
             else:
                 stream = BufferedReader(stream.read, content_length)
 
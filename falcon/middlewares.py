@@ -1,3 +1,15 @@
+from functools import partial
+import json
+import struct
+import time
+import zlib
+
+from falcon.caching import MemoryCache
+from falcon.constants import _UNSET
+from falcon.status_codes import HTTP_304
+from falcon.util.misc import _lru_cache_safe, http_date_to_dt, http_status_to_code
+from falcon.util.structures import ETag
+
 
 class CORSMiddleware(object):
     def process_response(self, req, resp, resource, req_succeeded):
@@ -30,3 +42,675 @@ class CORSMiddleware(object):
 
     async def process_response_async(self, *args):
         self.process_response(*args)
+
+
+class ConditionalGetMiddleware:
+    """Validate cached representations of GET and HEAD responses.
+
+    This middleware ties the response's validators together with the
+    client's preconditions: if a successful (``200 OK``) response to a GET
+    or HEAD request satisfies the request's If-None-Match or (in the absence
+    of the former) If-Modified-Since header, the status is replaced with
+    ``304 Not Modified`` and the body is dropped before it is ever written
+    to the server.
+
+    Validators explicitly set by the responder (via :attr:`~.Response.etag`
+    or :attr:`~.Response.last_modified`) are always honored. Otherwise, an
+    entity-tag is derived from the rendered response body. Since the body
+    is rendered (and cached by the response object) at this point, media
+    is not serialized twice for responses that do end up being sent.
+
+    Note:
+        Responses whose body is set via :attr:`~.Response.stream` are left
+        alone, as are error responses and responses to other methods.
+
+    Note:
+        For a HEAD request without an explicit ETag, the body must still be
+        rendered in order to compute the entity-tag, so that it matches the
+        one returned for GET.
+
+    Note:
+        *process_response* methods are executed in the reverse order of
+        registration, so this component should normally be listed first in
+        order to see the final response body. The exception is
+        :class:`~.CompressionMiddleware`, which should precede this
+        component so as not to compress responses that end up being
+        short-circuited.
+
+    Keyword Arguments:
+        hash_function (callable): A function that takes the rendered body
+            as a ``bytes`` object and returns an opaque-tag as a ``str``.
+            The default function combines the length of the body with its
+            CRC-32 checksum, which is very fast to compute, but (being a
+            non-cryptographic checksum) not entirely collision-free; for
+            stronger guarantees, a digest such as BLAKE2 may be used
+            instead.
+        weak (bool): Set to ``False`` to generate strong entity-tags (default
+            ``True``). Note that this only applies to the entity-tags
+            derived from the response body.
+    """
+
+    def __init__(self, hash_function=None, weak=True):
+        self._hash_function = hash_function or _hash_body
+        self._weak = weak
+
+    def process_response(self, req, resp, resource, req_succeeded):
+        """Derive an entity-tag and check the preconditions of the request."""
+
+        if not self._is_candidate(req, resp, req_succeeded):
+            return
+
+        data = _UNSET
+        if resp.get_header('ETag') is None:
+            data = resp.render_body()
+
+        self._validate(req, resp, data)
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Derive an entity-tag and check the preconditions of the request."""
+
+        if not self._is_candidate(req, resp, req_succeeded):
+            return
+
+        data = _UNSET
+        if resp.get_header('ETag') is None:
+            data = await resp.render_body()
+
+        self._validate(req, resp, data)
+
+    def _is_candidate(self, req, resp, req_succeeded):
+        return (
+            req_succeeded and
+            req.method in ('GET', 'HEAD') and
+            resp.stream is None and
+            http_status_to_code(resp.status) == 200
+        )
+
+    def _validate(self, req, resp, data):
+        if data is not _UNSET:
+            if data is None:
+                return
+
+            etag = ETag(self._hash_function(data))
+            etag.is_weak = self._weak
+            resp.set_header('ETag', etag.dumps())
+        else:
+            etag = ETag.loads(resp.get_header('ETag'))
+
+        if_none_match = req.if_none_match
+        if if_none_match is not None:
+            # NOTE: RFC 7232, Section 3.2 mandates the weak comparison
+            #   function for If-None-Match.
+            for candidate in if_none_match:
+                if candidate == '*' or candidate == etag:
+                    break
+            else:
+                return
+
+        else:
+            # NOTE: RFC 7232, Section 3.3: If-Modified-Since is only
+            #   evaluated when If-None-Match is not present.
+            if_modified_since = req.if_modified_since
+            last_modified = resp.get_header('Last-Modified')
+            if if_modified_since is None or last_modified is None:
+                return
+
+            try:
+                if http_date_to_dt(last_modified) > if_modified_since:
+                    return
+            except ValueError:
+                return
+
+        resp.status = HTTP_304
+        resp.body = None
+        resp.data = None
+        resp.media = None
+
+        # NOTE: Rendering the media may have set the Content-Type, but a 304
+        #   response does not have any content.
+        resp.delete_header('Content-Type')
+
+
+class CompressionMiddleware:
+    """Compress response bodies according to the request's Accept-Encoding.
+
+    The gzip and deflate content-codings are supported. Bodies set via
+    :attr:`~.Response.body`, :attr:`~.Response.data` or
+    :attr:`~.Response.media` are compressed in one shot, whereas
+    :attr:`~.Response.stream` is wrapped so that it is compressed
+    incrementally as it is being read (or iterated over) by the framework.
+
+    Only responses of a compressible media type (such as ``text/*``,
+    JSON, or XML) are considered; already-compressed formats such as images,
+    archives or ``application/octet-stream`` are left alone. The Vary header
+    is updated for every response that is eligible for compression,
+    regardless of whether the client accepts any of the supported codings,
+    so that shared caches will not serve the wrong representation.
+
+    The compression level may be overridden on a per-route basis by
+    setting a ``compression_level`` attribute on the resource; a value of
+    ``0`` disables compression for the resource's responses altogether::
+
+        class ThumbnailResource:
+            compression_level = 0
+
+    Note:
+        Responses to HEAD requests are not compressed (nor rendered by this
+        component), since their body is discarded anyway, although they
+        still receive the Vary header.
+
+    Note:
+        When used together with :class:`~.ConditionalGetMiddleware`, list
+        this component first, so that responses are only compressed when
+        they have not been short-circuited to ``304 Not Modified``.
+
+    Keyword Arguments:
+        level (int): The default zlib compression level, from ``1``
+            (fastest) to ``9`` (best compression), or ``-1`` to use the zlib
+            default (currently equivalent to ``6``) (default ``-1``).
+        min_size (int): The minimum size, in bytes, of a response body to
+            be compressed. Smaller bodies are sent as-is, since compressing
+            them is hardly worth the effort (default ``512``). Streams are
+            always compressed unless their Content-Length is known to be
+            smaller than this value.
+        content_types (iterable): Additional media types (without
+            parameters) to consider compressible.
+    """
+
+    def __init__(self, level=-1, min_size=512, content_types=None):
+        self._level = level
+        self._min_size = min_size
+        self._content_types = _COMPRESSIBLE_TYPES.union(content_types or ())
+
+    def process_response(self, req, resp, resource, req_succeeded):
+        """Compress the response body, if applicable."""
+
+        level = self._get_level(resp, resource)
+        if level is None:
+            return
+
+        if req.method == 'HEAD':
+            self._add_vary(resp)
+            return
+
+        stream = resp.stream
+        data = None
+        if stream is None:
+            data = resp.render_body()
+
+            # NOTE: Rendering media that is an iterator results in a stream.
+            if data is None:
+                stream = resp.stream
+                if stream is None:
+                    return
+            elif len(data) < self._min_size:
+                return
+
+        compressor = self._negotiate(req, resp, level)
+        if compressor is None:
+            return
+
+        if stream is None:
+            resp.data = compressor.compress(data) + compressor.flush()
+            resp.body = None
+        else:
+            resp.stream = _CompressedStream(stream, compressor)
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Compress the response body, if applicable."""
+
+        # NOTE: Server-sent events must not be buffered by the compressor.
+        level = self._get_level(resp, resource)
+        if level is None or resp.sse is not None:
+            return
+
+        if req.method == 'HEAD':
+            self._add_vary(resp)
+            return
+
+        stream = resp.stream
+        data = None
+        if stream is None:
+            data = await resp.render_body()
+
+            # NOTE: Rendering media that is an iterator results in a stream.
+            if data is None:
+                stream = resp.stream
+                if stream is None:
+                    return
+            elif len(data) < self._min_size:
+                return
+
+        compressor = self._negotiate(req, resp, level)
+        if compressor is None:
+            return
+
+        if stream is None:
+            resp.data = compressor.compress(data) + compressor.flush()
+            resp.body = None
+        else:
+            resp.stream = _AsyncCompressedStream(stream, compressor)
+
+    def _get_level(self, resp, resource):
+        level = getattr(resource, 'compression_level', self._level)
+        if not level:
+            return None
+
+        status = http_status_to_code(resp.status)
+        if status < 200 or status in (204, 206, 304):
+            return None
+
+        if resp.get_header('Content-Encoding') is not None:
+            return None
+
+        # NOTE: If the Content-Type is not set, it will default to
+        #   default_media_type both when rendering the media and when
+        #   preparing the response headers.
+        content_type = resp.content_type or resp.options.default_media_type
+        media_type = content_type.partition(';')[0].strip().lower()
+        if not (
+            media_type.startswith('text/') or
+            media_type in self._content_types or
+            media_type.endswith(('+json', '+xml'))
+        ):
+            return None
+
+        if resp.stream is not None:
+            content_length = resp.get_header('Content-Length')
+            if content_length is not None:
+                # NOTE: A malformed value is treated the same as a missing
+                #   one; it is removed anyway if the stream is compressed.
+                try:
+                    if int(content_length) < self._min_size:
+                        return None
+                except ValueError:
+                    pass
+
+        return level
+
+    def _add_vary(self, resp):
+        vary = resp.get_header('Vary')
+        if vary is None:
+            resp.set_header('Vary', 'Accept-Encoding')
+        elif 'accept-encoding' not in vary.lower() and vary.strip() != '*':
+            resp.set_header('Vary', vary + ', Accept-Encoding')
+
+    def _negotiate(self, req, resp, level):
+        self._add_vary(resp)
+
+        encoding = _choose_encoding(req.get_header('Accept-Encoding'))
+        if encoding is None:
+            return None
+
+        resp.set_header('Content-Encoding', encoding)
+
+        # NOTE: The compressed length is not known in advance; for bodies
+        #   that are compressed in one shot, the framework will set it.
+        resp.delete_header('Content-Length')
+
+        # NOTE: The compressed representation is no longer byte-for-byte
+        #   identical to the one described by a strong entity-tag.
+        etag = resp.get_header('ETag')
+        if etag is not None and not etag.startswith('W/'):
+            resp.set_header('ETag', 'W/' + etag)
+
+        return zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+
+
+class ResponseCacheMiddleware:
+    """Cache successful GET responses in-process, and serve them before routing.
+
+    Responses are cached only when their Cache-Control header allows a
+    shared cache to store them, i.e., it must not contain any of the
+    ``no-store``, ``no-cache`` or ``private`` directives, and it must
+    specify a freshness lifetime via ``s-maxage`` or ``max-age`` (unless
+    `default_ttl` is set). Responses that set cookies, responses whose body
+    is a stream, and responses to requests carrying an Authorization header
+    (unless explicitly marked as ``public``, or with ``s-maxage``) are never
+    cached.
+
+    A cache entry consists of the response status, the response headers (as
+    prepared for the server) and the rendered body. The Vary header of the
+    cached response is honored when looking up entries, so that, e.g.,
+    compressed and uncompressed representations are cached separately.
+
+    Cache hits are served from :meth:`process_request` by short-circuiting
+    the request (see also: :ref:`Short-Circuiting <middleware>`), so that
+    routing, the responder, and any subsequent *process_request* and
+    *process_resource* methods are skipped. The Age header is set to the
+    number of seconds since the response was cached. A request may bypass
+    the cache lookup (but not the storage of the fresh response) by
+    specifying ``Cache-Control: no-cache`` or ``Pragma: no-cache``.
+
+    Note:
+        This component should be listed first, so that cache hits skip as
+        much processing as possible, and so that the final response is
+        cached (including, e.g., any compression applied to it by
+        :class:`~.CompressionMiddleware`).
+
+    Keyword Arguments:
+        cache (falcon.caching.BaseCache): The backend used to store cache
+            entries. Defaults to a new instance of
+            :class:`~falcon.caching.MemoryCache`; pass an instance of
+            :class:`~falcon.caching.SharedMemoryCache` in order to share the
+            cache between pre-forked worker processes.
+        default_ttl (float): Time, in seconds, to cache responses that do
+            not specify their freshness lifetime via Cache-Control
+            (default ``None``, meaning such responses are not cached).
+    """
+
+    _ENTRY_HEADER = struct.Struct('=dI')
+
+    def __init__(self, cache=None, default_ttl=None):
+        self._cache = MemoryCache() if cache is None else cache
+        self._default_ttl = default_ttl
+
+    def process_request(self, req, resp):
+        """Serve the response from the cache, if present."""
+
+        if req.method not in ('GET', 'HEAD'):
+            return
+
+        directives = _parse_cache_control(req.get_header('Cache-Control'))
+        if 'no-cache' in directives or directives.get('max-age') == '0':
+            return
+        if req.get_header('Pragma') == 'no-cache':
+            return
+
+        cache = self._cache
+        uri = req.uri
+
+        vary = cache.get(_VARY_KEY_PREFIX + uri)
+        if vary is None:
+            return
+
+        entry = cache.get(self._variant_key(req, uri, vary.decode()))
+        if entry is None:
+            return
+
+        created, meta_len = self._ENTRY_HEADER.unpack_from(entry)
+        offset = self._ENTRY_HEADER.size
+        status, headers = json.loads(entry[offset:offset + meta_len].decode())
+
+        resp.status = status
+
+        # NOTE: Replace any value set earlier for a given header, but
+        #   combine repeated occurrences of it within the cached entry.
+        replayed = set()
+        for name, value in headers:
+            if name in replayed:
+                resp.append_header(name, value)
+            else:
+                resp.set_header(name, value)
+                replayed.add(name)
+
+        resp.set_header('Age', str(max(0, int(time.time() - created))))
+
+        resp.data = entry[offset + meta_len:]
+        resp.complete = True
+
+    async def process_request_async(self, req, resp):
+        """Serve the response from the cache, if present."""
+
+        self.process_request(req, resp)
+
+    def process_response(self, req, resp, resource, req_succeeded):
+        """Store the response in the cache, if cacheable."""
+
+        ttl = self._get_ttl(req, resp, req_succeeded)
+        if ttl is not None:
+            self._store(req, resp, resp.render_body(), ttl)
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Store the response in the cache, if cacheable."""
+
+        ttl = self._get_ttl(req, resp, req_succeeded)
+        if ttl is not None:
+            self._store(req, resp, await resp.render_body(), ttl)
+
+    def _get_ttl(self, req, resp, req_succeeded):
+        # NOTE: resp.complete is also set for cache hits, which obviously
+        #   need not be stored again.
+        if (not req_succeeded or resp.complete or req.method != 'GET' or
+                resp.stream is not None or getattr(resp, 'sse', None) is not None):
+            return None
+
+        if http_status_to_code(resp.status) not in _CACHEABLE_STATUS_CODES:
+            return None
+
+        if 'no-store' in _parse_cache_control(req.get_header('Cache-Control')):
+            return None
+
+        directives = _parse_cache_control(resp.get_header('Cache-Control'))
+        if 'no-store' in directives or 'no-cache' in directives or 'private' in directives:
+            return None
+
+        if (req.get_header('Authorization') is not None and
+                'public' not in directives and 's-maxage' not in directives):
+            return None
+
+        ttl = directives.get('s-maxage', directives.get('max-age'))
+        if ttl is None:
+            return self._default_ttl
+
+        try:
+            ttl = int(ttl)
+        except ValueError:
+            return None
+
+        return ttl if ttl > 0 else None
+
+    def _store(self, req, resp, data, ttl):
+        # NOTE: Rendering media that is an iterator results in a stream.
+        if data is None and resp.stream is not None:
+            return
+
+        vary = resp.get_header('Vary') or ''
+        vary = ','.join(sorted(
+            name.strip().lower() for name in vary.split(',') if name.strip()
+        ))
+        if vary == '*':
+            return
+
+        headers = []
+        for name, value in resp._wsgi_headers(resp.options.default_media_type):
+            if name == 'set-cookie':
+                return
+            if name not in ('age', 'content-length'):
+                headers.append((name, value))
+
+        status = resp.status
+        if not isinstance(status, str):
+            status = http_status_to_code(status)
+
+        meta = json.dumps([status, headers]).encode()
+        entry = self._ENTRY_HEADER.pack(time.time(), len(meta)) + meta + (data or b'')
+
+        cache = self._cache
+        uri = req.uri
+        cache.set(_VARY_KEY_PREFIX + uri, vary.encode(), ttl)
+        cache.set(self._variant_key(req, uri, vary), entry, ttl)
+
+    def _variant_key(self, req, uri, vary):
+        if not vary:
+            return _VARIANT_KEY_PREFIX + uri
+
+        values = [req.get_header(name) or '' for name in vary.split(',')]
+        return _VARIANT_KEY_PREFIX + uri + '\x00' + '\x00'.join(values)
+
+
+class _CompressedStream:
+    """Iterator that compresses a WSGI response stream incrementally."""
+
+    def __init__(self, stream, compressor):
+        self._stream = stream
+        self._compressor = compressor
+        self._flushed = False
+
+        read = getattr(stream, 'read', None)
+        if read is not None:
+            self._chunks = iter(partial(read, _STREAM_BLOCK_SIZE), b'')
+        else:
+            self._chunks = iter(stream)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        compressor = self._compressor
+
+        for chunk in self._chunks:
+            data = compressor.compress(chunk)
+
+            # NOTE: The compressor buffers its input until it has enough
+            #   data to emit a block; don't yield empty chunks meanwhile.
+            if data:
+                return data
+
+        if self._flushed:
+            raise StopIteration
+
+        self._flushed = True
+        return compressor.flush()
+
+    def close(self):
+        close = getattr(self._stream, 'close', None)
+        if close is not None:
+            close()
+
+
+class _AsyncCompressedStream:
+    """Async iterator that compresses an ASGI response stream incrementally."""
+
+    def __init__(self, stream, compressor):
+        self._stream = stream
+        self._compressor = compressor
+        self._flushed = False
+
+        if hasattr(stream, 'read'):
+            self._chunks = None
+        else:
+            self._chunks = stream.__aiter__()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        compressor = self._compressor
+
+        # NOTE: The end of the stream is detected in the same way as in the
+        #   ASGI app's response loop.
+        while True:
+            if self._chunks is None:
+                chunk = await self._stream.read(_STREAM_BLOCK_SIZE)
+                if chunk == b'':
+                    break
+            else:
+                try:
+                    chunk = await self._chunks.__anext__()
+                except StopAsyncIteration:
+                    break
+
+                if chunk is None:
+                    break
+
+            if chunk:
+                data = compressor.compress(chunk)
+                if data:
+                    return data
+
+        if self._flushed:
+            raise StopAsyncIteration
+
+        self._flushed = True
+        return compressor.flush()
+
+    async def close(self):
+        close = getattr(self._stream, 'close', None)
+        if close is not None:
+            await close()
+
+
+@_lru_cache_safe(maxsize=64)
+def _choose_encoding(accept_encoding):
+    # PERF: Clients tend to send one of very few distinct Accept-Encoding
+    #   values, so the result of the negotiation is cached.
+    if not accept_encoding:
+        return None
+
+    qvalues = {}
+    for coding in accept_encoding.split(','):
+        coding, _, params = coding.partition(';')
+        coding = coding.strip().lower()
+
+        qvalue = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+
+        qvalues[coding] = qvalue
+
+    default = qvalues.get('*', 0.0)
+
+    chosen = None
+    best = 0.0
+    for coding in _ENCODINGS:
+        qvalue = qvalues.get(coding, default)
+        if qvalue > best:
+            chosen = coding
+            best = qvalue
+
+    return chosen
+
+
+@_lru_cache_safe(maxsize=64)
+def _parse_cache_control(cache_control):
+    directives = {}
+    if cache_control:
+        for directive in cache_control.split(','):
+            name, _, value = directive.partition('=')
+            directives[name.strip().lower()] = value.strip().strip('"')
+
+    return directives
+
+
+def _hash_body(data):
+    # PERF: CRC-32 runs several times faster than even the fastest hashlib
+    #   digests; prefixing the length makes accidental collisions between
+    #   different versions of the same resource even less likely.
+    return '{:x}-{:08x}'.format(len(data), zlib.crc32(data))
+
+
+# NOTE: gzip is listed first so that it is preferred over deflate in the case
+#   of equal qvalues, since some clients historically mishandled the
+#   (zlib-wrapped) deflate coding.
+_ENCODINGS = ('gzip', 'deflate')
+
+_WBITS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
+_COMPRESSIBLE_TYPES = frozenset([
+    'application/javascript',
+    'application/json',
+    'application/x-javascript',
+    'application/x-ndjson',
+    'application/x-www-form-urlencoded',
+    'application/xml',
+    'image/svg+xml',
+    'image/x-icon',
+])
+
+_STREAM_BLOCK_SIZE = 64 * 1024
+
+# NOTE: Status codes that are defined as cacheable by default; see also
+#   RFC 7231, Section 6.1.
+_CACHEABLE_STATUS_CODES = frozenset([200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501])
+
+_VARY_KEY_PREFIX = 'vary\x00'
+_VARIANT_KEY_PREFIX = 'resp\x00'
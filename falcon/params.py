@@ -0,0 +1,337 @@
+# Copyright 2026 by Falcon Contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declarative query parameter schemas."""
+
+from collections import namedtuple
+from inspect import getmembers, iscoroutinefunction
+from uuid import UUID
+
+from falcon import errors
+from falcon.hooks import _DECORABLE_METHOD_NAME, before
+from falcon.request import FALSE_STRINGS, TRUE_STRINGS
+
+
+_SUPPORTED_TYPES = (str, int, float, bool, UUID, list)
+
+# NOTE: Sentinel used to distinguish a missing param from any default value.
+_MISSING = object()
+
+
+class Param:
+    """Specification of a single query string parameter.
+
+    The conversion and validation rules mirror those of the corresponding
+    ``Request.get_param*()`` methods; for instance, ``Param(int)`` behaves
+    like :meth:`~falcon.Request.get_param_as_int`.
+
+    Args:
+        type: The type to convert the value of the parameter to. Must be one
+            of ``str``, ``int``, ``float``, ``bool``, ``uuid.UUID`` or
+            ``list`` (default ``str``). In the case of a parameter that is
+            specified more than once in the query string, the last value is
+            used, unless the type is ``list``.
+
+    Keyword Args:
+        required (bool): Set to ``True`` to reject requests that do not
+            include the parameter (default ``False``).
+        default (any): Value to use when the parameter is not found
+            (default ``None``).
+        name (str): Name of the parameter in the query string, in the case
+            that it differs from the name of the schema field (e.g., because
+            it is not a valid Python identifier).
+        min_value: Minimum value allowed (only for ``int`` and ``float``).
+        max_value: Maximum value allowed (only for ``int`` and ``float``).
+        transform (callable): Function to apply to each element (only for
+            ``list``). A ``ValueError`` raised by the function is reported as
+            an invalid parameter.
+        blank_as_true (bool): Whether to treat a blank value as ``True``
+            (only for ``bool``, default ``True``).
+    """
+
+    __slots__ = (
+        'blank_as_true',
+        'default',
+        'max_value',
+        'min_value',
+        'name',
+        'required',
+        'transform',
+        'type',
+    )
+
+    def __init__(self, type=str, required=False, default=None, name=None,
+                 min_value=None, max_value=None, transform=None,
+                 blank_as_true=True):
+        if type not in _SUPPORTED_TYPES:
+            raise TypeError('Unsupported query parameter type: {!r}'.format(type))
+
+        if (min_value is not None or max_value is not None) and type not in (int, float):
+            raise ValueError('min_value and max_value are only supported for int and float')
+
+        if transform is not None and type is not list:
+            raise ValueError('transform is only supported for list')
+
+        self.type = type
+        self.required = required
+        self.default = default
+        self.name = name
+        self.min_value = min_value
+        self.max_value = max_value
+        self.transform = transform
+        self.blank_as_true = blank_as_true
+
+
+def compile_query_params(schema, type_name='QueryParams'):
+    """Compile a query parameter schema into a single extraction function.
+
+    The returned function converts and validates all the parameters in one
+    pass over the (already parsed) query parameters, and returns them as an
+    instance of a ``namedtuple`` type whose fields correspond to the keys
+    of `schema`. Any problems are collected, and then reported together as a
+    single ``HTTPBadRequest``.
+
+    Args:
+        schema (dict): A mapping of field names to :class:`~.Param`
+            specifications. Field names must be valid Python identifiers.
+
+    Keyword Args:
+        type_name (str): The name of the ``namedtuple`` type
+            (default ``'QueryParams'``).
+
+    Returns:
+        callable: A function of the form ``func(params)``, where `params` is
+        a dict of query parameters, such as :attr:`falcon.Request.params`.
+    """
+
+    field_names = list(schema)
+    result_type = namedtuple(type_name, field_names)
+
+    namespace = {
+        '_MISSING': _MISSING,
+        '_TRUE_STRINGS': TRUE_STRINGS,
+        '_FALSE_STRINGS': FALSE_STRINGS,
+        '_UUID': UUID,
+        '_result_type': result_type,
+        '_raise_for_problems': _raise_for_problems,
+    }
+
+    src_lines = [
+        'def extract(params):',
+        '    problems = []',
+    ]
+
+    for index, field_name in enumerate(field_names):
+        param = schema[field_name]
+        if not isinstance(param, Param):
+            raise TypeError('Schema fields must be specified using falcon.Param')
+
+        name = param.name or field_name
+        value = 'value_{}'.format(index)
+        namespace['_default_{}'.format(index)] = param.default
+
+        src_lines.append('    {} = params.get({!r}, _MISSING)'.format(value, name))
+        src_lines.append('    if {} is _MISSING:'.format(value))
+        if param.required:
+            src_lines.append('        problems.append(({!r}, None))'.format(name))
+        if isinstance(param.default, (list, dict, set)):
+            # NOTE: Copy mutable defaults so that modifications made while
+            #   handling one request do not leak into subsequent ones.
+            src_lines.append('        {0} = _default_{1}.copy()'.format(value, index))
+        else:
+            src_lines.append('        {0} = _default_{1}'.format(value, index))
+        src_lines.append('    else:')
+
+        src_lines.extend(
+            '        ' + line
+            for line in _conversion_lines(param, name, value, index, namespace)
+        )
+
+    src_lines.extend([
+        '    if problems:',
+        '        _raise_for_problems(problems)',
+        '    return _result_type({})'.format(
+            ', '.join('value_{}'.format(index) for index in range(len(field_names)))
+        ),
+    ])
+
+    src = '\n'.join(src_lines)
+    exec(compile(src, '<query_params>', 'exec'), namespace)
+
+    return namespace['extract']
+
+
+def query_params(schema, param_name='query', is_async=False):
+    """Decorator to extract query parameters according to a schema.
+
+    The schema is compiled once, when the decorator is applied (see also:
+    :func:`~.compile_query_params`). The resulting parameters object is
+    passed to the responder as a keyword argument. Like other hooks, this
+    decorator may be applied either to an individual responder, or to an
+    entire resource. For example::
+
+        class ThingsResource:
+            @falcon.query_params({
+                'limit': falcon.Param(int, default=10, min_value=1),
+                'marker': falcon.Param(str),
+                'tags': falcon.Param(list, default=[]),
+            })
+            def on_get(self, req, resp, query):
+                resp.media = find_things(query.marker, query.limit, query.tags)
+
+    Args:
+        schema (dict): A mapping of field names to :class:`~.Param`
+            specifications.
+
+    Keyword Args:
+        param_name (str): Name of the keyword argument used to pass the
+            parameters object to the responder (default ``'query'``).
+        is_async (bool): Set to ``True`` for ASGI apps to provide a hint that
+            the decorated responder is a coroutine function (see also:
+            :func:`falcon.before`).
+    """
+
+    extract = compile_query_params(schema)
+
+    def _wrap(responder):
+        # NOTE: falcon.before() awaits the action in the case of a coroutine
+        #   responder, so the action must be a coroutine function as well.
+        if is_async or iscoroutinefunction(responder):
+            action = _set_query_params_async
+        else:
+            action = _set_query_params
+
+        return before(action, extract, param_name, is_async=is_async)(responder)
+
+    def _query_params(responder_or_resource):
+        if not isinstance(responder_or_resource, type):
+            return _wrap(responder_or_resource)
+
+        resource = responder_or_resource
+        for responder_name, responder in getmembers(resource, callable):
+            if _DECORABLE_METHOD_NAME.match(responder_name):
+                setattr(resource, responder_name, _wrap(responder))
+
+        return resource
+
+    return _query_params
+
+
+def _set_query_params(req, resp, resource, params, extract, param_name):
+    params[param_name] = extract(req.params)
+
+
+async def _set_query_params_async(req, resp, resource, params, extract, param_name):
+    params[param_name] = extract(req.params)
+
+
+def _conversion_lines(param, name, value, index, namespace):
+    param_type = param.type
+
+    if param_type is list:
+        lines = [
+            'if type({0}) is not list:'.format(value),
+            '    {0} = [{0}]'.format(value),
+        ]
+
+        if param.transform is not None:
+            namespace['_transform_{}'.format(index)] = param.transform
+            lines += [
+                'try:',
+                '    {0} = [_transform_{1}(item) for item in {0}]'.format(value, index),
+                'except ValueError:',
+                '    problems.append(({!r}, {!r}))'.format(
+                    name, 'The value is not formatted correctly.'),
+            ]
+
+        return lines
+
+    lines = [
+        'if type({0}) is list:'.format(value),
+        '    {0} = {0}[-1]'.format(value),
+    ]
+
+    if param_type is str:
+        return lines
+
+    if param_type is bool:
+        namespace['_blank_{}'.format(index)] = param.blank_as_true
+        return lines + [
+            'if {} in _TRUE_STRINGS:'.format(value),
+            '    {} = True'.format(value),
+            'elif {} in _FALSE_STRINGS:'.format(value),
+            '    {} = False'.format(value),
+            'elif not {}:'.format(value),
+            '    {0} = _blank_{1}'.format(value, index),
+            'else:',
+            '    problems.append(({!r}, {!r}))'.format(
+                name, 'The value of the parameter must be "true" or "false".'),
+        ]
+
+    converter, msg = {
+        int: ('int', 'The value must be an integer.'),
+        float: ('float', 'The value must be a float.'),
+        UUID: ('_UUID', 'The value must be a UUID string.'),
+    }[param_type]
+
+    lines += [
+        'try:',
+        '    {0} = {1}({0})'.format(value, converter),
+        'except ValueError:',
+        '    problems.append(({!r}, {!r}))'.format(name, msg),
+    ]
+
+    # NOTE: The bounds are bound in the namespace rather than inlined as
+    #   literals, since the repr of some values (e.g., float('inf') or a
+    #   Decimal) is not valid source code.
+    checks = []
+    if param.min_value is not None:
+        namespace['_min_{}'.format(index)] = param.min_value
+        checks += [
+            'if {0} < _min_{1}:'.format(value, index),
+            '    problems.append(({!r}, {!r}))'.format(
+                name, 'The value must be at least ' + str(param.min_value)),
+        ]
+    if param.max_value is not None:
+        namespace['_max_{}'.format(index)] = param.max_value
+        checks += [
+            'if _max_{1} < {0}:'.format(value, index),
+            '    problems.append(({!r}, {!r}))'.format(
+                name, 'The value may not exceed ' + str(param.max_value)),
+        ]
+
+    if checks:
+        lines += ['else:'] + ['    ' + line for line in checks]
+
+    return lines
+
+
+def _raise_for_problems(problems):
+    if len(problems) == 1:
+        name, msg = problems[0]
+        if msg is None:
+            raise errors.HTTPMissingParam(name)
+        raise errors.HTTPInvalidParam(msg, name)
+
+    descriptions = []
+    for name, msg in problems:
+        if msg is None:
+            descriptions.append('The "{0}" parameter is required.'.format(name))
+        else:
+            descriptions.append('The "{0}" parameter is invalid. {1}'.format(name, msg))
+
+    raise errors.HTTPBadRequest(
+        title='Invalid parameters',
+        description=' '.join(descriptions),
+    )
@@ -26,7 +26,6 @@ from falcon.util import json
 from falcon.util import structures
 from falcon.util.misc import isascii
 from falcon.util.uri import parse_host, parse_query_string
-from falcon.vendor import mimeparse
 
 DEFAULT_ERROR_LOG_FORMAT = ('{0:%Y-%m-%d %H:%M:%S} [FALCON] [ERROR]'
                             ' {1} {2}{3} => ')
@@ -332,6 +331,12 @@ class Request:
 
                 doc = json.load(req.bounded_stream)
 
+            If the Content-Length header is missing (e.g., in the case of a
+            chunked request), the body is read until EOF as long as the WSGI
+            server sets ``wsgi.input_terminated`` in the environ (see also:
+            :attr:`~.RequestOptions.max_terminated_body_size`). Otherwise,
+            the body is assumed to be empty.
+
         media (object): Property that acts as an alias for
             :meth:`~.get_media`. This alias provides backwards-compatibility
             for apps that were built for versions of the framework prior to
@@ -413,6 +418,7 @@ class Request:
         '_cached_relative_uri',
         '_cached_uri',
         '_params',
+        '_spooled_body',
         '_wsgierrors',
         'content_type',
         'context',
@@ -480,15 +486,9 @@ class Request:
             self.query_string = ''
             self._params = {}
         else:
-            if self.query_string:
-                self._params = parse_query_string(
-                    self.query_string,
-                    keep_blank=self.options.keep_blank_qs_values,
-                    csv=self.options.auto_parse_qs_csv,
-                )
-
-            else:
-                self._params = {}
+            # PERF: The query string is only parsed once the params are
+            #   accessed for the first time (see also: the params property).
+            self._params = None if self.query_string else {}
 
         self._cached_access_route = None
         self._cached_forwarded = None
@@ -506,6 +506,7 @@ class Request:
 
         self.stream = env['wsgi.input']
         self._bounded_stream = None  # Lazy wrapping
+        self._spooled_body = None
 
         # PERF(kgriffs): Technically, we should spend a few more
         # cycles and parse the content type for real, but
@@ -872,7 +873,17 @@ class Request:
 
     @property
     def params(self):
-        return self._params
+        # PERF: Defer parsing the query string until it is actually needed,
+        #   since many responders never access any of the params.
+        params = self._params
+        if params is None:
+            params = self._params = parse_query_string(
+                self.query_string,
+                keep_blank=self.options.keep_blank_qs_values,
+                csv=self.options.auto_parse_qs_csv,
+            )
+
+        return params
 
     @property
     def cookies(self):
@@ -1014,6 +1025,48 @@ class Request:
 
     media = property(get_media)
 
+    def spool_body(self):
+        """Buffer the request body so that it can be read more than once.
+
+        The first time this method is called, the remainder of the request
+        body is copied from :attr:`bounded_stream` to a seekable file-like
+        object. Bodies that do not exceed the
+        :attr:`~falcon.RequestOptions.body_spool_threshold` are kept in
+        memory, while larger ones are spilled to a temporary file on disk.
+
+        Every call returns a new reader for the spooled body, positioned at
+        the beginning of the data, and also replaces both :attr:`stream` and
+        :attr:`bounded_stream` with fresh readers. Therefore, a middleware
+        component may inspect the body without preventing the responder from
+        consuming it via :attr:`stream`, :attr:`bounded_stream`, or
+        :meth:`get_media`::
+
+            body = req.spool_body().read()
+
+        Warning:
+            Any data consumed from the request stream before this method is
+            first called is not included in the spooled body.
+
+        Returns:
+            object: A seekable file-like object for reading the request body.
+        """
+
+        body = self._spooled_body
+        if body is None:
+            body = helpers._spool_stream(
+                self.bounded_stream,
+                self.options.body_spool_threshold,
+            )
+            self._spooled_body = body
+
+        self.stream = helpers._open_spooled_body(body)
+        self._bounded_stream = helpers.BoundedStream(
+            self.stream,
+            helpers._spooled_body_length(body),
+        )
+
+        return helpers._open_spooled_body(body)
+
     # ------------------------------------------------------------------------
     # Methods
     # ------------------------------------------------------------------------
@@ -1037,11 +1090,8 @@ class Request:
         if (accept == media_type) or (accept == '*/*'):
             return True
 
-        # Fall back to full-blown parsing
-        try:
-            return mimeparse.quality(media_type, accept) != 0.0
-        except ValueError:
-            return False
+        # Fall back to full-blown (albeit memoized) parsing
+        return helpers._quality(media_type, accept) != 0.0
 
     def client_prefers(self, media_types):
         """Return the client's preferred media type, given several choices.
@@ -1057,12 +1107,14 @@ class Request:
             of the given types.
         """
 
-        try:
-            # NOTE(kgriffs): best_match will return '' if no match is found
-            preferred_type = mimeparse.best_match(media_types, self.accept)
-        except ValueError:
-            # Value for the accept header was not formatted correctly
-            preferred_type = ''
+        # PERF: The negotiation result is memoized, which requires the
+        #   collection of media types to be hashable.
+        if type(media_types) is not tuple:
+            media_types = tuple(media_types)
+
+        # NOTE(kgriffs): best_match will return '' if no match is found, or
+        #   the value of the Accept header was not formatted correctly.
+        preferred_type = helpers._best_match(media_types, self.accept)
 
         return (preferred_type if preferred_type else None)
 
@@ -1166,20 +1218,18 @@ class Request:
             the individual ``cookie-pair``'s in the header.
         """
 
-        if self._cookies is None:
-            # PERF(kgriffs): While this code isn't exactly DRY (the same code
-            # is duplicated by the cookies property) it does make things a bit
-            # more performant by removing the extra function call that would
-            # be required to factor this out. If we ever have to do this in a
-            # *third* place, we would probably want to factor it out at that
-            # point.
-            header_value = self.get_header('Cookie')
-            if header_value:
-                self._cookies = helpers.parse_cookie_header(header_value)
-            else:
-                self._cookies = {}
+        if self._cookies is not None:
+            return self._cookies.get(name)
+
+        # PERF: Apps typically only look up one or two cookies (e.g., a
+        #   session ID) in a header that may be kilobytes long, so only scan
+        #   for the named cookie, and leave parsing the full header to the
+        #   cookies property in the case it is actually needed.
+        header_value = self.get_header('Cookie')
+        if not header_value:
+            return None
 
-        return self._cookies.get(name)
+        return helpers._parse_cookie_values(header_value, name)
 
     def get_param(self, name, required=False, store=None, default=None):
         """Return the raw value of a query string parameter as a string.
@@ -1229,7 +1279,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1289,7 +1339,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1360,7 +1410,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1434,7 +1484,7 @@ class Request:
                 be converted to a ``UUID``.
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1505,7 +1555,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1575,7 +1625,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1759,7 +1809,7 @@ class Request:
 
         """
 
-        if name in self._params:
+        if name in self.params:
             return True
         else:
             return False
@@ -1793,7 +1843,7 @@ class Request:
 
     def _get_wrapped_wsgi_input(self):
         try:
-            content_length = self.content_length or 0
+            content_length = self.content_length
 
         # NOTE(kgriffs): This branch is indeed covered in test_wsgi.py
         # even though coverage isn't able to detect it.
@@ -1802,6 +1852,19 @@ class Request:
             # but it had an invalid value. Assume no content.
             content_length = 0
 
+        if content_length is None:
+            # NOTE: In the absence of a Content-Length header (e.g., for a
+            #   chunked request), the body can only be read safely if the
+            #   server guarantees that wsgi.input is terminated at EOF.
+            if self.env.get('wsgi.input_terminated'):
+                return helpers.BoundedStream(
+                    self.env['wsgi.input'],
+                    None,
+                    max_stream_len=self.options.max_terminated_body_size,
+                )
+
+            content_length = 0
+
         return helpers.BoundedStream(self.env['wsgi.input'], content_length)
 
     def _parse_form_urlencoded(self):
@@ -1830,7 +1893,7 @@ class Request:
                 csv=self.options.auto_parse_qs_csv,
             )
 
-            self._params.update(extra_params)
+            self.params.update(extra_params)
 
 
 # PERF: To avoid typos and improve storage space and speed over a dict.
@@ -1920,6 +1983,23 @@ class RequestOptions:
             media-types to handle. By default, handlers are provided for the
             ``application/json``, ``application/x-www-form-urlencoded`` and
             ``multipart/form-data`` media types.
+
+        body_spool_threshold (int): Maximum size, in bytes, of a request body
+            that :meth:`~falcon.Request.spool_body` will keep in memory
+            (default 1 MiB). Larger bodies are spilled to a temporary file.
+
+        max_terminated_body_size (int): Maximum size, in bytes, of a WSGI
+            request body whose length is not known in advance (default
+            ``None``, meaning no limit).
+
+            When a request does not specify the Content-Length header (e.g.,
+            in the case of a chunked request), the body is only made
+            available via :attr:`~falcon.Request.bounded_stream` if the WSGI
+            server indicates that the input stream is terminated at the end
+            of the body (via ``environ['wsgi.input_terminated']``, as is the
+            case for Gunicorn and uWSGI). In that case, the body is read until
+            EOF, and an instance of :class:`~falcon.HTTPPayloadTooLarge` is
+            raised upon reading any data beyond this limit.
     """
     __slots__ = (
         'keep_blank_qs_values',
@@ -1928,6 +2008,8 @@ class RequestOptions:
         'strip_url_path_trailing_slash',
         'default_media_type',
         'media_handlers',
+        'body_spool_threshold',
+        'max_terminated_body_size',
     )
 
     def __init__(self):
@@ -1937,3 +2019,5 @@ class RequestOptions:
         self.strip_url_path_trailing_slash = False
         self.default_media_type = DEFAULT_MEDIA_TYPE
         self.media_handlers = Handlers()
+        self.body_spool_threshold = 1024 * 1024
+        self.max_terminated_body_size = None
@@ -17,8 +17,18 @@
 from http import cookies as http_cookies
 import io
 import re
+import sys
+import tempfile
 
+from falcon import errors
 from falcon.util import ETag
+from falcon.util.misc import _lru_cache_safe
+from falcon.vendor import mimeparse
+
+try:
+    from falcon.cyutil.cookies import scan_cookie_values as _cy_scan_cookie_values
+except ImportError:
+    _cy_scan_cookie_values = None
 
 # https://tools.ietf.org/html/rfc6265#section-4.1.1
 #
@@ -35,6 +45,10 @@ _COOKIE_NAME_RESERVED_CHARS = re.compile('[\x00-\x1F\x7F-\xFF()<>@,;:\\\\"/[\\]?
 #   and more performant.
 _ENTITY_TAG_PATTERN = re.compile(r'([Ww]/)?"([^"]*)"')
 
+# NOTE: Clients tend to send only a handful of distinct Accept headers, so a
+#   modest LRU goes a long way toward avoiding repeated content negotiation.
+_ACCEPT_CACHE_SIZE = 256
+
 
 def parse_cookie_header(header_value):
     """Parse a Cookie header value into a dict of named values.
@@ -97,6 +111,61 @@ def parse_cookie_header(header_value):
     return cookies
 
 
+def _parse_cookie_values(header_value, name):
+    """Find all values of a single named cookie in a Cookie header value.
+
+    This function yields the same result as ``parse_cookie_header(
+    header_value).get(name)``, but it only examines the cookie-pairs that
+    might match the given name, without building the full mapping.
+
+    Args:
+        header_value (str): Value of a Cookie header
+        name (str): Cookie name, case-sensitive.
+
+    Returns:
+        list: Ordered list of all values found in the header for the named
+        cookie, or ``None`` if the cookie was not found.
+    """
+
+    # NOTE: Cookies with invalid names are always skipped by
+    #   parse_cookie_header(), so there is no point in looking for one.
+    if not name or _COOKIE_NAME_RESERVED_CHARS.search(name):
+        return None
+
+    return _scan_cookie_values(header_value, name)
+
+
+def _scan_cookie_values(header_value, name):
+    values = None
+
+    # PERF: Let str.find() skip over the cookie-pairs that cannot possibly
+    #   match, and only tokenize the ones where the name occurs.
+    pos = header_value.find(name)
+    while pos >= 0:
+        start = header_value.rfind(';', 0, pos) + 1
+        end = header_value.find(';', pos)
+        if end < 0:
+            end = len(header_value)
+
+        token_name, __, value = header_value[start:end].partition('=')
+
+        if token_name.strip() == name:
+            value = value.strip()
+
+            # NOTE: See also the comments in parse_cookie_header().
+            if len(value) > 2 and value[0] == '"' and value[-1] == '"':
+                value = http_cookies._unquote(value)
+
+            if values is None:
+                values = [value]
+            else:
+                values.append(value)
+
+        pos = header_value.find(name, end)
+
+    return values
+
+
 def header_property(wsgi_name):
     """Create a read-only header property.
 
@@ -185,10 +254,24 @@ class BoundedStream(io.IOBase):
     above. The caller is not allowed to read more than the number of
     bytes specified by the Content-Length header in the request.
 
+    When the length of the request body is not known in advance (e.g., in
+    the case of a chunked request), and the WSGI server signals that the
+    input stream is terminated at the end of the body (by setting
+    ``environ['wsgi.input_terminated']``), `stream_len` may be passed as
+    ``None`` in order to read the stream until EOF instead. In this case,
+    an instance of :class:`~falcon.HTTPPayloadTooLarge` is raised upon
+    reading beyond `max_stream_len` bytes, if specified.
+
     Args:
         stream: Instance of ``socket._fileobject`` from
             ``environ['wsgi.input']``
-        stream_len: Expected content length of the stream.
+        stream_len: Expected content length of the stream, or ``None`` if
+            the stream is to be read until EOF.
+
+    Keyword Args:
+        max_stream_len (int): Maximum number of bytes that may be read from
+            a stream whose length is unknown (default ``None``, meaning no
+            limit). Ignored if `stream_len` is specified.
 
     Attributes:
         eof (bool): ``True`` if there is no more data to read from
@@ -197,11 +280,18 @@ class BoundedStream(io.IOBase):
 
     """
 
-    def __init__(self, stream, stream_len):
+    def __init__(self, stream, stream_len, max_stream_len=None):
         self.stream = stream
         self.stream_len = stream_len
 
-        self._bytes_remaining = self.stream_len
+        if stream_len is not None:
+            self._bytes_remaining = stream_len
+        else:
+            # NOTE: The number of remaining bytes is only an upper bound in
+            #   this case, so EOF is tracked separately.
+            self._max_stream_len = max_stream_len
+            self._bytes_remaining = sys.maxsize if max_stream_len is None else max_stream_len
+            self._eof = False
 
     def __iter__(self):
         return self
@@ -228,6 +318,9 @@ class BoundedStream(io.IOBase):
 
         """
 
+        if self.stream_len is None:
+            return self._read_until_eof(size, target)
+
         # NOTE(kgriffs): Default to reading all remaining bytes if the
         # size is not specified or is out of bounds. This behaves
         # similarly to the IO streams passed in by non-wsgiref servers.
@@ -237,6 +330,54 @@ class BoundedStream(io.IOBase):
         self._bytes_remaining -= size
         return target(size)
 
+    def _read_until_eof(self, size, target, short_read_is_eof=False):
+        """Proxy a read to an underlying stream that is terminated at EOF.
+
+        Args:
+            size (int): Maximum number of bytes to read, or ``None`` or -1 to
+                read until EOF.
+            target (callable): The function to call to actually do the work.
+            short_read_is_eof (bool): Whether returning fewer bytes than
+                requested implies EOF (as is the case for ``read()``).
+
+        Returns:
+            bytes: Data read from the stream, as returned by `target`.
+
+        """
+
+        if self._eof:
+            return b''
+
+        remaining = self._bytes_remaining
+        if size is None or size < 0 or size > remaining:
+            # NOTE: Request one byte more than the stream is allowed to
+            #   contain, in order to detect any excess data.
+            size = -1 if self._max_stream_len is None else remaining + 1
+
+        data = target(size)
+        num_bytes = len(data)
+        if num_bytes > remaining:
+            self._raise_too_large()
+
+        self._bytes_remaining -= num_bytes
+        if short_read_is_eof:
+            if size < 0 or num_bytes < size:
+                self._eof = True
+        elif num_bytes == 0 and size != 0:
+            self._eof = True
+
+        return data
+
+    def _raise_too_large(self):
+        self._eof = True
+
+        raise errors.HTTPPayloadTooLarge(
+            description=(
+                'The request body may not exceed {} bytes in length.'.format(
+                    self._max_stream_len)
+            )
+        )
+
     def readable(self):
         """Always returns ``True``."""
         return True
@@ -261,8 +402,67 @@ class BoundedStream(io.IOBase):
 
         """
 
+        if self.stream_len is None:
+            return self._read_until_eof(size, self.stream.read, True)
+
         return self._read(size, self.stream.read)
 
+    def readinto(self, buffer):
+        """Read bytes into a pre-allocated, writable bytes-like object.
+
+        If the wrapped stream implements ``readinto()``, the data is read
+        directly into `buffer`. Otherwise, the data is read via ``read()``
+        and then copied into `buffer`.
+
+        Args:
+            buffer: A writable bytes-like object, such as a ``bytearray``.
+
+        Returns:
+            int: The number of bytes read (``0`` at EOF).
+
+        """
+
+        view = memoryview(buffer).cast('B')
+        size = len(view)
+        remaining = self._bytes_remaining
+
+        if self.stream_len is None:
+            if self._eof:
+                return 0
+
+            # NOTE: See also the comment in _read_until_eof().
+            if size > remaining:
+                size = remaining + 1
+        elif size > remaining:
+            size = remaining
+
+        if size <= 0:
+            return 0
+
+        try:
+            readinto = self.stream.readinto
+        except AttributeError:
+            data = self.stream.read(size)
+            num_bytes = len(data)
+            view[:num_bytes] = data
+        else:
+            num_bytes = readinto(view[:size]) or 0
+
+        if num_bytes > remaining:
+            self._raise_too_large()
+
+        # NOTE: Unlike read(), only count the bytes that were actually
+        #   received, since readinto() may legitimately return fewer bytes.
+        #   Nothing at all means that the stream is exhausted.
+        if num_bytes:
+            self._bytes_remaining -= num_bytes
+        elif self.stream_len is None:
+            self._eof = True
+        else:
+            self._bytes_remaining = 0
+
+        return num_bytes
+
     def readline(self, limit=None):
         """Read a line from the stream.
 
@@ -289,6 +489,18 @@ class BoundedStream(io.IOBase):
 
         """
 
+        if self.stream_len is None:
+            # NOTE: Go line by line, so that every byte is accounted for.
+            lines = []
+            num_bytes = 0
+            for line in iter(self.readline, b''):
+                lines.append(line)
+                num_bytes += len(line)
+                if hint is not None and 0 < hint <= num_bytes:
+                    break
+
+            return lines
+
         return self._read(hint, self.stream.readlines)
 
     def write(self, data):
@@ -305,6 +517,16 @@ class BoundedStream(io.IOBase):
             chunk_size (int): The size for a chunk (default: 64 KB).
                 It will read the chunk until the stream is exhausted.
         """
+        if self.stream_len is None:
+            # NOTE: Drain the stream regardless of the maximum length, since
+            #   the data is discarded anyway.
+            read = self.stream.read
+            while read(chunk_size):
+                pass
+
+            self._eof = True
+            return
+
         while True:
             chunk = self.read(chunk_size)
             if not chunk:
@@ -312,6 +534,9 @@ class BoundedStream(io.IOBase):
 
     @property
     def eof(self):
+        if self.stream_len is None:
+            return self._eof
+
         return self._bytes_remaining <= 0
 
     is_exhausted = eof
@@ -319,3 +544,141 @@ class BoundedStream(io.IOBase):
 
 # NOTE(kgriffs): Alias for backwards-compat
 Body = BoundedStream
+
+
+def _spool_stream(stream, threshold, chunk_size=64 * 1024):
+    """Copy the remainder of a bounded stream to a reusable buffer.
+
+    Bodies that do not exceed `threshold` bytes are read into memory in a
+    single call, while larger ones are copied in chunks to a temporary file
+    that is rolled over to disk as soon as it grows beyond `threshold`.
+
+    Args:
+        stream (BoundedStream): The stream to read from.
+        threshold (int): Maximum number of bytes to keep in memory.
+        chunk_size (int): The size for a chunk (default: 64 KB).
+
+    Returns:
+        object: Either a ``bytes`` object, or a temporary file object. In
+        either case, the data can be read via :func:`_open_spooled_body`.
+    """
+
+    if stream._bytes_remaining <= threshold:
+        return stream.read()
+
+    spooled = tempfile.SpooledTemporaryFile(max_size=threshold)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        spooled.write(chunk)
+
+    return spooled
+
+
+def _spooled_body_length(body):
+    if type(body) is bytes:
+        return len(body)
+
+    return body.seek(0, io.SEEK_END)
+
+
+def _open_spooled_body(body):
+    """Open a new reader, with its own position, for a spooled body."""
+
+    if type(body) is bytes:
+        # PERF: io.BytesIO shares the buffer of an immutable bytes
+        #   object until the first write, so the body is not copied.
+        return io.BytesIO(body)
+
+    return io.BufferedReader(_SpooledFileReader(body))
+
+
+class _SpooledFileReader(io.RawIOBase):
+    """Read-only view of a spooled temporary file.
+
+    Every instance maintains its own position, so that several consumers
+    may read the same spooled body independently of one another.
+    """
+
+    def __init__(self, spooled):
+        self._spooled = spooled
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._spooled.seek(0, io.SEEK_END)
+
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, buffer):
+        self._spooled.seek(self._pos)
+        data = self._spooled.read(len(buffer))
+
+        size = len(data)
+        buffer[:size] = data
+        self._pos += size
+
+        return size
+
+
+@_lru_cache_safe(maxsize=_ACCEPT_CACHE_SIZE)
+def _best_match(media_types, accept):
+    """Memoize ``mimeparse.best_match()`` for a given Accept header value.
+
+    An LRU is used to avoid re-parsing the Accept header for the same
+    combination of header value and candidate media types. Since
+    ``functools.lru_cache`` is thread-safe, the cache is shared by all
+    requests in the process.
+
+    Args:
+        media_types (tuple): Candidate media types, in order of the server's
+            preference. Must be hashable.
+        accept (str): The value of the Accept header.
+
+    Returns:
+        str: The best matching media type, or an empty string if none of the
+        given types are acceptable (or the header is malformed).
+    """
+
+    try:
+        return mimeparse.best_match(media_types, accept)
+    except ValueError:
+        return ''
+
+
+@_lru_cache_safe(maxsize=_ACCEPT_CACHE_SIZE)
+def _quality(media_type, accept):
+    """Memoize ``mimeparse.quality()`` for a given Accept header value.
+
+    Args:
+        media_type (str): The media type to check.
+        accept (str): The value of the Accept header.
+
+    Returns:
+        float: The quality value of `media_type`, or ``0.0`` if it is not
+        acceptable (or the header is malformed).
+    """
+
+    try:
+        return mimeparse.quality(media_type, accept)
+    except ValueError:
+        return 0.0
+
+
+# NOTE: Hoist the Cython variant into this module, if available (see also
+#   the same pattern at the end of falcon.util.uri).
+_scan_cookie_values = _cy_scan_cookie_values or _scan_cookie_values  # NOQA
@@ -72,6 +72,11 @@ class Response:
         media (object): A serializable object supported by the media handlers
             configured via :class:`falcon.RequestOptions`.
 
+            When set to an iterator (such as a generator), the items are
+            serialized incrementally and streamed as a collection, rather
+            than being rendered all at once (provided that the media handler
+            supports it, as is the case with :class:`~falcon.media.JSONHandler`).
+
             Note:
                 See also :ref:`media` for more information regarding media
                 handling.
@@ -234,6 +239,11 @@ class Response:
             This method ignores :attr:`~.stream`; the caller must check
             and handle that attribute directly.
 
+        Note:
+            If :attr:`~.media` is set to an iterator, it is serialized
+            incrementally: the serializing iterator is assigned to
+            :attr:`~.stream` instead, and ``None`` is returned.
+
         Returns:
             bytes: The UTF-8 encoded value of the `body` attribute, if
             set. Otherwise, the value of the `data` attribute if set, or
@@ -257,10 +267,17 @@ class Response:
                         self.options.default_media_type
                     )
 
-                    self._media_rendered = handler.serialize(
-                        self._media,
-                        self.content_type
-                    )
+                    media = self._media
+                    if hasattr(media, '__next__'):
+                        # NOTE: Iterators are serialized incrementally, as
+                        #   the response stream is being consumed.
+                        self.stream = handler.serialize_stream(media, self.content_type)
+                        self._media_rendered = None
+                    else:
+                        self._media_rendered = handler.serialize(
+                            media,
+                            self.content_type
+                        )
 
                 data = self._media_rendered
         else:
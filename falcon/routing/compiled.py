@@ -14,17 +14,27 @@
 
 """Default routing engine."""
 
-from collections import UserDict
+from collections import namedtuple, OrderedDict, UserDict
+import hashlib
+import importlib.machinery
+import importlib.util
 from inspect import iscoroutinefunction
 import keyword
+import marshal
+import os
 import re
+import sys
+import tempfile
 import textwrap
 from threading import Lock
+import uuid
 
 from falcon.routing import converters
 from falcon.routing.util import map_http_methods, set_default_responders
 from falcon.util.misc import is_python_func
 from falcon.util.sync import _should_wrap_non_coroutines, wrap_sync_to_async
+from falcon.util.uri import encode, encode_value
+from falcon.version import __version__
 
 
 _TAB_STR = ' ' * 4
@@ -40,6 +50,18 @@ _FIELD_PATTERN = re.compile(
 )
 _IDENTIFIER_PATTERN = re.compile('[A-Za-z_][A-Za-z0-9_]*$')
 
+# NOTE: When the number of literal segments at a single level of the routing
+#   tree reaches this threshold, the compiled router dispatches on the
+#   segment with a dict lookup, rather than testing each literal in turn.
+_LITERAL_DISPATCH_THRESHOLD = 8
+
+RouteCacheInfo = namedtuple('RouteCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_FinderUnit = namedtuple(
+    '_FinderUnit',
+    ['find', 'return_values', 'patterns', 'converters', 'src'],
+)
+
 
 class CompiledRouter:
     """Fast URI router which compiles its routing logic to Python code.
@@ -71,19 +93,26 @@ class CompiledRouter:
 
     __slots__ = (
         '_ast',
+        '_cache',
         '_converter_map',
+        '_converter_specs',
         '_converters',
+        '_dirty_units',
         '_find',
         '_finder_src',
+        '_host_roots',
         '_options',
         '_patterns',
         '_return_values',
         '_roots',
+        '_units',
         '_compile_lock',
     )
 
     def __init__(self):
         self._ast = None
+        self._cache = None
+        self._converter_specs = None
         self._converters = None
         self._finder_src = None
 
@@ -96,6 +125,12 @@ class CompiledRouter:
         self._patterns = None
         self._return_values = None
         self._roots = []
+        self._host_roots = {}
+
+        # NOTE: Only used when the incremental_compile option is enabled;
+        #   _units is None until the router is first compiled in that mode.
+        self._units = None
+        self._dirty_units = set()
 
         # NOTE(caselit): set _find to the delayed compile method to ensure that
         # compile is called when the router is first used
@@ -112,6 +147,14 @@ class CompiledRouter:
         # returning the finder source, since the current value may be out of
         # date
         self.find('/')
+
+        if self._units is not None:
+            return '\n\n'.join(
+                unit.src
+                for units in self._units.values()
+                for unit in units.values()
+            )
+
         return self._finder_src
 
     def map_http_methods(self, resource, **kwargs):
@@ -178,6 +221,14 @@ class CompiledRouter:
                     addition of new routes when hundreds of them are added at
                     once. It is advisable to only set this flag to ``True`` when
                     adding the final route.
+            host (str): Optional host name to restrict this route to. If a
+                host is provided, the route will only match requests whose
+                host name (see also: :attr:`falcon.Request.host`) is exactly
+                the given one, compared case-insensitively and without the
+                port; subdomains and wildcards are not matched. Requests
+                for a host that do not match any of its specific routes
+                fall back to the routes that were added without specifying
+                a host (default ``None``).
         """
 
         # NOTE(kgriffs): falcon.asgi.App injects this private kwarg; it is
@@ -198,6 +249,16 @@ class CompiledRouter:
         if re.search(r'\s', _FIELD_PATTERN.sub('{FIELD}', uri_template)):
             raise ValueError('URI templates may not include whitespace.')
 
+        host = kwargs.get('host')
+        if host is None:
+            roots = self._roots
+        else:
+            if not isinstance(host, str) or not host:
+                raise TypeError('host must be a non-empty string')
+
+            host = host.lower()
+            roots = self._host_roots.setdefault(host, [])
+
         path = uri_template.strip('/').split('/')
 
         used_names = set()
@@ -241,7 +302,15 @@ class CompiledRouter:
             else:
                 insert(new_node.children, path_index + 1)
 
-        insert(self._roots)
+        insert(roots)
+        self._mark_unit_dirty(host, roots, path[0])
+
+        # NOTE: Any cached lookup result may now be stale, since the new
+        #   route could mask a previously cached 404, or override the
+        #   resource of an existing node.
+        if self._cache is not None:
+            self._cache.clear()
+
         # NOTE(caselit): when compile is True run the actual compile step, otherwise reset the
         # _find, so that _compile will be called on the next find use
         if kwargs.get('compile', False):
@@ -257,9 +326,10 @@ class CompiledRouter:
 
         Keyword Args:
             req: The :class:`falcon.Request` or :class:`falcon.asgi.Request`
-                object that will be passed to the routed responder. Currently
-                the value of this argument is ignored by
-                :class:`~.CompiledRouter`. Routing is based solely on the path.
+                object that will be passed to the routed responder. Unless
+                any routes were added for a specific host, the value of this
+                argument is ignored by :class:`~.CompiledRouter`, and routing
+                is based solely on the path.
 
         Returns:
             tuple: A 4-member tuple composed of (resource, method_map,
@@ -267,16 +337,91 @@ class CompiledRouter:
             the requested path.
         """
 
+        host = None
+        key = uri
+        if self._host_roots and req is not None:
+            host = req.host.lower()
+            key = (host, uri)
+
+        cache = self._cache
+        if cache is not None:
+            entry = cache.get(key)
+            if entry is not _CACHE_MISS:
+                if entry is None:
+                    return None
+
+                node, params = entry
+                # NOTE: The params dict is handed over to the responder,
+                #   which is free to mutate it, so we must never share the
+                #   cached instance.
+                return node.resource, node.method_map, params.copy(), node.uri_template
+
         path = uri.lstrip('/').split('/')
         params = {}
-        node = self._find(path, self._return_values, self._patterns,
-                          self._converters, params)
+        if host is None:
+            node = self._find(path, self._return_values, self._patterns,
+                              self._converters, params)
+        else:
+            node = self._find(path, self._return_values, self._patterns,
+                              self._converters, params, host)
+
+        # NOTE: The cache may have just been created by _compile(), in the
+        #   case that this is the first lookup.
+        cache = self._cache
+        if cache is not None:
+            cache.put(key, None if node is None else (node, params.copy()))
 
         if node is not None:
             return node.resource, node.method_map, params, node.uri_template
         else:
             return None
 
+    def build_native_finder(self):
+        """Compile the routing logic into a native extension module.
+
+        The source code of the search function (see also:
+        :attr:`finder_src`) is translated to C with Cython, and the
+        resulting extension module is saved in the directory set via the
+        ``finder_cache_dir`` option, alongside the regular finder cache
+        file. From then on, any router serving the exact same set of
+        routes (as determined by the same hash that is used to name the
+        cache file) loads the extension instead of executing the
+        generated Python code.
+
+        Building the extension takes a while, so this method is best
+        invoked once the route table is frozen, e.g., by a build or
+        deployment script that creates the app and then calls
+        ``app._router.build_native_finder()``.
+
+        Note:
+            This method requires the ``cython`` package and a working C
+            compiler (the extension module can then be loaded without
+            either of them).
+
+        Returns:
+            str: Path to the extension module.
+        """
+
+        cache_path = self._get_finder_cache_path()
+        if cache_path is None:
+            raise ValueError(
+                'The finder_cache_dir option must be set in order to build '
+                'the native finder.'
+            )
+
+        with self._compile_lock:
+            # NOTE: Ensure that concurrent lookups wait for the lock while
+            #   the finder is regenerated, and load the native one later.
+            self._find = self._compile_and_find
+
+            code = self._generate_finder(self._roots, self._host_roots)
+            self._save_finder(cache_path, code)
+
+            module_name, module_path = _get_native_finder_location(cache_path)
+            _build_native_finder(module_name, module_path, self._finder_src)
+
+        return module_path
+
     # -----------------------------------------------------------------
     # Private
     # -----------------------------------------------------------------
@@ -320,6 +465,18 @@ class CompiledRouter:
                 msg = msg.format(responder)
                 raise TypeError(msg)
 
+    def _mark_unit_dirty(self, host, roots, segment):
+        """Records the root subtree that was modified by add_route().
+
+        When the ``incremental_compile`` option is enabled, only the units
+        corresponding to modified subtrees are recompiled.
+        """
+
+        for node in roots:
+            if node.matches(segment):
+                self._dirty_units.add((host, None if node.is_var else node.raw_segment))
+                return
+
     def _validate_template_segment(self, segment, used_names):
         """Validates a single path segment of a URI template.
 
@@ -368,7 +525,8 @@ class CompiledRouter:
                     msg = 'Cannot instantiate converter "{}"'.format(name)
                     raise ValueError(msg) from e
 
-    def _generate_ast(self, nodes, parent, return_values, patterns, level=0, fast_return=True):
+    def _generate_ast(self, nodes, parent, return_values, patterns, definitions,
+                      level=0, fast_return=True):
         """Generates a coarse AST for the router."""
 
         # NOTE(kgriffs): Base case
@@ -400,6 +558,9 @@ class CompiledRouter:
 
                 fast_return = not found_var_nodes
 
+        dispatch = self._generate_literal_dispatch(
+            nodes, parent, definitions, level, fast_return)
+
         for node in nodes:
             if node.is_var:
                 if node.is_complex:
@@ -433,18 +594,12 @@ class CompiledRouter:
 
                         field_name = node.var_name
                         __, converter_name, converter_argstr = node.var_converter_map[0]
-                        converter_class = self._converter_map[converter_name]
+                        converter_idx = self._add_converter(converter_name, converter_argstr)
 
-                        converter_obj = self._instantiate_converter(
-                            converter_class,
-                            converter_argstr
-                        )
-                        converter_idx = len(self._converters)
-                        self._converters.append(converter_obj)
-
-                        construct = _CxIfConverterField(
+                        construct = _create_converter_field(
                             field_name,
                             converter_idx,
+                            self._converters[converter_idx],
                         )
 
                         parent.append_child(construct)
@@ -462,6 +617,12 @@ class CompiledRouter:
                                 if _node.is_var and not _node.is_complex]) == 1
                     found_simple = True
 
+            elif dispatch is not None:
+                construct = _CxFinder(len(definitions))
+                definitions.append(construct)
+                dispatch.literal_map.add_literal(node.raw_segment, construct)
+                parent = construct
+
             else:
                 # NOTE(kgriffs): Not a param, so must match exactly
                 construct = _CxIfPathSegmentLiteral(level, node.raw_segment)
@@ -479,6 +640,7 @@ class CompiledRouter:
                 parent,
                 return_values,
                 patterns,
+                definitions,
                 level + 1,
                 fast_return
             )
@@ -502,24 +664,42 @@ class CompiledRouter:
         if not found_simple and fast_return:
             parent.append_child(_CxReturnNone())
 
+    def _generate_literal_dispatch(self, nodes, parent, definitions, level, fast_return):
+        """Generates a dict-based dispatch for a wide level of literal nodes.
+
+        Testing a long series of literal segments one at a time is O(n), so
+        when the number of literal nodes at this level reaches the
+        threshold, we instead generate a separate finder function for each
+        literal branch, and select the right one with a single dict lookup.
+
+        Returns:
+            _CxLiteralDispatch: The dispatch construct that has been appended
+            to `parent`, or ``None`` if the literals at this level should be
+            simply tested in turn.
+        """
+
+        num_literals = len([node for node in nodes if not node.is_var])
+        if num_literals < _LITERAL_DISPATCH_THRESHOLD:
+            return None
+
+        dispatch = _CxLiteralDispatch(level, len(definitions), fast_return)
+        definitions.append(dispatch.literal_map)
+        parent.append_child(dispatch)
+
+        return dispatch
+
     def _generate_conversion_ast(self, parent, node):
         # NOTE(kgriffs): Unroll the converter loop into
         # a series of nested "if" constructs.
         for field_name, converter_name, converter_argstr in node.var_converter_map:
-            converter_class = self._converter_map[converter_name]
-
-            converter_obj = self._instantiate_converter(
-                converter_class,
-                converter_argstr
-            )
-            converter_idx = len(self._converters)
-            self._converters.append(converter_obj)
+            converter_idx = self._add_converter(converter_name, converter_argstr)
 
             parent.append_child(_CxSetFragmentFromField(field_name))
 
-            construct = _CxIfConverterField(
+            construct = _create_converter_field(
                 field_name,
                 converter_idx,
+                self._converters[converter_idx],
             )
 
             parent.append_child(construct)
@@ -536,26 +716,178 @@ class CompiledRouter:
         """Generates Python code for the entire routing tree.
 
         The generated code is compiled and the resulting Python method
-        is returned.
+        is returned. When the ``finder_cache_dir`` option is set, the
+        compiled code is loaded from (or saved to) a file in that
+        directory, if possible.
+
+        When the ``incremental_compile`` option is set, only the parts of
+        the routing tree that were modified since the last compilation
+        are processed (see also: :meth:`~._compile_incremental`).
         """
 
-        src_lines = [
-            'def find(path, return_values, patterns, converters, params):',
-            _TAB_STR + 'path_len = len(path)',
-        ]
+        # NOTE: Reuse the existing cache (which add_route() will have
+        #   already cleared) so that the hit/miss counters are preserved
+        #   across recompilations.
+        cache_size = self._options.cache_size
+        if not cache_size or cache_size < 1:
+            self._cache = None
+        elif self._cache is None or self._cache.maxsize != cache_size:
+            self._cache = _RouteCache(cache_size)
+        self._options._cache = self._cache
+
+        if self._options.incremental_compile:
+            return self._compile_incremental()
+
+        self._units = None
+        self._dirty_units.clear()
+
+        cache_path = self._get_finder_cache_path()
+
+        code = None
+        if cache_path is not None:
+            code = self._load_finder(cache_path)
+
+        if code is None:
+            code = self._generate_finder(self._roots, self._host_roots)
+
+            if cache_path is not None:
+                self._save_finder(cache_path, code)
+
+        if cache_path is not None:
+            find = self._load_native_finder(cache_path)
+            if find is not None:
+                return find
+
+        return _exec_finder(code)
+
+    def _compile_incremental(self):
+        """Compiles the routing tree as a set of independent units.
+
+        Each unit is a complete finder for a single root subtree, i.e., for
+        the routes sharing the same literal first segment, or for all the
+        routes that start with a field expression. Units are compiled
+        separately and selected by the first segment of the requested path,
+        so that adding a route only requires recompiling the one unit that
+        it belongs to.
+
+        Returns:
+            The bound :meth:`~._find_incremental` method.
+        """
+
+        if self._units is None:
+            self._units = {}
+            self._dirty_units.clear()
+
+            for host, roots in [(None, self._roots)] + list(self._host_roots.items()):
+                for node in roots:
+                    self._dirty_units.add((host, None if node.is_var else node.raw_segment))
+
+        for host, segment in self._dirty_units:
+            roots = self._roots if host is None else self._host_roots[host]
+            if segment is None:
+                roots = [node for node in roots if node.is_var]
+            else:
+                roots = [node for node in roots
+                         if not node.is_var and node.raw_segment == segment]
+
+            code = self._generate_finder(roots, {})
+            self._units.setdefault(host, {})[segment] = _FinderUnit(
+                _exec_finder(code),
+                self._return_values,
+                self._patterns,
+                self._converters,
+                self._finder_src,
+            )
+
+        self._dirty_units.clear()
+
+        return self._find_incremental
+
+    def _find_incremental(self, path, _return_values, _patterns, _converters, params,
+                          host=None):
+        """Searches the units compiled by :meth:`~._compile_incremental`.
+
+        This method has the same signature as the function returned by
+        :meth:`~._compile`, but the return values, patterns and converters
+        passed by the caller are ignored in favor of each unit's own.
+        """
+
+        units = self._units
+
+        if host is not None:
+            host_units = units.get(host)
+            if host_units is not None:
+                node = _find_in_units(host_units, path, params)
+                if node is not None:
+                    return node
+
+                # NOTE: Discard any fields that were set by a partial match
+                #   before falling back to the host-agnostic routes.
+                params.clear()
+
+        host_units = units.get(None)
+        if host_units is None:
+            return None
+
+        return _find_in_units(host_units, path, params)
+
+    def _generate_finder(self, roots, host_roots):
+        """Generates and compiles the source code of the finder function."""
 
         self._return_values = []
         self._patterns = []
         self._converters = []
+        self._converter_specs = []
+
+        definitions = []
 
         self._ast = _CxParent()
+
+        if host_roots:
+            # NOTE: Generate a separate finder function for each host, and
+            #   select the right one (if any) with a single dict lookup
+            #   before searching the host-agnostic routes.
+            host_map = _CxLiteralMap('hosts')
+            definitions.append(host_map)
+
+            for host, host_specific_roots in host_roots.items():
+                finder = _CxFinder(len(definitions))
+                definitions.append(finder)
+                host_map.add_literal(host, finder)
+
+                self._generate_ast(
+                    host_specific_roots,
+                    finder,
+                    self._return_values,
+                    self._patterns,
+                    definitions
+                )
+
+            self._ast.append_child(_CxHostDispatch(host_map))
+
         self._generate_ast(
-            self._roots,
+            roots,
             self._ast,
             self._return_values,
-            self._patterns
+            self._patterns,
+            definitions
         )
 
+        # NOTE: Any literal maps must be defined after the finder functions
+        #   that they reference.
+        definitions.sort(key=lambda construct: isinstance(construct, _CxLiteralMap))
+        src_lines = [construct.src(0) + '\n' for construct in definitions]
+
+        if host_roots:
+            signature = 'def find(path, return_values, patterns, converters, params, host=None):'
+        else:
+            signature = 'def find(path, return_values, patterns, converters, params):'
+
+        src_lines += [
+            signature,
+            _TAB_STR + 'path_len = len(path)',
+        ]
+
         src_lines.append(self._ast.src(0))
 
         src_lines.append(
@@ -565,10 +897,179 @@ class CompiledRouter:
 
         self._finder_src = '\n'.join(src_lines)
 
-        scope = {}
-        exec(compile(self._finder_src, '<string>', 'exec'), scope)
+        return compile(self._finder_src, '<string>', 'exec')
+
+    def _iter_nodes(self):
+        """Yields a (path, node) tuple for every node in the routing trees.
+
+        The path is a tuple composed of the route's host (or ``None`` for
+        host-agnostic routes), followed by the raw template segments leading
+        to the node. Therefore, the path uniquely identifies the node.
+        """
+
+        def walk(nodes, parent_path):
+            for node in nodes:
+                path = parent_path + (node.raw_segment,)
+                yield path, node
+                yield from walk(node.children, path)
+
+        yield from walk(self._roots, (None,))
+        for host, roots in self._host_roots.items():
+            yield from walk(roots, (host,))
+
+    def _get_finder_cache_path(self):
+        """Returns the path of the finder cache file for the current routes.
+
+        The name of the file is derived from a hash of everything that
+        influences the generated code, namely the routing tree, the
+        converters, and the framework and interpreter versions.
+
+        Returns:
+            str: Path to the cache file, or ``None`` if the cache is
+            disabled.
+        """
+
+        cache_dir = self._options.finder_cache_dir
+        if cache_dir is None:
+            return None
+
+        key = hashlib.sha256()
+        key.update(repr((
+            __version__,
+            sys.implementation.cache_tag,
+            _LITERAL_DISPATCH_THRESHOLD,
+            sorted(
+                (name, klass.__module__, klass.__qualname__)
+                for name, klass in self._converter_map.items()
+            ),
+        )).encode())
+
+        for path, node in self._iter_nodes():
+            key.update(repr((path, node.resource is not None)).encode())
+
+        filename = 'falcon-router-{0}.marshal'.format(key.hexdigest())
+        return os.path.join(cache_dir, filename)
+
+    def _load_finder(self, cache_path):
+        """Loads the compiled finder previously saved by _save_finder().
+
+        Returns:
+            code: The compiled code of the finder module, or ``None`` if the
+            cache file does not exist or could not be loaded.
+        """
+
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                (
+                    finder_src,
+                    code,
+                    return_value_paths,
+                    pattern_texts,
+                    converter_specs,
+                ) = marshal.load(cache_file)
+
+            nodes = dict(self._iter_nodes())
+            return_values = [nodes[path] for path in return_value_paths]
+            patterns = [re.compile(pattern_text) for pattern_text in pattern_texts]
+            converters = [
+                self._instantiate_converter(self._converter_map[converter_name],
+                                            converter_argstr)
+                for converter_name, converter_argstr in converter_specs
+            ]
+        except (OSError, EOFError, KeyError, TypeError, ValueError):
+            return None
+
+        self._ast = None
+        self._finder_src = finder_src
+        self._return_values = return_values
+        self._patterns = patterns
+        self._converters = converters
+        self._converter_specs = list(converter_specs)
+
+        return code
+
+    def _save_finder(self, cache_path, code):
+        """Saves the compiled finder, to be loaded later by _load_finder()."""
+
+        paths = {id(node): path for path, node in self._iter_nodes()}
+        data = (
+            self._finder_src,
+            code,
+            [paths[id(node)] for node in self._return_values],
+            [pattern.pattern for pattern in self._patterns],
+            self._converter_specs,
+        )
+
+        # NOTE: Write to a temporary file first, and then atomically move
+        #   it into place, so that other processes never observe a
+        #   partially-written cache file.
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+        except OSError:
+            # NOTE: The cache is merely an optimization, so carry on.
+            return
+
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                marshal.dump(data, tmp_file)
+
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:  # pragma: nocover
+                pass
+
+    def _load_native_finder(self, cache_path):
+        """Loads the extension module built by build_native_finder().
+
+        Returns:
+            The native find function, or ``None`` if the extension module
+            does not exist, could not be loaded, or was built from a
+            different finder source.
+        """
+
+        module_name, module_path = _get_native_finder_location(cache_path)
+
+        module = sys.modules.get(module_name)
+        if module is None:
+            if not os.path.exists(module_path):
+                return None
+
+            try:
+                spec = importlib.util.spec_from_file_location(module_name, module_path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+            except ImportError:
+                return None
+
+            # NOTE: Extension modules can not be reinitialized, so hang on
+            #   to the module for subsequent compilations.
+            sys.modules[module_name] = module
+
+        # NOTE: The finder source, and the order of the return values,
+        #   patterns and converters that it references, should be the same
+        #   for the same route table. Verify it anyway, in case any of the
+        #   generated code has changed without affecting the hash.
+        if getattr(module, 'finder_src_digest', None) != _digest(self._finder_src):
+            return None
+
+        return module.find
+
+    def _add_converter(self, converter_name, converter_argstr):
+        """Instantiates a converter for the finder, and returns its index."""
 
-        return scope['find']
+        converter_class = self._converter_map[converter_name]
+
+        converter_obj = self._instantiate_converter(
+            converter_class,
+            converter_argstr
+        )
+        converter_idx = len(self._converters)
+        self._converters.append(converter_obj)
+        self._converter_specs.append((converter_name, converter_argstr))
+
+        return converter_idx
 
     def _instantiate_converter(self, klass, argstr=None):
         if argstr is None:
@@ -578,7 +1079,8 @@ class CompiledRouter:
         src = '{0}({1})'.format(klass.__name__, argstr)
         return eval(src, {klass.__name__: klass})
 
-    def _compile_and_find(self, path, _return_values, _patterns, _converters, params):
+    def _compile_and_find(self, path, _return_values, _patterns, _converters, params,
+                          host=None):
         """Compile the router, sets the `_find` attribute and returns its result.
 
         This method is set to the `_find` attribute to delay the compilation of the
@@ -593,11 +1095,106 @@ class CompiledRouter:
                 self._find = self._compile()
         # NOTE(caselit): return_values, patterns, converters are reset by the _compile
         # method, so the updated ones must be used
+        if host is None:
+            return self._find(
+                path, self._return_values, self._patterns, self._converters, params
+            )
+
         return self._find(
-            path, self._return_values, self._patterns, self._converters, params
+            path, self._return_values, self._patterns, self._converters, params, host
         )
 
 
+_NATIVE_FINDER_HEADER = """\
+# cython: language_level=3
+
+from datetime import datetime
+from uuid import UUID
+
+# NOTE: Referenced by the inlined built-in converters
+strptime = datetime.strptime
+
+finder_src_digest = {0!r}
+
+
+"""
+
+
+def _digest(finder_src):
+    return hashlib.sha256(finder_src.encode()).hexdigest()
+
+
+def _get_native_finder_location(cache_path):
+    """Returns the module name and path of the native finder extension."""
+
+    cache_dir, filename = os.path.split(cache_path)
+    module_name = os.path.splitext(filename)[0].replace('-', '_')
+    filename = module_name + importlib.machinery.EXTENSION_SUFFIXES[0]
+
+    return module_name, os.path.join(cache_dir, filename)
+
+
+def _build_native_finder(module_name, module_path, finder_src):
+    """Builds the finder source into an extension module with Cython."""
+
+    from Cython.Build import cythonize
+    from setuptools import Distribution, Extension
+
+    # NOTE: Build in a temporary directory on the same file system, so
+    #   that the extension can be atomically moved into place.
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(module_path)) as build_dir:
+        pyx_path = os.path.join(build_dir, module_name + '.pyx')
+        with open(pyx_path, 'w', encoding='utf-8') as pyx_file:
+            pyx_file.write(_NATIVE_FINDER_HEADER.format(_digest(finder_src)))
+            pyx_file.write(finder_src)
+
+        ext_modules = cythonize(
+            [Extension(module_name, [pyx_path])],
+            build_dir=build_dir,
+            quiet=True,
+        )
+
+        dist = Distribution({'ext_modules': ext_modules})
+        build_ext = dist.get_command_obj('build_ext')
+        build_ext.build_lib = build_dir
+        build_ext.build_temp = build_dir
+        build_ext.ensure_finalized()
+        build_ext.run()
+
+        os.replace(build_ext.get_ext_fullpath(module_name), module_path)
+
+
+def _exec_finder(code):
+    """Executes the compiled finder module, and returns its find function."""
+
+    scope = {
+        # NOTE: Referenced by the inlined built-in converters
+        'strptime': converters.strptime,
+        'UUID': uuid.UUID,
+    }
+    exec(code, scope)
+
+    return scope['find']
+
+
+def _find_in_units(units, path, params):
+    """Searches the finder units compiled for a single host (or for none)."""
+
+    unit = units.get(path[0])
+    if unit is not None:
+        node = unit.find(path, unit.return_values, unit.patterns, unit.converters, params)
+        if node is not None:
+            return node
+
+    # NOTE: Fall back to the routes that start with a field expression, in
+    #   the same way that the generated code would do at any other level.
+    unit = units.get(None)
+    if unit is not None:
+        return unit.find(path, unit.return_values, unit.patterns, unit.converters, params)
+
+    return None
+
+
 class CompiledRouterNode:
     """Represents a single URI segment in a URI."""
 
@@ -815,15 +1412,231 @@ class CompiledRouterOptions:
                 manner.
 
             (See also: :ref:`Field Converters <routing_field_converters>`)
+
+        cache_size (int): Maximum number of lookup results to retain in a
+            least-recently-used cache keyed by the requested path
+            (default ``0``, i.e., the cache is disabled).
+
+            When most of the traffic is concentrated on a relatively small
+            set of URLs, enabling the cache allows the router to skip
+            splitting the path and running the compiled search logic for
+            these paths altogether. Negative results (i.e., paths that do
+            not match any route) are cached as well.
+
+            The cache is cleared whenever a new route is added, and resized
+            whenever the router is (re)compiled. Therefore, this option
+            should normally be set before adding any routes::
+
+                app.router_options.cache_size = 1024
+
+            Warning:
+                Converted field values are cached along with the matched
+                route, and the same values are passed to the responder on
+                every hit (although the ``params`` dict itself is always a
+                fresh copy). Therefore, this option should not be used
+                together with custom converters that return mutable
+                objects, or that depend on anything other than the field
+                value itself.
+
+            (See also: :attr:`cache_info`)
+
+        finder_cache_dir (str): Path to an existing directory in which to
+            persist the compiled routing logic (default ``None``, i.e., the
+            routing logic is compiled from scratch by every process).
+
+            When set, the router saves the compiled code of its search
+            function in this directory. Subsequent processes serving the
+            same set of routes, such as freshly forked workers or new
+            serverless instances, then load the code from the cache file
+            rather than regenerating and recompiling it. Cache files are
+            named after a hash of the route table, converters, and Falcon
+            and Python versions; thus, a stale file is never used.
+
+            In addition, the search function may be compiled to native
+            code, and saved in this directory, by calling
+            :meth:`~.CompiledRouter.build_native_finder`.
+
+            Warning:
+                The cache files contain executable code. Therefore, the
+                directory must not be writable by anyone other than the
+                account running the application.
+
+        incremental_compile (bool): Set to ``True`` to compile the routing
+            logic piecemeal, so that adding a route to an application that
+            is already serving requests only requires recompiling the
+            routes that share its first path segment (default ``False``).
+
+            By default, adding a route causes the entire routing tree to be
+            regenerated and recompiled upon the next request, which may
+            result in a noticeable latency spike for applications that
+            register routes at runtime and have a large number of them.
+            When this option is enabled, the router instead compiles a
+            separate search function for each distinct literal first
+            segment (plus one for all the routes that start with a field
+            expression), and selects the right one with a dict lookup.
+            This incurs a small overhead on every lookup, and the
+            ``finder_cache_dir`` option is not taken into account.
     """
 
-    __slots__ = ('converters',)
+    __slots__ = (
+        'converters',
+        'cache_size',
+        'finder_cache_dir',
+        'incremental_compile',
+        '_cache',
+    )
 
     def __init__(self):
         self.converters = ConverterDict(
             (name, converter) for name, converter in converters.BUILTIN
         )
 
+        self.cache_size = 0
+        self.finder_cache_dir = None
+        self.incremental_compile = False
+        self._cache = None
+
+    @property
+    def cache_info(self):
+        """Statistics for the lookup cache enabled via :attr:`cache_size`.
+
+        The statistics are returned as a named tuple of the form
+        ``(hits, misses, maxsize, currsize)``, similar to the one returned by
+        the ``cache_info()`` method of a function decorated with
+        :func:`functools.lru_cache`. When the cache is disabled, or the
+        router has not been compiled yet, all the members are ``0``.
+
+        Note:
+            In multi-threaded deployments, the counters are not synchronized
+            and should therefore be regarded as approximate.
+        """
+
+        cache = self._cache
+        if cache is None:
+            return RouteCacheInfo(0, 0, 0, 0)
+
+        return RouteCacheInfo(cache.hits, cache.misses, cache.maxsize, len(cache))
+
+
+def compile_uri_builder(uri_template):
+    """Compile a function that expands the given URI template into a path.
+
+    The template may use the full syntax supported by
+    :class:`~.CompiledRouter`, including field converters and complex
+    segments. The builder encodes each field value with
+    :func:`falcon.uri.encode_value`, after converting it to a ``str``
+    (if it is not one already); any converter specification in the
+    template is ignored. For example::
+
+        field_names, build = compile_uri_builder('/repos/{org}/{repo:int}')
+
+        # '/repos/falcon%20team/42'
+        path = build({'org': 'falcon team', 'repo': 42})
+
+    Args:
+        uri_template (str): The template to compile.
+
+    Returns:
+        tuple: (field_names, builder), where ``field_names`` is a frozenset
+        of the names of the fields in the template, and ``builder`` is a
+        function that takes a dict of field values and returns the
+        resulting path. A ``KeyError`` is raised by the builder in the case
+        that the dict is missing any of the fields (any additional items are
+        simply ignored).
+    """
+
+    if not isinstance(uri_template, str):
+        raise TypeError('uri_template is not a string')
+
+    expressions = []
+    field_names = []
+    literal_start = 0
+
+    for field in _FIELD_PATTERN.finditer(uri_template):
+        literal = uri_template[literal_start:field.start()]
+        if literal:
+            expressions.append(repr(encode(literal)))
+
+        name = field.group('fname')
+        if not _IDENTIFIER_PATTERN.match(name) or name in field_names:
+            msg = 'Invalid or duplicate field name in URI template: "{0}"'.format(name)
+            raise ValueError(msg)
+
+        field_names.append(name)
+        expressions.append('encode_value(str(fields[{0!r}]))'.format(name))
+
+        literal_start = field.end()
+
+    literal = uri_template[literal_start:]
+    if literal or not expressions:
+        expressions.append(repr(encode(literal)))
+
+    src = 'def build(fields):\n{0}return {1}'.format(_TAB_STR, ' + '.join(expressions))
+
+    scope = {'encode_value': encode_value}
+    exec(compile(src, '<string>', 'exec'), scope)
+
+    return frozenset(field_names), scope['build']
+
+
+# NOTE: Sentinel used to distinguish a cache miss from a cached
+#   negative result (None).
+_CACHE_MISS = object()
+
+
+class _RouteCache:
+    """A simple size-bounded LRU cache of router lookup results.
+
+    The cache avoids taking a lock on the hot (hit) path; the relevant
+    OrderedDict operations are atomic under the GIL, and a concurrent
+    eviction is simply tolerated. Insertions and evictions are serialized
+    with a lock, since they are only performed on a miss anyway.
+    """
+
+    __slots__ = ('hits', 'maxsize', 'misses', '_entries', '_lock')
+
+    def __init__(self, maxsize):
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key):
+        entries = self._entries
+
+        try:
+            entry = entries[key]
+        except KeyError:
+            return _CACHE_MISS
+
+        try:
+            entries.move_to_end(key)
+        except KeyError:
+            # NOTE: The entry has just been evicted by another thread.
+            pass
+
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        entries = self._entries
+
+        with self._lock:
+            self.misses += 1
+
+            entries[key] = entry
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
 
 # --------------------------------------------------------------------
 # AST Constructs
@@ -889,6 +1702,99 @@ class _CxIfPathSegmentLiteral(_CxParent):
         )
 
 
+class _CxFinder(_CxParent):
+    def __init__(self, finder_idx):
+        super(_CxFinder, self).__init__()
+        self.name = 'find_{0}'.format(finder_idx)
+
+    def src(self, indentation):
+        lines = [
+            '{0}def {1}(path, path_len, return_values, patterns, converters, params):'.format(
+                _TAB_STR * indentation,
+                self.name,
+            ),
+            self._children_src(indentation + 1),
+        ]
+
+        # PERF: Explicit return of None is faster than implicit
+        if not isinstance(self._children[-1], _CxReturnNone):
+            lines.append(_CxReturnNone().src(indentation + 1))
+
+        return '\n'.join(lines)
+
+
+class _CxLiteralMap:
+    def __init__(self, name):
+        self.name = name
+        self._finders = []
+
+    def add_literal(self, literal, finder):
+        self._finders.append((literal, finder))
+
+    def src(self, indentation):
+        lines = ['{0}{1} = {{'.format(_TAB_STR * indentation, self.name)]
+        lines += [
+            '{0}{1!r}: {2},'.format(_TAB_STR * (indentation + 1), literal, finder.name)
+            for literal, finder in self._finders
+        ]
+        lines.append('{0}}}'.format(_TAB_STR * indentation))
+
+        return '\n'.join(lines)
+
+
+class _CxLiteralDispatch:
+    def __init__(self, segment_idx, map_idx, fast_return):
+        self.literal_map = _CxLiteralMap('literals_{0}'.format(map_idx))
+        self._segment_idx = segment_idx
+        self._fast_return = fast_return
+
+    def src(self, indentation):
+        call = 'finder(path, path_len, return_values, patterns, converters, params)'
+
+        lines = [
+            '{0}finder = {1}.get(path[{2}])'.format(
+                _TAB_STR * indentation,
+                self.literal_map.name,
+                self._segment_idx,
+            ),
+            '{0}if finder is not None:'.format(_TAB_STR * indentation),
+        ]
+
+        if self._fast_return:
+            # NOTE: Only a single literal may match the segment, and there
+            #   are no field expressions to fall back to at this level.
+            lines.append('{0}return {1}'.format(_TAB_STR * (indentation + 1), call))
+        else:
+            lines += [
+                '{0}node = {1}'.format(_TAB_STR * (indentation + 1), call),
+                '{0}if node is not None:'.format(_TAB_STR * (indentation + 1)),
+                '{0}return node'.format(_TAB_STR * (indentation + 2)),
+            ]
+
+        return '\n'.join(lines)
+
+
+class _CxHostDispatch:
+    def __init__(self, host_map):
+        self._host_map = host_map
+
+    def src(self, indentation):
+        lines = [
+            '{0}finder = {1}.get(host)'.format(_TAB_STR * indentation, self._host_map.name),
+            '{0}if finder is not None:'.format(_TAB_STR * indentation),
+            '{0}node = finder(path, path_len, return_values, patterns, converters, params)'.format(
+                _TAB_STR * (indentation + 1),
+            ),
+            '{0}if node is not None:'.format(_TAB_STR * (indentation + 1)),
+            '{0}return node'.format(_TAB_STR * (indentation + 2)),
+            # NOTE: Discard any fields that were set by a partial match
+            #   before falling back to the host-agnostic routes.
+            '{0}params.clear()'.format(_TAB_STR * (indentation + 1)),
+        ]
+
+        return '\n'.join(lines)
+
+
 class _CxIfPathSegmentPattern(_CxParent):
     def __init__(self, segment_idx, pattern_idx, pattern_text):
         super(_CxIfPathSegmentPattern, self).__init__()
@@ -918,12 +1824,12 @@ class _CxIfConverterField(_CxParent):
         self._converter_idx = converter_idx
 
     def src(self, indentation):
-        lines = [
-            '{0}field_value = converters[{1}].convert(fragment)'.format(
+        lines = self._convert_src(indentation)
+        lines += [
+            '{0}if field_value is not None{1}:'.format(
                 _TAB_STR * indentation,
-                self._converter_idx,
+                ''.join(' and ' + check for check in self._checks()),
             ),
-            '{0}if field_value is not None:'.format(_TAB_STR * indentation),
             "{0}params['{1}'] = field_value".format(
                 _TAB_STR * (indentation + 1),
                 self._field_name,
@@ -933,6 +1839,108 @@ class _CxIfConverterField(_CxParent):
 
         return '\n'.join(lines)
 
+    def _convert_src(self, indentation):
+        return [
+            '{0}field_value = converters[{1}].convert(fragment)'.format(
+                _TAB_STR * indentation,
+                self._converter_idx,
+            ),
+        ]
+
+    def _checks(self):
+        return ()
+
+
+class _CxIfIntConverterField(_CxIfConverterField):
+    """Inlined equivalent of :meth:`~falcon.routing.IntConverter.convert`."""
+
+    def __init__(self, field_name, converter_idx, num_digits, min, max):
+        super(_CxIfIntConverterField, self).__init__(field_name, converter_idx)
+        self._num_digits = num_digits
+        self._min = min
+        self._max = max
+
+    def _convert_src(self, indentation):
+        checks = ['fragment.strip() == fragment']
+        if self._num_digits is not None:
+            checks.insert(0, 'len(fragment) == {0}'.format(self._num_digits))
+
+        return [
+            '{0}field_value = None'.format(_TAB_STR * indentation),
+            '{0}if {1}:'.format(_TAB_STR * indentation, ' and '.join(checks)),
+            '{0}try:'.format(_TAB_STR * (indentation + 1)),
+            '{0}field_value = int(fragment)'.format(_TAB_STR * (indentation + 2)),
+            '{0}except ValueError:'.format(_TAB_STR * (indentation + 1)),
+            '{0}pass'.format(_TAB_STR * (indentation + 2)),
+        ]
+
+    def _checks(self):
+        checks = []
+        if self._min is not None:
+            checks.append('field_value >= {0!r}'.format(self._min))
+        if self._max is not None:
+            checks.append('field_value <= {0!r}'.format(self._max))
+
+        return checks
+
+
+class _CxIfCallConverterField(_CxIfConverterField):
+    """Inlined equivalent of a converter that wraps a single function call.
+
+    The function must either return the converted value, or raise
+    ``ValueError``, as is the case for the ``dt`` and ``uuid`` converters.
+    """
+
+    def __init__(self, field_name, converter_idx, call):
+        super(_CxIfCallConverterField, self).__init__(field_name, converter_idx)
+        self._call = call
+
+    def _convert_src(self, indentation):
+        return [
+            '{0}try:'.format(_TAB_STR * indentation),
+            '{0}field_value = {1}'.format(_TAB_STR * (indentation + 1), self._call),
+            '{0}except ValueError:'.format(_TAB_STR * indentation),
+            '{0}field_value = None'.format(_TAB_STR * (indentation + 1)),
+        ]
+
+
+def _create_converter_field(field_name, converter_idx, converter):
+    """Create the construct that converts and sets the given field.
+
+    The built-in converters are inlined into the finder source, saving a
+    method call (and a number of attribute lookups) per converted field.
+    Any other converter, including subclasses of the built-in ones, is
+    invoked via its ``convert()`` method.
+    """
+
+    converter_type = type(converter)
+
+    if converter_type is converters.IntConverter:
+        # NOTE: Only inline limits that can be faithfully represented as
+        #   int literals; anything else is left to convert().
+        if all(type(limit) is int or limit is None
+               for limit in (converter._min, converter._max)):
+            return _CxIfIntConverterField(
+                field_name,
+                converter_idx,
+                converter._num_digits,
+                converter._min,
+                converter._max,
+            )
+
+    elif converter_type is converters.DateTimeConverter:
+        if type(converter._format_string) is str:
+            return _CxIfCallConverterField(
+                field_name,
+                converter_idx,
+                'strptime(fragment, {0!r})'.format(converter._format_string),
+            )
+
+    elif converter_type is converters.UUIDConverter:
+        return _CxIfCallConverterField(field_name, converter_idx, 'UUID(fragment)')
+
+    return _CxIfConverterField(field_name, converter_idx)
+
 
 class _CxSetFragmentFromField:
     def __init__(self, field_name):
@@ -2,6 +2,7 @@ from functools import partial
 import io
 import os
 import re
+import stat
 
 import falcon
 from falcon.util.sync import get_loop
@@ -107,13 +108,17 @@ class StaticRoute:
         if '..' in file_path or not file_path.startswith(self._directory):
             raise falcon.HTTPNotFound()
 
+        # PERF: For HEAD requests, the body is discarded anyway, so just stat
+        #   the file in order to set the Content-Length header.
+        load = _stat_file if req.method == 'HEAD' else _open_file
+
         try:
-            resp.stream = io.open(file_path, 'rb')
+            load(resp, file_path)
         except IOError:
             if self._fallback_filename is None:
                 raise falcon.HTTPNotFound()
             try:
-                resp.stream = io.open(self._fallback_filename, 'rb')
+                load(resp, self._fallback_filename)
                 file_path = self._fallback_filename
             except IOError:
                 raise falcon.HTTPNotFound()
@@ -135,7 +140,8 @@ class StaticRouteAsync(StaticRoute):
         super().__call__(req, resp)
 
         # NOTE(kgriffs): Fixup resp.stream so that it is non-blocking
-        resp.stream = _AsyncFileReader(resp.stream)
+        if resp.stream is not None:
+            resp.stream = _AsyncFileReader(resp.stream)
 
 
 class _AsyncFileReader:
@@ -147,3 +153,20 @@ class _AsyncFileReader:
 
     async def read(self, size=-1):
         return await self._loop.run_in_executor(None, partial(self._file.read, size))
+
+    async def close(self):
+        self._file.close()
+
+
+def _open_file(resp, file_path):
+    resp.stream = io.open(file_path, 'rb')
+
+
+def _stat_file(resp, file_path):
+    # NOTE: Mirror the conditions under which io.open() would fail to open
+    #   the file for reading.
+    file_stat = os.stat(file_path)
+    if not stat.S_ISREG(file_stat.st_mode) or not os.access(file_path, os.R_OK):
+        raise IOError('Not a readable file: ' + file_path)
+
+    resp.content_length = file_stat.st_size
@@ -153,6 +153,57 @@ class BufferedReader:
         self._buffer_pos = read_size
         return result + self._buffer[:read_size]
 
+    def readinto(self, buffer):
+        # PERF: In Cython, bind types:
+        #   cdef Py_ssize_t size
+        #   cdef Py_ssize_t available
+        #   cdef Py_ssize_t pos
+        #   cdef bytes chunk
+        #   cdef Py_ssize_t chunk_len
+
+        view = memoryview(buffer).cast('B')
+        size = self._normalize_size(len(view))
+        available = self._buffer_len - self._buffer_pos
+
+        # NOTE: Copy directly from the buffer without slicing it first.
+        if size <= available:
+            view[:size] = memoryview(self._buffer)[
+                self._buffer_pos:self._buffer_pos + size]
+            self._buffer_pos += size
+            return size
+
+        view[:available] = memoryview(self._buffer)[self._buffer_pos:]
+        self._buffer = b''
+        self._buffer_len = 0
+        self._buffer_pos = 0
+
+        # NOTE: Pass the rest through, copying each chunk just once.
+        pos = available
+        while pos < size:
+            chunk = self._read_func(size - pos)
+            chunk_len = len(chunk)
+            if chunk_len == 0:
+                # NOTE: The EOF.
+                self._max_bytes_remaining = 0
+                break
+
+            self._max_bytes_remaining -= chunk_len
+
+            # NOTE: Never trust the read function to honor the size
+            #   requested; retain any excess data in the buffer rather
+            #   than writing past the end of the target.
+            if chunk_len > size - pos:
+                view[pos:size] = memoryview(chunk)[:size - pos]
+                self._buffer = chunk
+                self._buffer_len = chunk_len
+                self._buffer_pos = size - pos
+                return size
+
+            view[pos:pos + chunk_len] = chunk
+            pos += chunk_len
+
+        return pos
+
     def read_until(self, delimiter, size=-1, consume_delimiter=False):
         # PERF(vytas): In Cython, bind types:
         #   cdef Py_ssize_t read_size
@@ -0,0 +1,39 @@
+import falcon
+import falcon.asgi
+import falcon.testing as testing
+
+
+class ThingsResource:
+    @falcon.query_params({
+        'limit': falcon.Param(int, default=5, max_value=10),
+        'tags': falcon.Param(list, default=[]),
+    }, is_async=True)
+    async def on_get(self, req, resp, query):
+        query.tags.append('x')
+        resp.media = {'limit': query.limit, 'tags': query.tags}
+
+
+@falcon.query_params({'limit': falcon.Param(int, default=5)})
+class AutoDetectedResource:
+    async def on_get(self, req, resp, query):
+        resp.media = query.limit
+
+
+def test_async_responder():
+    app = falcon.asgi.App()
+    app.add_route('/', ThingsResource())
+
+    for _ in range(2):
+        assert testing.simulate_get(app, '/').json == {'limit': 5, 'tags': ['x']}
+
+    result = testing.simulate_get(app, '/', params={'limit': 7, 'tags': 'a'})
+    assert result.json == {'limit': 7, 'tags': ['a', 'x']}
+
+    assert testing.simulate_get(app, '/', params={'limit': 11}).status_code == 400
+
+
+def test_auto_detected_coroutine():
+    app = falcon.asgi.App()
+    app.add_route('/', AutoDetectedResource())
+
+    assert testing.simulate_get(app, '/', params={'limit': 3}).json == 3
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 import falcon
@@ -84,3 +86,55 @@ class TestRequestBody:
 
         _repr = '<%s: %s %r>' % (req.__class__.__name__, req.method, req.url)
         assert req.__repr__() == _repr
+
+
+class SpoolingMiddleware:
+    async def process_request(self, req, resp):
+        req.context.peeked = (await req.spool_body()).read()
+
+
+class SpooledBodyResource:
+    async def on_post(self, req, resp):
+        resp.media = {
+            'peeked': len(req.context.peeked),
+            'media': await req.get_media(),
+            'again': len((await req.spool_body()).read()),
+        }
+
+    async def on_put(self, req, resp):
+        resp.media = {
+            'peeked': req.context.peeked.decode(),
+            'stream': (await req.stream.read()).decode(),
+        }
+
+
+class TestSpooledBody:
+    @pytest.fixture
+    def client(self):
+        app = falcon.asgi.App(middleware=[SpoolingMiddleware()])
+        app.req_options.body_spool_threshold = SIZE_1_KB
+        app.add_route('/', SpooledBodyResource())
+        return testing.TestClient(app)
+
+    @pytest.mark.parametrize('size', [0, 10, SIZE_1_KB, 200 * SIZE_1_KB])
+    def test_spooled_media(self, client, size):
+        doc = {'data': 'x' * size}
+        expected_len = len(json.dumps(doc))
+
+        result = client.simulate_post('/', json=doc)
+        assert result.json == {
+            'peeked': expected_len,
+            'media': doc,
+            'again': expected_len,
+        }
+
+    def test_spooled_stream(self, client):
+        result = client.simulate_put('/', body='Hello, spooled world!')
+        assert result.json == {
+            'peeked': 'Hello, spooled world!',
+            'stream': 'Hello, spooled world!',
+        }
+
+    def test_spooled_empty_body(self, client):
+        result = client.simulate_post('/')
+        assert result.json == {'peeked': 0, 'media': None, 'again': 0}
@@ -221,3 +221,45 @@ def test_media_rendered_cached():
         assert first is not await resp.render_body()
 
     runTest(test)
+
+
+class TestStreamedMedia:
+
+    @pytest.mark.parametrize('count', [0, 1, 1000, 2500])
+    @pytest.mark.parametrize('is_async', [True, False])
+    def test_json_iterator(self, count, is_async):
+        documents = [{'id': i, 'name': '♥ item {}'.format(i)} for i in range(count)]
+
+        async def agen():
+            for document in documents:
+                yield document
+
+        class Resource:
+            async def on_get(self, req, resp):
+                resp.media = agen() if is_async else iter(documents)
+
+        app = falcon.asgi.App()
+        app.add_route('/', Resource())
+
+        result = testing.simulate_get(app, '/')
+        assert result.status_code == 200
+        assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+        assert 'Content-Length' not in result.headers
+        assert result.json == documents
+
+    def test_fallback_handler(self):
+        class TextHandler(media.BaseHandler):
+            def serialize(self, media, content_type):
+                return '\n'.join(str(item) for item in media).encode()
+
+        async def agen():
+            for i in range(1, 4):
+                yield i
+
+        app = falcon.asgi.App()
+        app.resp_options.media_handlers[falcon.MEDIA_TEXT] = TextHandler()
+        app.add_route('/', SimpleMediaResource(agen(), falcon.MEDIA_TEXT))
+
+        result = testing.simulate_get(app, '/')
+        assert result.status_code == 200
+        assert result.text == '1\n2\n3'
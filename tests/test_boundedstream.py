@@ -15,3 +15,36 @@ def test_not_writable(bounded_stream):
 
     with pytest.raises(IOError):
         bounded_stream.write(b'something something')
+
+
+class NoReadIntoStream:
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=None):
+        return self._stream.read(size)
+
+
+@pytest.mark.parametrize('stream_type', [io.BytesIO, NoReadIntoStream])
+def test_readinto(stream_type):
+    bounded_stream = BoundedStream(stream_type(b'0123456789' * 2), 15)
+    buffer = bytearray(4)
+
+    assert bounded_stream.readinto(buffer) == 4
+    assert buffer == b'0123'
+    assert bounded_stream.read(4) == b'4567'
+
+    buffer = bytearray(16)
+    assert bounded_stream.readinto(buffer) == 7
+    assert buffer[:7] == b'8901234'
+    assert bounded_stream.eof
+    assert bounded_stream.readinto(buffer) == 0
+
+
+def test_readinto_premature_eof():
+    bounded_stream = BoundedStream(io.BytesIO(b'012'), 10)
+    buffer = bytearray(8)
+
+    assert bounded_stream.readinto(buffer) == 3
+    assert bounded_stream.readinto(buffer) == 0
+    assert bounded_stream.eof
@@ -348,3 +348,59 @@ def test_fragmented_reads(fragmented_stream):
     fragmented_stream.exhaust()
     assert fragmented_stream.read(4) == b''
     assert fragmented_stream.read() == b''
+
+
+@pytest.mark.parametrize('sizes', [
+    (1, 2, 3),
+    (7, 1024, 13),
+    (128 * 1024, 1, 300 * 1024),
+    (1024 * 1024, 8, 16),
+])
+def test_readinto(buffered_reader, sizes):
+    stream = buffered_reader(1024)
+    stream.read(5)
+    position = 5
+
+    for size in sizes:
+        buffer = bytearray(size)
+        assert stream.readinto(buffer) == size
+        assert buffer == TEST_DATA[position:position + size]
+        position += size
+
+        assert stream.peek(4) == TEST_DATA[position:position + 4]
+
+
+def test_readinto_eof(shorter_stream):
+    buffer = bytearray(2048)
+    assert shorter_stream.readinto(memoryview(buffer)[:100]) == 100
+    assert shorter_stream.readinto(buffer) == 1024 - 100
+    assert buffer[:1024 - 100] == TEST_DATA[100:1024]
+    assert shorter_stream.readinto(buffer) == 0
+
+
+def test_readinto_fragmented(fragmented_stream):
+    buffer = bytearray(100000)
+    assert fragmented_stream.readinto(buffer) == 100000
+    assert buffer == TEST_DATA[:100000]
+    assert fragmented_stream.read(16) == TEST_DATA[100000:100016]
+
+
+def test_readinto_oversized_reads():
+    class OversizedStream(io.BytesIO):
+        def read(self, size=-1):
+            return super().read(size * 2 if size > 0 else size)
+
+    stream = BufferedReader(OversizedStream(TEST_DATA[:4096]).read, 4096, 16)
+
+    buffer = bytearray(8)
+    assert stream.readinto(buffer) == 8
+    assert buffer == TEST_DATA[:8]
+
+    # NOTE: The excess data must not overflow the target.
+    target = bytearray(1024)
+    assert stream.readinto(memoryview(target)[:100]) == 100
+    assert target[:100] == TEST_DATA[8:108]
+    assert target[100:] == bytes(1024 - 100)
+
+    assert stream.read(16) == TEST_DATA[108:124]
+    assert stream.read() == TEST_DATA[124:4096]
@@ -1,10 +1,17 @@
+import hashlib
 from threading import Barrier, Thread
 from time import sleep
+import types
 from unittest.mock import MagicMock
 
 import pytest
 
-from falcon.routing import CompiledRouter
+from falcon.routing import compiled, CompiledRouter
+
+try:
+    import cython
+except ImportError:
+    cython = None
 
 
 def test_find_src(monkeypatch):
@@ -108,6 +115,268 @@ def test_multithread_compile(monkeypatch):
     mock.assert_called_once_with()
 
 
+@pytest.fixture
+def cached_router():
+    router = CompiledRouter()
+    router.options.cache_size = 2
+
+    router.add_route('/repos', MockResource())
+    router.add_route('/repos/{org}/{repo:int}', MockResource())
+
+    return router
+
+
+def test_cache_disabled_by_default():
+    router = CompiledRouter()
+    router.add_route('/foo', MockResource())
+
+    assert router.find('/foo') is not None
+    assert router.find('/foo') is not None
+    assert router.options.cache_info == (0, 0, 0, 0)
+
+
+def test_cache_hit(cached_router):
+    resource, method_map, params, uri_template = cached_router.find('/repos/falcon/42')
+    assert params == {'org': 'falcon', 'repo': 42}
+    assert cached_router.options.cache_info == (0, 1, 2, 1)
+
+    params['org'] = 'mutated'
+
+    route = cached_router.find('/repos/falcon/42')
+    assert route == (resource, method_map, {'org': 'falcon', 'repo': 42}, uri_template)
+    assert route[2] is not params
+    assert cached_router.options.cache_info == (1, 1, 2, 1)
+
+
+def test_cache_negative_result(cached_router):
+    assert cached_router.find('/repos/falcon/ninety') is None
+    assert cached_router.find('/repos/falcon/ninety') is None
+    assert cached_router.options.cache_info == (1, 1, 2, 1)
+
+
+def test_cache_eviction(cached_router):
+    cached_router.find('/repos')
+    cached_router.find('/repos/falcon/1')
+    cached_router.find('/repos')
+    cached_router.find('/repos/falcon/2')
+    assert cached_router.options.cache_info == (1, 3, 2, 2)
+
+    # NOTE: '/repos' was used more recently than '/repos/falcon/1'
+    cached_router.find('/repos')
+    cached_router.find('/repos/falcon/1')
+    assert cached_router.options.cache_info == (2, 4, 2, 2)
+
+
+def test_cache_invalidated_on_add_route(cached_router):
+    assert cached_router.find('/teams') is None
+
+    cached_router.add_route('/teams', MockResource())
+    assert cached_router.options.cache_info.currsize == 0
+    assert cached_router.find('/teams') is not None
+    assert cached_router.options.cache_info == (0, 2, 2, 1)
+
+
+def _create_router(finder_cache_dir, *uri_templates):
+    router = CompiledRouter()
+    router.options.finder_cache_dir = finder_cache_dir
+
+    for uri_template in uri_templates:
+        router.add_route(uri_template, MockResource())
+
+    return router
+
+
+_CACHED_TEMPLATES = (
+    '/repos',
+    '/repos/{org}/{repo:int(min=1)}',
+    '/repos/{org}/{repo:int(min=1)}/compare/{base}...{head:int}',
+    '/emojis/{name}.{ext}',
+)
+
+
+def test_finder_cache(tmpdir, monkeypatch):
+    router = _create_router(str(tmpdir), *_CACHED_TEMPLATES)
+    expected_src = router.finder_src
+
+    assert len(tmpdir.listdir()) == 1
+
+    generate_finder = MagicMock()
+    monkeypatch.setattr(CompiledRouter, '_generate_finder', generate_finder)
+    router = _create_router(str(tmpdir), *_CACHED_TEMPLATES)
+
+    assert router.finder_src == expected_src
+    assert router.find('/repos')[3] == '/repos'
+    assert router.find('/repos/falcon/0') is None
+    assert router.find('/repos/falcon/2') == (
+        router._return_values[1].resource,
+        router._return_values[1].method_map,
+        {'org': 'falcon', 'repo': 2},
+        '/repos/{org}/{repo:int(min=1)}',
+    )
+    assert router.find('/repos/falcon/2/compare/master...42')[2] == {
+        'org': 'falcon', 'repo': 2, 'base': 'master', 'head': 42}
+    assert router.find('/emojis/smile.png')[2] == {'name': 'smile', 'ext': 'png'}
+
+    assert not generate_finder.called
+
+
+def test_finder_cache_route_table_changed(tmpdir):
+    _create_router(str(tmpdir), '/foo').find('/foo')
+    _create_router(str(tmpdir), '/bar').find('/bar')
+
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_finder_cache_corrupted(tmpdir):
+    router = _create_router(str(tmpdir), *_CACHED_TEMPLATES)
+    router.find('/')
+
+    cache_file, = tmpdir.listdir()
+    cache_file.write_binary(b'garbage')
+
+    router = _create_router(str(tmpdir), *_CACHED_TEMPLATES)
+    assert router.find('/repos/falcon/2')[2] == {'org': 'falcon', 'repo': 2}
+    assert cache_file.read_binary() != b'garbage'
+
+
+def test_finder_cache_dir_missing(tmpdir):
+    router = _create_router(str(tmpdir.join('missing')), *_CACHED_TEMPLATES)
+    assert router.find('/repos/falcon/2')[2] == {'org': 'falcon', 'repo': 2}
+
+
+def test_build_native_finder_requires_cache_dir():
+    router = CompiledRouter()
+    router.add_route('/repos', MockResource())
+
+    with pytest.raises(ValueError):
+        router.build_native_finder()
+
+
+@pytest.mark.skipif(not cython, reason='Cython not installed')
+def test_build_native_finder(tmpdir):
+    router = _create_router(str(tmpdir), *_CACHED_TEMPLATES)
+    expected_src = router.finder_src
+
+    module_path = router.build_native_finder()
+    assert tmpdir.join(module_path.split('/')[-1]).check()
+
+    for router in (router, _create_router(str(tmpdir), *_CACHED_TEMPLATES)):
+        assert router.find('/repos/falcon/2')[2] == {'org': 'falcon', 'repo': 2}
+        assert router.find('/repos/falcon/0') is None
+        assert router.find('/emojis/smile.png')[2] == {'name': 'smile', 'ext': 'png'}
+
+        assert router.finder_src == expected_src
+        assert not isinstance(router._find, types.FunctionType)
+
+
+@pytest.mark.parametrize('matching_digest', [True, False])
+def test_load_native_finder(tmpdir, monkeypatch, matching_digest):
+    router = _create_router(str(tmpdir), *_CACHED_TEMPLATES)
+    finder_src = router.finder_src
+    module_name, __ = compiled._get_native_finder_location(
+        router._get_finder_cache_path())
+
+    module = types.ModuleType(module_name)
+    module.find = MagicMock(return_value=None)
+    module.finder_src_digest = hashlib.sha256(
+        (finder_src if matching_digest else 'def find(): pass').encode()
+    ).hexdigest()
+    monkeypatch.setitem(compiled.sys.modules, module_name, module)
+
+    router = _create_router(str(tmpdir), *_CACHED_TEMPLATES)
+    if matching_digest:
+        assert router.find('/repos') is None
+        assert module.find.called
+    else:
+        assert router.find('/repos')[3] == '/repos'
+        assert not module.find.called
+
+
+@pytest.fixture
+def incremental_router():
+    router = CompiledRouter()
+    router.options.incremental_compile = True
+
+    router.add_route('/repos', MockResource())
+    router.add_route('/repos/{org}/{repo}', MockResource())
+    router.add_route('/teams/{team}', MockResource())
+    router.add_route('/{org}/settings', MockResource())
+
+    return router
+
+
+def test_incremental_compile(incremental_router, monkeypatch):
+    assert incremental_router.find('/repos')[3] == '/repos'
+    assert incremental_router.find('/repos/falcon/falcon')[2] == {
+        'org': 'falcon', 'repo': 'falcon'}
+    assert incremental_router.find('/teams/core')[2] == {'team': 'core'}
+    assert incremental_router.find('/repos/settings')[2] == {'org': 'repos'}
+    assert incremental_router.find('/falcon/settings')[2] == {'org': 'falcon'}
+    assert incremental_router.find('/falcon') is None
+
+    generate_finder = MagicMock(side_effect=CompiledRouter._generate_finder)
+    monkeypatch.setattr(
+        CompiledRouter,
+        '_generate_finder',
+        lambda self, roots, host_roots: generate_finder(self, roots, host_roots),
+    )
+
+    incremental_router.add_route('/teams/{team}/members', MockResource())
+    incremental_router.add_route('/emojis', MockResource())
+    assert incremental_router.find('/teams/core/members')[2] == {'team': 'core'}
+    assert incremental_router.find('/emojis')[3] == '/emojis'
+
+    assert sorted(
+        [node.raw_segment for node in call[0][1]]
+        for call in generate_finder.call_args_list
+    ) == [['emojis'], ['teams']]
+
+    generate_finder.reset_mock()
+    incremental_router.add_route('/{org}/members', MockResource())
+    assert incremental_router.find('/falcon/members')[2] == {'org': 'falcon'}
+
+    generate_finder.assert_called_once_with(
+        incremental_router, [incremental_router._roots[2]], {})
+    assert incremental_router._roots[2].raw_segment == '{org}'
+
+
+def test_incremental_compile_src(incremental_router):
+    src = incremental_router.finder_src
+
+    assert src.count('def find(') == 3
+    assert "if path[0] == 'repos':" in src
+    assert "if path[0] == 'teams':" in src
+
+
+def test_incremental_compile_host():
+    router = CompiledRouter()
+    router.options.incremental_compile = True
+
+    router.add_route('/repos', MockResource())
+    router.add_route('/repos/{org}', MockResource(), host='API.example.com')
+
+    req = MagicMock(host='api.example.com')
+    assert router.find('/repos/falcon', req)[3] == '/repos/{org}'
+    assert router.find('/repos', req)[3] == '/repos'
+    assert router.find('/repos/falcon') is None
+
+    req.host = 'example.com'
+    assert router.find('/repos/falcon', req) is None
+    assert router.find('/repos', req)[3] == '/repos'
+
+
+@pytest.mark.parametrize('incremental_first', [True, False])
+def test_incremental_compile_toggled(incremental_router, incremental_first):
+    incremental_router.options.incremental_compile = incremental_first
+    assert incremental_router.find('/teams/core') is not None
+
+    incremental_router.add_route('/emojis', MockResource())
+    incremental_router.options.incremental_compile = not incremental_first
+    assert incremental_router.find('/emojis') is not None
+    assert incremental_router.find('/teams/core') is not None
+    assert (incremental_router._units is not None) is (not incremental_first)
+
+
 class MockResource:
     def on_get(self, req, res):
         pass
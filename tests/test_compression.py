@@ -0,0 +1,289 @@
+import gzip
+import io
+import zlib
+
+import pytest
+
+import falcon
+from falcon.middlewares import CompressionMiddleware, ConditionalGetMiddleware
+import falcon.testing as testing
+
+from _util import create_app  # NOQA
+
+
+SAMPLE_TEXT = 'All work and no play makes Jack a dull boy.\n' * 100
+SAMPLE_MEDIA = {'lines': SAMPLE_TEXT.splitlines()}
+
+
+class TextResource:
+    def on_get(self, req, resp):
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.body = SAMPLE_TEXT
+
+    on_head = on_get
+
+
+class MediaResource:
+    def on_get(self, req, resp):
+        resp.media = SAMPLE_MEDIA
+
+
+class SmallResource:
+    def on_get(self, req, resp):
+        resp.media = {'small': True}
+
+
+class ImageResource:
+    def on_get(self, req, resp):
+        resp.content_type = falcon.MEDIA_PNG
+        resp.data = b'\x89PNG' * 1000
+
+
+class UncompressedResource:
+    compression_level = 0
+
+    def on_get(self, req, resp):
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.body = SAMPLE_TEXT
+
+
+class FastResource:
+    compression_level = 1
+
+    def on_get(self, req, resp):
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.body = SAMPLE_TEXT
+
+
+class AsyncStream:
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+        self.closed = False
+
+    async def read(self, size=-1):
+        return self._stream.read(size)
+
+    async def close(self):
+        self.closed = True
+
+
+class StreamResource:
+    def __init__(self, asgi, iterable=False, content_length=None):
+        self._asgi = asgi
+        self._iterable = iterable
+        self._content_length = content_length
+        self.stream = None
+
+    def on_get(self, req, resp):
+        data = SAMPLE_TEXT.encode()
+        resp.content_type = falcon.MEDIA_TEXT
+        if self._content_length is not None:
+            resp.content_length = self._content_length
+
+        if self._iterable:
+            chunks = [data[i:i + 100] for i in range(0, len(data), 100)]
+            if self._asgi:
+                async def agen():
+                    for chunk in chunks:
+                        yield chunk
+
+                resp.stream = agen()
+            else:
+                resp.stream = iter(chunks)
+        else:
+            self.stream = AsyncStream(data) if self._asgi else io.BytesIO(data)
+            resp.stream = self.stream
+
+
+@pytest.fixture
+def client(asgi):
+    app = create_app(asgi, middleware=[CompressionMiddleware()])
+    app.add_route('/text', TextResource())
+    app.add_route('/media', MediaResource())
+    app.add_route('/small', SmallResource())
+    app.add_route('/image', ImageResource())
+    app.add_route('/uncompressed', UncompressedResource())
+    app.add_route('/fast', FastResource())
+
+    return testing.TestClient(app)
+
+
+def _decompress(result):
+    encoding = result.headers.get('Content-Encoding')
+    if encoding == 'gzip':
+        return gzip.decompress(result.content)
+    if encoding == 'deflate':
+        return zlib.decompress(result.content)
+
+    assert encoding is None
+    return result.content
+
+
+@pytest.mark.parametrize('accept_encoding, expected', [
+    ('gzip', 'gzip'),
+    ('deflate', 'deflate'),
+    ('gzip, deflate, br', 'gzip'),
+    ('deflate, gzip', 'gzip'),
+    ('gzip;q=0.5, deflate', 'deflate'),
+    ('GZIP;Q=0.9, deflate;q=0.8', 'gzip'),
+    ('*', 'gzip'),
+    ('*;q=0.5, gzip;q=0', 'deflate'),
+    ('gzip;q=0, deflate;q=0', None),
+    ('br', None),
+    ('identity', None),
+    ('', None),
+    (None, None),
+])
+def test_negotiation(client, accept_encoding, expected):
+    headers = {}
+    if accept_encoding is not None:
+        headers['Accept-Encoding'] = accept_encoding
+
+    result = client.simulate_get('/text', headers=headers)
+    assert result.status_code == 200
+    assert result.headers.get('Content-Encoding') == expected
+    assert result.headers['Vary'] == 'Accept-Encoding'
+    assert result.headers['Content-Length'] == str(len(result.content))
+    assert _decompress(result).decode() == SAMPLE_TEXT
+
+    if expected:
+        assert len(result.content) < len(SAMPLE_TEXT)
+
+
+def test_media(client):
+    result = client.simulate_get('/media', headers={'Accept-Encoding': 'gzip'})
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+    assert result.content != testing.simulate_get(client.app, '/media').content
+    assert falcon.media.JSONHandler().deserialize(
+        io.BytesIO(_decompress(result)), falcon.MEDIA_JSON, None) == SAMPLE_MEDIA
+
+
+@pytest.mark.parametrize('path', ['/small', '/image', '/uncompressed'])
+def test_not_compressed(client, path):
+    result = client.simulate_get(path, headers={'Accept-Encoding': 'gzip'})
+    assert result.status_code == 200
+    assert 'Content-Encoding' not in result.headers
+
+
+def test_vary_only_when_eligible(client):
+    assert client.simulate_get('/text').headers['Vary'] == 'Accept-Encoding'
+    assert 'Vary' not in client.simulate_get('/image').headers
+    assert 'Vary' not in client.simulate_get('/small').headers
+
+
+def test_vary_appended(asgi):
+    class Resource:
+        def on_get(self, req, resp):
+            resp.vary = ['Accept']
+            resp.etag = 'abc'
+            resp.body = SAMPLE_TEXT
+
+    app = create_app(asgi, middleware=[CompressionMiddleware()])
+    app.add_route('/', Resource())
+
+    result = testing.simulate_get(app, '/', headers={'Accept-Encoding': 'gzip'})
+    assert result.headers['Vary'] == 'Accept, Accept-Encoding'
+
+    # NOTE: The strong entity-tag no longer matches the representation.
+    assert result.headers['ETag'] == 'W/"abc"'
+
+
+def test_per_route_level(client):
+    default = client.simulate_get('/text', headers={'Accept-Encoding': 'deflate'})
+    fast = client.simulate_get('/fast', headers={'Accept-Encoding': 'deflate'})
+
+    assert _decompress(fast) == _decompress(default)
+    assert default.content == zlib.compress(SAMPLE_TEXT.encode())
+    assert fast.content == zlib.compress(SAMPLE_TEXT.encode(), 1)
+
+
+def test_head(client):
+    result = client.simulate_head('/text', headers={'Accept-Encoding': 'gzip'})
+    assert result.status_code == 200
+    assert 'Content-Encoding' not in result.headers
+    assert result.headers['Vary'] == 'Accept-Encoding'
+
+
+def test_head_not_rendered():
+    def render_body():
+        pytest.fail('The body of a HEAD response should not be rendered')
+
+    req = testing.create_req(method='HEAD', headers={'Accept-Encoding': 'gzip'})
+    resp = falcon.Response()
+    resp.content_type = falcon.MEDIA_TEXT
+    resp.body = SAMPLE_TEXT
+    resp.render_body = render_body
+
+    CompressionMiddleware().process_response(req, resp, TextResource(), True)
+    assert resp.get_header('Vary') == 'Accept-Encoding'
+    assert resp.get_header('Content-Encoding') is None
+
+
+@pytest.mark.parametrize('iterable', [True, False])
+def test_stream(asgi, iterable):
+    resource = StreamResource(asgi, iterable=iterable, content_length=len(SAMPLE_TEXT))
+    app = create_app(asgi, middleware=[CompressionMiddleware()])
+    app.add_route('/', resource)
+
+    result = testing.simulate_get(app, '/', headers={'Accept-Encoding': 'gzip'})
+    assert result.status_code == 200
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in result.headers
+    assert len(result.content) < len(SAMPLE_TEXT)
+    assert _decompress(result).decode() == SAMPLE_TEXT
+
+    if not iterable:
+        assert resource.stream.closed
+
+
+def test_stream_small_content_length(asgi):
+    resource = StreamResource(asgi, content_length=100)
+    app = create_app(asgi, middleware=[CompressionMiddleware(min_size=1024)])
+    app.add_route('/', resource)
+
+    result = testing.simulate_get(app, '/', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in result.headers
+    assert 'Vary' not in result.headers
+
+
+def test_stream_malformed_content_length(asgi):
+    resource = StreamResource(asgi, content_length='many')
+    app = create_app(asgi, middleware=[CompressionMiddleware()])
+    app.add_route('/', resource)
+
+    result = testing.simulate_get(app, '/', headers={'Accept-Encoding': 'gzip'})
+    assert result.status_code == 200
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in result.headers
+    assert _decompress(result).decode() == SAMPLE_TEXT
+
+
+def test_conditional_get(asgi):
+    app = create_app(asgi, middleware=[CompressionMiddleware(), ConditionalGetMiddleware()])
+    app.add_route('/', TextResource())
+
+    result = testing.simulate_get(app, '/', headers={'Accept-Encoding': 'gzip'})
+    assert result.headers['Content-Encoding'] == 'gzip'
+    etag = result.headers['ETag']
+
+    result = testing.simulate_get(
+        app, '/', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert result.status_code == 304
+    assert 'Content-Encoding' not in result.headers
+    assert not result.content
+
+
+def test_streamed_media(asgi):
+    class Resource:
+        def on_get(self, req, resp):
+            resp.media = iter(SAMPLE_MEDIA['lines'])
+
+    app = create_app(asgi, middleware=[CompressionMiddleware()])
+    app.add_route('/', Resource())
+
+    result = testing.simulate_get(app, '/', headers={'Accept-Encoding': 'gzip'})
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in result.headers
+    assert falcon.media.JSONHandler().deserialize(
+        io.BytesIO(_decompress(result)), falcon.MEDIA_JSON, None) == SAMPLE_MEDIA['lines']
@@ -0,0 +1,176 @@
+from datetime import datetime
+import hashlib
+
+import pytest
+
+import falcon
+from falcon.middlewares import ConditionalGetMiddleware
+import falcon.testing as testing
+
+from _util import create_app  # NOQA
+
+
+class CountingHandler(falcon.media.JSONHandler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def serialize(self, media, content_type):
+        self.count += 1
+        return super().serialize(media, content_type)
+
+    async def serialize_async(self, media, content_type):
+        return self.serialize(media, content_type)
+
+
+class ThingsResource:
+    def __init__(self, etag=None, last_modified=None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.media = {'things': [1, 2, 3]}
+
+    def on_get(self, req, resp):
+        if self.etag:
+            resp.etag = self.etag
+        if self.last_modified:
+            resp.last_modified = self.last_modified
+
+        resp.media = self.media
+
+    on_head = on_get
+
+    def on_post(self, req, resp):
+        resp.media = self.media
+
+    def on_delete(self, req, resp):
+        raise falcon.HTTPForbidden()
+
+
+@pytest.fixture
+def make_client(asgi):
+    def make(resource=None, **kwargs):
+        app = create_app(asgi, middleware=[ConditionalGetMiddleware(**kwargs)])
+        app.add_route('/things', resource or ThingsResource())
+        return testing.TestClient(app)
+
+    return make
+
+
+@pytest.mark.parametrize('method', ['GET', 'HEAD'])
+def test_generated_etag(make_client, method):
+    client = make_client()
+
+    result = client.simulate_request(method, '/things')
+    assert result.status_code == 200
+    etag = result.headers['ETag']
+    assert etag.startswith('W/"')
+
+    result = client.simulate_request(method, '/things', headers={'If-None-Match': etag})
+    assert result.status_code == 304
+    assert result.headers['ETag'] == etag
+    assert not result.content
+    assert 'Content-Type' not in result.headers
+
+    result = client.simulate_request(
+        method, '/things', headers={'If-None-Match': '"foo", ' + etag[2:]})
+    assert result.status_code == 304
+
+    result = client.simulate_request(method, '/things', headers={'If-None-Match': '"foo"'})
+    assert result.status_code == 200
+
+
+def test_etag_stable_across_get_and_head(make_client):
+    client = make_client()
+
+    assert (client.simulate_get('/things').headers['ETag'] ==
+            client.simulate_head('/things').headers['ETag'])
+
+
+def test_etag_changes_with_body(make_client):
+    resource = ThingsResource()
+    client = make_client(resource)
+
+    etag = client.simulate_get('/things').headers['ETag']
+
+    resource.media = {'things': [1, 2, 3, 4]}
+    result = client.simulate_get('/things', headers={'If-None-Match': etag})
+    assert result.status_code == 200
+    assert result.json == {'things': [1, 2, 3, 4]}
+    assert result.headers['ETag'] != etag
+
+
+def test_media_serialized_once(make_client):
+    client = make_client()
+    handler = CountingHandler()
+    client.app.resp_options.media_handlers['application/json'] = handler
+
+    result = client.simulate_get('/things')
+    assert result.json == {'things': [1, 2, 3]}
+    assert handler.count == 1
+
+
+def test_wildcard(make_client):
+    client = make_client()
+
+    result = client.simulate_get('/things', headers={'If-None-Match': '*'})
+    assert result.status_code == 304
+
+
+def test_strong_etag_custom_hash(make_client):
+    def blake2b(data):
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    client = make_client(hash_function=blake2b, weak=False)
+
+    result = client.simulate_get('/things')
+    expected = '"{}"'.format(blake2b(result.content))
+    assert result.headers['ETag'] == expected
+
+    result = client.simulate_get('/things', headers={'If-None-Match': expected})
+    assert result.status_code == 304
+
+
+def test_resource_etag(make_client):
+    client = make_client(ThingsResource(etag='v42'))
+
+    result = client.simulate_get('/things')
+    assert result.status_code == 200
+    assert result.headers['ETag'] == '"v42"'
+
+    result = client.simulate_get('/things', headers={'If-None-Match': 'W/"v42"'})
+    assert result.status_code == 304
+    assert result.headers['ETag'] == '"v42"'
+
+    result = client.simulate_get('/things', headers={'If-None-Match': '"v41"'})
+    assert result.status_code == 200
+
+
+def test_last_modified(make_client):
+    client = make_client(ThingsResource(last_modified=datetime(2020, 2, 2, 12, 0, 0)))
+
+    result = client.simulate_get(
+        '/things', headers={'If-Modified-Since': 'Sun, 02 Feb 2020 12:00:00 GMT'})
+    assert result.status_code == 304
+
+    result = client.simulate_get(
+        '/things', headers={'If-Modified-Since': 'Sun, 02 Feb 2020 11:59:59 GMT'})
+    assert result.status_code == 200
+
+    # NOTE: If-None-Match takes precedence over If-Modified-Since
+    result = client.simulate_get('/things', headers={
+        'If-Modified-Since': 'Sun, 02 Feb 2020 12:00:00 GMT',
+        'If-None-Match': '"foo"',
+    })
+    assert result.status_code == 200
+
+
+@pytest.mark.parametrize('method, status_code', [
+    ('POST', 200),
+    ('DELETE', 403),
+])
+def test_not_applicable(make_client, method, status_code):
+    client = make_client()
+
+    result = client.simulate_request(method, '/things', headers={'If-None-Match': '*'})
+    assert result.status_code == status_code
+    assert 'ETag' not in result.headers
@@ -5,6 +5,7 @@ import re
 import pytest
 
 import falcon
+from falcon import request_helpers
 import falcon.testing as testing
 from falcon.util import http_date_to_dt, TimezoneGMT
 
@@ -360,6 +361,31 @@ def test_duplicate_cookie():
     assert req.get_cookie_values('x') == ['1', '2', '3', '4']
 
 
+@pytest.mark.parametrize('header_value', [
+    'x=1;bad{cookie=bar; x=2;x=3 ; x=4;',
+    '  session = "a\\012b" ;sessionx=1; xsession=2; session;session=',
+    'a=session; session_id=1; session=2; session\t=3',
+    ';;session=s1;=;session',
+    'foo=bar',
+])
+@pytest.mark.parametrize('name', ['session', 'x', 'foo', 'missing', 'bad{cookie', ''])
+def test_get_cookie_values_without_full_parse(header_value, name):
+    environ = testing.create_environ(headers={'Cookie': header_value})
+    req = falcon.Request(environ)
+
+    expected = request_helpers.parse_cookie_header(header_value).get(name)
+    assert req.get_cookie_values(name) == expected
+    assert req._cookies is None
+
+    if request_helpers._cy_scan_cookie_values and name and name != 'bad{cookie':
+        assert request_helpers._cy_scan_cookie_values(header_value, name) == expected
+
+    if expected:
+        assert req.cookies[name] == expected[0]
+    else:
+        assert name not in req.cookies
+
+
 def test_cookie_header_is_missing():
     environ = testing.create_environ(headers={})
 
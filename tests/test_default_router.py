@@ -3,7 +3,7 @@ import textwrap
 import pytest
 
 from falcon import testing
-from falcon.routing import DefaultRouter
+from falcon.routing import compiled, DefaultRouter
 
 from _util import create_app  # NOQA
 
@@ -12,10 +12,26 @@ def client(asgi):
     return testing.TestClient(create_app(asgi))
 
 
-@pytest.fixture
-def router():
+@pytest.fixture(params=['if_chain', 'literal_dispatch', 'incremental'])
+def router(request, monkeypatch):
+    if request.param == 'literal_dispatch':
+        monkeypatch.setattr(compiled, '_LITERAL_DISPATCH_THRESHOLD', 2)
+
     router = DefaultRouter()
 
+    if request.param == 'incremental':
+        router.options.incremental_compile = True
+
+        # NOTE: Recompile after every route is added, in order to exercise
+        #   the incremental updates.
+        add_route = DefaultRouter.add_route
+
+        def add_route_and_compile(self, uri_template, resource, **kwargs):
+            kwargs.setdefault('compile', True)
+            add_route(self, uri_template, resource, **kwargs)
+
+        monkeypatch.setattr(DefaultRouter, 'add_route', add_route_and_compile)
+
     router.add_route(
         '/repos', ResourceWithId(1))
     router.add_route(
@@ -278,6 +294,122 @@ def test_root_path():
     assert router.finder_src == expected_src
 
 
+def test_literal_dispatch(monkeypatch):
+    monkeypatch.setattr(compiled, '_LITERAL_DISPATCH_THRESHOLD', 3)
+
+    router = DefaultRouter()
+    router.add_route('/alpha', ResourceWithId(1))
+    router.add_route('/beta', ResourceWithId(2))
+    router.add_route('/gamma/{id:int}', ResourceWithId(3))
+
+    expected_src = textwrap.dedent("""
+        def find_1(path, path_len, return_values, patterns, converters, params):
+            if path_len == 1:
+                return return_values[0]
+            return None
+
+        def find_2(path, path_len, return_values, patterns, converters, params):
+            if path_len == 1:
+                return return_values[1]
+            return None
+
+        def find_3(path, path_len, return_values, patterns, converters, params):
+            if path_len > 1:
+                fragment = path[1]
+                field_value = None
+                if fragment.strip() == fragment:
+                    try:
+                        field_value = int(fragment)
+                    except ValueError:
+                        pass
+                if field_value is not None:
+                    params['id'] = field_value
+                    if path_len == 2:
+                        return return_values[2]
+                    return None
+            return None
+
+        literals_0 = {
+            'alpha': find_1,
+            'beta': find_2,
+            'gamma': find_3,
+        }
+
+        def find(path, return_values, patterns, converters, params):
+            path_len = len(path)
+            if path_len > 0:
+                finder = literals_0.get(path[0])
+                if finder is not None:
+                    return finder(path, path_len, return_values, patterns, converters, params)
+                return None
+            return None
+    """).strip()
+
+    assert router.finder_src == expected_src
+
+    assert router.find('/beta')[0].resource_id == 2
+    assert router.find('/gamma/42')[2] == {'id': 42}
+    assert router.find('/gamma/x') is None
+    assert router.find('/delta') is None
+
+
+@pytest.fixture
+def host_router():
+    router = DefaultRouter()
+
+    router.add_route('/items/{id}', ResourceWithId(1), host='API.example.com')
+    router.add_route('/items/{id}/parts', ResourceWithId(2))
+    router.add_route('/health', ResourceWithId(3))
+    router.add_route('/health', ResourceWithId(4), host='www.example.com')
+
+    return router
+
+
+@pytest.mark.parametrize('host,path,expected_id,expected_params', [
+    ('api.example.com', '/items/42', 1, {'id': '42'}),
+    ('Api.Example.Com', '/items/42', 1, {'id': '42'}),
+    ('api.example.com', '/items/42/parts', 2, {'id': '42'}),
+    ('api.example.com', '/health', 3, {}),
+    ('www.example.com', '/health', 4, {}),
+    ('www.example.com', '/items/42', None, None),
+    ('www.example.com', '/items/42/parts', 2, {'id': '42'}),
+    ('example.com', '/health', 3, {}),
+])
+def test_host_routes(host_router, host, path, expected_id, expected_params):
+    req = testing.create_req(path=path, host=host)
+    route = host_router.find(path, req=req)
+
+    if expected_id is None:
+        assert route is None
+    else:
+        resource, __, params, __ = route
+        assert resource.resource_id == expected_id
+        assert params == expected_params
+
+
+def test_host_routes_without_req(host_router):
+    assert host_router.find('/health')[0].resource_id == 3
+    assert host_router.find('/items/42') is None
+
+
+@pytest.mark.parametrize('host', [42, ''])
+def test_host_invalid(host):
+    router = DefaultRouter()
+    with pytest.raises(TypeError):
+        router.add_route('/items', ResourceWithId(1), host=host)
+
+
+@pytest.mark.parametrize('asgi', [True, False])
+def test_host_routes_app(asgi):
+    app = create_app(asgi)
+    app.add_route('/', ResourceWithId('api'), host='api.example.com')
+    app.add_route('/', ResourceWithId('default'))
+
+    client = testing.TestClient(app)
+    assert client.simulate_get(host='api.example.com').text == 'api'
+    assert client.simulate_get(host='www.example.com').text == 'default'
+
+
 @pytest.mark.parametrize('uri_template', [
     '/{field}{field}',
     '/{field}...{field}',
@@ -289,6 +289,77 @@ class TestHeaders:
         result = client.simulate_head()
         assert result.headers['Content-Length'] == '42'
 
+    def test_declared_content_length_on_head_skips_media(self, client):
+        class Resource:
+            def on_get(self, req, resp):
+                resp.content_length = 42
+
+                # NOTE: This would fail to serialize if it were rendered
+                resp.media = object()
+
+            on_head = on_get
+
+        client.app.add_route('/', Resource())
+
+        result = client.simulate_head()
+        assert result.status_code == 200
+        assert result.headers['Content-Length'] == '42'
+        assert not result.content
+
+        result = client.simulate_get()
+        assert result.status_code == 500
+
+    def test_content_length_on_head(self, client):
+        class Resource:
+            def on_head(self, req, resp):
+                resp.body = SAMPLE_BODY
+
+        client.app.add_route('/', Resource())
+        result = client.simulate_head()
+
+        assert result.headers['Content-Length'] == str(len(SAMPLE_BODY))
+        assert not result.content
+
+    @pytest.mark.parametrize('method, status', [
+        ('HEAD', falcon.HTTP_200),
+        ('GET', falcon.HTTP_204),
+        ('GET', falcon.HTTP_304),
+    ])
+    def test_stream_closed_without_reading(self, asgi, method, status):
+        class Stream:
+            def __init__(self):
+                self.closed = False
+
+            def read(self, size=-1):
+                raise AssertionError('stream should not be read')
+
+            def close(self):
+                self.closed = True
+
+        class AsyncStream(Stream):
+            async def read(self, size=-1):
+                raise AssertionError('stream should not be read')
+
+            async def close(self):
+                self.closed = True
+
+        stream = AsyncStream() if asgi else Stream()
+
+        class Resource:
+            def on_get(self, req, resp):
+                resp.status = status
+                resp.stream = stream
+
+            on_head = on_get
+
+        app = create_app(asgi)
+        app.add_route('/', Resource())
+
+        result = testing.simulate_request(app, method=method)
+        assert result.status == status
+        assert not result.content
+        assert stream.closed
+
     def test_declared_content_length_overridden_by_no_body(self, client):
         client.app.add_route('/', ContentLengthHeaderResource(42))
         result = client.simulate_get()
@@ -275,6 +275,21 @@ class TestRouter:
         assert ri[0].class_name == 'MyResponder'
         assert ri[0].methods == []
 
+    def test_compiled_host(self):
+        r = routing.CompiledRouter()
+        r.add_route('/foo', i_f.MyResponder())
+        r.add_route('/foo/bar', i_f.MyResponder(), host='api.example.com')
+        ri = inspect.inspect_compiled_router(r)
+
+        assert [(route.path, route.host) for route in ri] == [
+            ('/foo', None),
+            ('/foo/bar', 'api.example.com'),
+        ]
+
+        sv = inspect.StringVisitor()
+        assert sv.process(ri[1]).startswith(
+            "⇒ /foo/bar (host='api.example.com') - MyResponder:")
+
     def test_register_router_not_found(self, monkeypatch):
         monkeypatch.setattr(inspect, '_supported_routers', {})
 
@@ -8,7 +8,9 @@ import mujson
 import pytest
 import ujson
 
+import falcon
 from falcon import ASGI_SUPPORTED, media, testing
+import falcon.media.handlers as handlers_module
 
 from _util import create_app  # NOQA
 
@@ -261,3 +263,54 @@ def test_async_handler_returning_none():
     result = testing.simulate_post(app, '/', json=doc)
     assert result.status_code == 200
     assert result.json == [None]
+
+
+def test_find_by_media_type_memoized():
+    json_handler = media.JSONHandler()
+    handlers = media.Handlers({'application/json': json_handler})
+
+    for __ in range(2):
+        handler = handlers.find_by_media_type('application/json; charset=utf-8', None)
+        assert handler is json_handler
+
+        with pytest.raises(falcon.HTTPUnsupportedMediaType):
+            handlers.find_by_media_type('image/png', None)
+
+    assert handlers._resolved == {
+        'application/json; charset=utf-8': json_handler,
+        'image/png': None,
+    }
+
+
+def test_find_by_media_type_memo_invalidated():
+    json_handler = media.JSONHandler()
+    handlers = media.Handlers({'application/*': json_handler})
+    assert handlers.find_by_media_type('application/xml', None) is json_handler
+
+    xml_handler = media.JSONHandler()
+    handlers['application/xml'] = xml_handler
+    assert handlers.find_by_media_type('application/xml; charset=utf-8', None) is (
+        xml_handler)
+
+    copied = handlers.copy()
+    del handlers['application/xml']
+    assert handlers.find_by_media_type('application/xml; charset=utf-8', None) is (
+        json_handler)
+    assert copied.find_by_media_type('application/xml; charset=utf-8', None) is (
+        xml_handler)
+
+    handlers.pop('application/*')
+    handlers['text/plain'] = json_handler
+    with pytest.raises(falcon.HTTPUnsupportedMediaType):
+        handlers.find_by_media_type('application/xml', None)
+
+
+def test_find_by_media_type_memo_bounded():
+    handlers = media.Handlers()
+
+    for index in range(handlers_module._RESOLVED_CACHE_SIZE * 2):
+        media_type = 'application/vnd.test-{}+json'.format(index)
+        with pytest.raises(falcon.HTTPUnsupportedMediaType):
+            handlers.find_by_media_type(media_type, None)
+
+    assert len(handlers._resolved) <= handlers_module._RESOLVED_CACHE_SIZE
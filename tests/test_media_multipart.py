@@ -303,6 +303,35 @@ def test_from_buffered_stream():
         assert part.data == b''
 
 
+@pytest.mark.parametrize('max_stream_len', [None, len(EXAMPLE1)])
+def test_from_stream_of_unknown_length(max_stream_len):
+    handler = media.MultipartFormHandler()
+    stream = falcon.request_helpers.BoundedStream(
+        io.BytesIO(EXAMPLE1), None, max_stream_len=max_stream_len)
+    form = handler.deserialize(
+        stream, 'multipart/form-data; boundary=5b11af82ab65407ba8cdccf37d2a9c4f',
+        None)
+
+    assert [part.data for part in form] == [
+        b'world',
+        b'{"debug": true, "message": "Hello, world!", "score": 7}',
+        b'Hello, world!\n',
+    ]
+
+
+def test_from_stream_of_unknown_length_too_large():
+    handler = media.MultipartFormHandler()
+    stream = falcon.request_helpers.BoundedStream(
+        io.BytesIO(EXAMPLE1), None, max_stream_len=len(EXAMPLE1) - 1)
+    form = handler.deserialize(
+        stream, 'multipart/form-data; boundary=5b11af82ab65407ba8cdccf37d2a9c4f',
+        None)
+
+    with pytest.raises(falcon.HTTPPayloadTooLarge):
+        for part in form:
+            part.data
+
+
 def test_body_part_media():
     handler = media.MultipartFormHandler()
 
@@ -1,5 +1,6 @@
 from datetime import date, datetime
 import json
+from unittest.mock import MagicMock
 from uuid import UUID
 
 import pytest
@@ -8,7 +9,7 @@ import falcon
 from falcon.errors import HTTPInvalidParam, UnsupportedError
 import falcon.testing as testing
 
-from _util import create_app  # NOQA
+from _util import create_app, create_req  # NOQA
 
 
 class Resource(testing.SimpleTestResource):
@@ -932,3 +933,26 @@ class TestPostQueryParamsDefaultBehavior:
 
         req = resource.captured_req
         assert req.get_param('q') is None
+
+
+@pytest.mark.parametrize('method_name', [
+    'params',
+    'get_param',
+    'get_param_as_int',
+    'get_param_as_list',
+    'has_param',
+])
+def test_query_string_parsed_lazily(asgi, monkeypatch, method_name):
+    parse_query_string = MagicMock(side_effect=falcon.uri.parse_query_string)
+    monkeypatch.setattr(falcon.request, 'parse_query_string', parse_query_string)
+
+    req = create_req(asgi, query_string='marker=deadbeef&limit=10&utm_source=x')
+    assert not parse_query_string.called
+
+    if method_name == 'params':
+        assert req.params['limit'] == '10'
+        assert req.params['marker'] == 'deadbeef'
+    else:
+        assert getattr(req, method_name)('limit')
+
+    parse_query_string.assert_called_once()
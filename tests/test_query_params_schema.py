@@ -0,0 +1,160 @@
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+import falcon
+from falcon.params import compile_query_params
+import falcon.testing as testing
+
+
+SCHEMA = {
+    'limit': falcon.Param(int, default=10, min_value=1, max_value=100),
+    'ratio': falcon.Param(float),
+    'marker': falcon.Param(str, required=True),
+    'sort_desc': falcon.Param(bool, name='sort-desc', default=False),
+    'ids': falcon.Param(list, default=[], transform=int),
+    'token': falcon.Param(UUID),
+}
+
+
+class ThingsResource:
+    @falcon.query_params(SCHEMA)
+    def on_get(self, req, resp, query):
+        resp.media = {
+            'limit': query.limit,
+            'ratio': query.ratio,
+            'marker': query.marker,
+            'sort_desc': query.sort_desc,
+            'ids': query.ids,
+            'token': str(query.token) if query.token else None,
+        }
+
+
+@falcon.query_params({'limit': falcon.Param(int, default=5)}, param_name='q')
+class ClassResource:
+    def on_get(self, req, resp, q):
+        resp.media = q.limit
+
+    def on_post(self, req, resp, q):
+        resp.media = q.limit * 2
+
+
+@pytest.fixture
+def client():
+    app = falcon.App()
+    app.add_route('/things', ThingsResource())
+    app.add_route('/class', ClassResource())
+    return testing.TestClient(app)
+
+
+def test_defaults(client):
+    result = client.simulate_get('/things', params={'marker': 'x'})
+    assert result.json == {
+        'limit': 10,
+        'ratio': None,
+        'marker': 'x',
+        'sort_desc': False,
+        'ids': [],
+        'token': None,
+    }
+
+
+def test_conversion(client):
+    token = '6b1a3f3c-7d3f-4c3e-9a7e-4f2b8f6e7b1a'
+    result = client.simulate_get(
+        '/things',
+        query_string=(
+            'marker=a&marker=b&limit=25&ratio=0.5&sort-desc&ids=1&ids=2&ids=3'
+            '&token=' + token
+        ),
+    )
+    assert result.json == {
+        'limit': 25,
+        'ratio': 0.5,
+        'marker': 'b',
+        'sort_desc': True,
+        'ids': [1, 2, 3],
+        'token': token,
+    }
+
+
+@pytest.mark.parametrize('query_string,title,fragment', [
+    ('', 'Missing parameter', 'The "marker" parameter is required.'),
+    ('marker=x&limit=many', 'Invalid parameter', 'The value must be an integer.'),
+    ('marker=x&limit=0', 'Invalid parameter', 'The value must be at least 1'),
+    ('marker=x&limit=101', 'Invalid parameter', 'The value may not exceed 100'),
+    ('marker=x&sort-desc=maybe', 'Invalid parameter', '"true" or "false"'),
+    ('marker=x&token=abc', 'Invalid parameter', 'The value must be a UUID string.'),
+    ('marker=x&ids=1&ids=two', 'Invalid parameter', 'not formatted correctly'),
+])
+def test_single_problem(client, query_string, title, fragment):
+    result = client.simulate_get('/things', query_string=query_string)
+    assert result.status_code == 400
+    assert result.json['title'] == title
+    assert fragment in result.json['description']
+
+
+def test_all_problems_reported(client):
+    result = client.simulate_get('/things', query_string='limit=0&ratio=big')
+    assert result.status_code == 400
+    assert result.json['title'] == 'Invalid parameters'
+
+    description = result.json['description']
+    assert 'The "limit" parameter is invalid. The value must be at least 1' in description
+    assert 'The "ratio" parameter is invalid. The value must be a float.' in description
+    assert 'The "marker" parameter is required.' in description
+
+
+@pytest.mark.parametrize('method,expected', [('GET', 5), ('POST', 10)])
+def test_resource_class(client, method, expected):
+    assert client.simulate_request(method, '/class').json == expected
+    assert client.simulate_request(
+        method, '/class', params={'limit': 3}).json == expected // 5 * 3
+
+
+def test_compiled_once():
+    extract = compile_query_params({'limit': falcon.Param(int)})
+    assert extract({'limit': '7'}).limit == 7
+    assert extract({}).limit is None
+    assert extract.__doc__ is None
+
+
+def test_non_literal_bounds():
+    extract = compile_query_params({
+        'x': falcon.Param(float, min_value=float('-inf'), max_value=float('inf')),
+        'y': falcon.Param(float, max_value=Decimal('2.5')),
+    })
+    assert extract({'x': '3', 'y': '1.5'}) == (3.0, 1.5)
+
+    with pytest.raises(falcon.HTTPInvalidParam):
+        extract({'y': '3'})
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'type': dict},
+    {'type': str, 'min_value': 1},
+    {'type': int, 'transform': int},
+])
+def test_invalid_param_spec(kwargs):
+    with pytest.raises((TypeError, ValueError)):
+        falcon.Param(**kwargs)
+
+
+def test_invalid_schema():
+    with pytest.raises(TypeError):
+        compile_query_params({'limit': int})
+
+
+def test_mutable_default_not_shared():
+    class Resource:
+        @falcon.query_params({'tags': falcon.Param(list, default=[])})
+        def on_get(self, req, resp, query):
+            query.tags.append('x')
+            resp.media = query.tags
+
+    app = falcon.App()
+    app.add_route('/', Resource())
+
+    for _ in range(3):
+        assert testing.simulate_get(app, '/').json == ['x']
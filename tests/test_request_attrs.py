@@ -5,7 +5,7 @@ import pytest
 
 import falcon
 from falcon.request import Request, RequestOptions
-from falcon.request_helpers import _parse_etags
+from falcon.request_helpers import _best_match, _parse_etags, _quality
 import falcon.testing as testing
 import falcon.uri
 from falcon.util.structures import ETag
@@ -469,6 +469,28 @@ class TestRequestAttributes:
         preferred_type = req.client_prefers(['application/xhtml+xml'])
         assert preferred_type is None
 
+    @pytest.mark.skipif(
+        not hasattr(_best_match, 'cache_info'),
+        reason='Content negotiation is not memoized on this platform'
+    )
+    def test_client_negotiation_memoized(self, asgi):
+        accept = 'text/*; q=0.1, application/xhtml+xml; q=0.5, application/x-memo'
+        _best_match.cache_clear()
+        _quality.cache_clear()
+
+        for __ in range(3):
+            req = create_req(asgi, headers={'Accept': accept})
+            assert req.client_prefers(['text/plain', 'application/xhtml+xml']) == (
+                'application/xhtml+xml')
+            assert req.client_prefers(('text/plain', 'image/png')) == 'text/plain'
+            assert req.client_accepts('application/x-memo')
+            assert not req.client_accepts('image/png')
+
+        assert _best_match.cache_info().misses == 2
+        assert _best_match.cache_info().hits == 4
+        assert _quality.cache_info().misses == 2
+        assert _quality.cache_info().hits == 4
+
     def test_range(self, asgi):
         headers = {'Range': 'bytes=10-'}
         req = create_req(asgi, headers=headers)
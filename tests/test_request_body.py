@@ -1,4 +1,5 @@
 import io
+import json
 from wsgiref.validate import InputWrapper
 
 import pytest
@@ -167,3 +168,150 @@ class TestRequestBody:
         req = falcon.Request(environ)
         _repr = '<%s: %s %r>' % (req.__class__.__name__, req.method, req.url)
         assert req.__repr__() == _repr
+
+
+class SpoolingMiddleware:
+    def process_request(self, req, resp):
+        req.context.peeked = req.spool_body().read()
+
+
+class SpooledBodyResource:
+    def on_post(self, req, resp):
+        resp.media = {
+            'peeked': len(req.context.peeked),
+            'media': req.get_media(),
+            'again': len(req.spool_body().read()),
+        }
+
+    def on_put(self, req, resp):
+        resp.media = {
+            'peeked': req.context.peeked.decode(),
+            'stream': req.stream.read().decode(),
+        }
+
+
+class TestSpooledBody:
+    @pytest.fixture
+    def client(self):
+        app = falcon.App(middleware=[SpoolingMiddleware()])
+        app.req_options.body_spool_threshold = SIZE_1_KB
+        app.add_route('/', SpooledBodyResource())
+        return testing.TestClient(app)
+
+    @pytest.mark.parametrize('size', [0, 10, SIZE_1_KB, 200 * SIZE_1_KB])
+    def test_spooled_media(self, client, size):
+        doc = {'data': 'x' * size}
+        expected_len = len(json.dumps(doc))
+
+        result = client.simulate_post('/', json=doc)
+        assert result.json == {
+            'peeked': expected_len,
+            'media': doc,
+            'again': expected_len,
+        }
+
+    def test_spooled_stream(self, client):
+        result = client.simulate_put('/', body='Hello, spooled world!')
+        assert result.json == {
+            'peeked': 'Hello, spooled world!',
+            'stream': 'Hello, spooled world!',
+        }
+
+    def test_spooled_empty_body(self, client):
+        result = client.simulate_post('/')
+        assert result.json == {'peeked': 0, 'media': None, 'again': 0}
+
+    @pytest.mark.parametrize('size,spilled', [
+        (SIZE_1_KB, False),
+        (SIZE_1_KB + 1, True),
+    ])
+    def test_spool_threshold(self, size, spilled):
+        options = falcon.RequestOptions()
+        options.body_spool_threshold = SIZE_1_KB
+        req = testing.create_req(options=options, body=b'x' * size)
+
+        first = req.spool_body()
+        second = req.spool_body()
+
+        assert (type(req._spooled_body) is not bytes) is spilled
+        assert first.read(10) == b'x' * 10
+        assert second.read() == b'x' * size
+        assert first.read() == b'x' * (size - 10)
+
+        first.seek(-5, io.SEEK_END)
+        assert first.tell() == size - 5
+        assert first.read() == b'x' * 5
+
+
+class TestTerminatedInput:
+    @staticmethod
+    def _create_req(body, terminated=True, max_size=None, content_type=None):
+        headers = {'Content-Type': content_type} if content_type else None
+        env = testing.create_environ(method='POST', body=body, headers=headers)
+        del env['CONTENT_LENGTH']
+        if terminated:
+            env['wsgi.input_terminated'] = True
+
+        options = falcon.RequestOptions()
+        options.max_terminated_body_size = max_size
+        return falcon.Request(env, options)
+
+    def test_not_terminated(self):
+        req = self._create_req(b'data', terminated=False)
+        assert req.content_length is None
+        assert req.bounded_stream.eof
+        assert req.bounded_stream.read() == b''
+
+    @pytest.mark.parametrize('max_size', [None, 5 * SIZE_1_KB])
+    def test_read(self, max_size):
+        body = b'0123456789' * 500
+        req = self._create_req(body, max_size=max_size)
+        stream = req.bounded_stream
+
+        assert stream.stream_len is None
+        assert not stream.eof
+        assert stream.read(10) == body[:10]
+        assert stream.read() == body[10:]
+        assert stream.eof
+        assert stream.read() == b''
+
+    def test_readline(self):
+        req = self._create_req(b'a\nbb\nccc\n', max_size=9)
+        stream = req.bounded_stream
+
+        assert stream.readline() == b'a\n'
+        assert stream.readlines() == [b'bb\n', b'ccc\n']
+        assert stream.readline() == b''
+        assert stream.eof
+
+    def test_readinto(self):
+        req = self._create_req(b'0123456789', max_size=10)
+        buffer = bytearray(16)
+
+        assert req.bounded_stream.readinto(buffer) == 10
+        assert buffer[:10] == b'0123456789'
+        assert req.bounded_stream.readinto(buffer) == 0
+        assert req.bounded_stream.eof
+
+    @pytest.mark.parametrize('method,args', [
+        ('read', ()),
+        ('read', (64,)),
+        ('readline', ()),
+        ('readlines', ()),
+        ('readinto', (bytearray(64),)),
+    ])
+    def test_too_large(self, method, args):
+        req = self._create_req(b'0123456789', max_size=9)
+
+        with pytest.raises(falcon.HTTPPayloadTooLarge):
+            getattr(req.bounded_stream, method)(*args)
+
+    def test_exhaust_ignores_limit(self):
+        req = self._create_req(b'0123456789', max_size=5)
+        req.bounded_stream.exhaust()
+        assert req.bounded_stream.eof
+
+    def test_media(self):
+        req = self._create_req(
+            b'{"chunked": true}', content_type=falcon.MEDIA_JSON)
+        assert req.get_media() == {'chunked': True}
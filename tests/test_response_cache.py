@@ -0,0 +1,314 @@
+import os
+
+import pytest
+
+import falcon
+from falcon.caching import BaseCache, MemoryCache, SharedMemoryCache
+from falcon.middlewares import CompressionMiddleware, ResponseCacheMiddleware
+import falcon.testing as testing
+
+from _util import create_app  # NOQA
+
+
+class CountingResource:
+    def __init__(self, cache_control='max-age=60', **headers):
+        self.cache_control = cache_control
+        self.headers = headers
+        self.calls = 0
+
+    def on_get(self, req, resp):
+        self.calls += 1
+
+        if self.cache_control:
+            resp.cache_control = [self.cache_control]
+        for name, value in self.headers.items():
+            resp.set_header(name.replace('_', '-'), value)
+
+        resp.media = {
+            'calls': self.calls,
+            'lang': req.get_header('Accept-Language'),
+            'padding': 'x' * 1000,
+        }
+
+    on_head = on_get
+
+    def on_post(self, req, resp):
+        self.on_get(req, resp)
+
+
+class CookieResource(CountingResource):
+    def on_get(self, req, resp):
+        super().on_get(req, resp)
+        resp.set_cookie('session', 'abc')
+
+
+class StatusResource(CountingResource):
+    def on_get(self, req, resp):
+        super().on_get(req, resp)
+        raise falcon.HTTPNotFound(headers={'Cache-Control': 'max-age=60'})
+
+
+@pytest.fixture(params=['memory', 'shared'])
+def cache(request):
+    if request.param == 'memory':
+        return MemoryCache()
+    return SharedMemoryCache(capacity=64)
+
+
+@pytest.fixture
+def make_client(asgi, cache):
+    def make(resource, middleware=(), **kwargs):
+        mw = [ResponseCacheMiddleware(cache, **kwargs)]
+        app = create_app(asgi, middleware=mw + list(middleware))
+        app.add_route('/', resource)
+        return testing.TestClient(app)
+
+    return make
+
+
+def test_cache_hit(make_client):
+    resource = CountingResource(ETag='"abc"')
+    client = make_client(resource)
+
+    first = client.simulate_get('/')
+    assert first.status_code == 200
+    assert first.json['calls'] == 1
+    assert 'Age' not in first.headers
+
+    second = client.simulate_get('/')
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers['Age'] == '0'
+    assert second.headers['ETag'] == '"abc"'
+    assert second.headers['Content-Type'] == first.headers['Content-Type']
+    assert second.headers['Content-Length'] == first.headers['Content-Length']
+    assert second.headers['Cache-Control'] == 'max-age=60'
+    assert resource.calls == 1
+
+    head = client.simulate_head('/')
+    assert head.status_code == 200
+    assert head.headers['Content-Length'] == first.headers['Content-Length']
+    assert not head.content
+    assert resource.calls == 1
+
+    # NOTE: The query string is part of the key
+    assert client.simulate_get('/', query_string='x=1').json['calls'] == 2
+
+
+@pytest.mark.parametrize('headers', [
+    {'Cache-Control': 'no-cache'},
+    {'Cache-Control': 'max-age=0'},
+    {'Pragma': 'no-cache'},
+])
+def test_request_bypass(make_client, headers):
+    resource = CountingResource()
+    client = make_client(resource)
+
+    client.simulate_get('/')
+    assert client.simulate_get('/', headers=headers).json['calls'] == 2
+
+    # NOTE: The fresh response has replaced the cached one.
+    assert client.simulate_get('/').json['calls'] == 2
+
+
+def test_request_no_store(make_client):
+    resource = CountingResource()
+    client = make_client(resource)
+
+    client.simulate_get('/', headers={'Cache-Control': 'no-store'})
+    assert client.simulate_get('/').json['calls'] == 2
+
+
+@pytest.mark.parametrize('resource_type, kwargs', [
+    (CountingResource, {'cache_control': None}),
+    (CountingResource, {'cache_control': 'no-store'}),
+    (CountingResource, {'cache_control': 'no-cache'}),
+    (CountingResource, {'cache_control': 'private, max-age=60'}),
+    (CountingResource, {'cache_control': 'max-age=0'}),
+    (CountingResource, {'Vary': '*'}),
+    (CookieResource, {}),
+])
+def test_not_cached(make_client, resource_type, kwargs):
+    client = make_client(resource_type(**kwargs))
+
+    client.simulate_get('/')
+    assert client.simulate_get('/').json['calls'] == 2
+
+
+def test_post_not_cached(make_client):
+    resource = CountingResource()
+    client = make_client(resource)
+
+    client.simulate_post('/')
+    client.simulate_post('/')
+    assert client.simulate_get('/').json['calls'] == 3
+
+
+def test_default_ttl(make_client):
+    resource = CountingResource(cache_control=None)
+    client = make_client(resource, default_ttl=60)
+
+    client.simulate_get('/')
+    assert client.simulate_get('/').json['calls'] == 1
+
+
+@pytest.mark.parametrize('cache_control, cached', [
+    ('max-age=60', False),
+    ('public, max-age=60', True),
+    ('s-maxage=60', True),
+])
+def test_authorization(make_client, cache_control, cached):
+    resource = CountingResource(cache_control=cache_control)
+    client = make_client(resource)
+
+    headers = {'Authorization': 'Bearer 123'}
+    client.simulate_get('/', headers=headers)
+    result = client.simulate_get('/', headers=headers)
+    assert result.json['calls'] == (1 if cached else 2)
+
+
+def test_error_status(make_client):
+    resource = StatusResource()
+    client = make_client(resource)
+
+    assert client.simulate_get('/').status_code == 404
+    assert client.simulate_get('/').status_code == 404
+    assert resource.calls == 2
+
+
+def test_vary(make_client):
+    resource = CountingResource(Vary='Accept-Language')
+    client = make_client(resource)
+
+    en = client.simulate_get('/', headers={'Accept-Language': 'en'})
+    lt = client.simulate_get('/', headers={'Accept-Language': 'lt'})
+    assert (en.json['lang'], en.json['calls']) == ('en', 1)
+    assert (lt.json['lang'], lt.json['calls']) == ('lt', 2)
+
+    assert client.simulate_get('/', headers={'Accept-Language': 'en'}).json == en.json
+    assert client.simulate_get('/', headers={'Accept-Language': 'lt'}).json == lt.json
+    assert client.simulate_get('/').json['calls'] == 3
+
+
+def test_compressed_variants(make_client):
+    resource = CountingResource()
+    client = make_client(resource, middleware=[CompressionMiddleware()])
+
+    plain = client.simulate_get('/')
+    gzipped = client.simulate_get('/', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in plain.headers
+    assert gzipped.headers['Content-Encoding'] == 'gzip'
+
+    cached = client.simulate_get('/', headers={'Accept-Encoding': 'gzip'})
+    assert cached.headers['Content-Encoding'] == 'gzip'
+    assert cached.headers['Vary'] == 'Accept-Encoding'
+    assert cached.content == gzipped.content
+    assert client.simulate_get('/').content == plain.content
+    assert resource.calls == 2
+
+
+def test_expiry(cache, monkeypatch):
+    cache.set('key', b'value', 60)
+    assert cache.get('key') == b'value'
+    assert cache.get('other') is None
+
+    cache.set('key', b'other value', 0.001)
+    assert cache.get('key') in (b'other value', None)
+
+    monkeypatch.setattr('time.time', lambda: 2 ** 40)
+    monkeypatch.setattr('time.monotonic', lambda: 2 ** 40)
+    assert cache.get('key') is None
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(max_entries=2)
+
+    cache.set('a', b'1', 60)
+    cache.set('b', b'2', 60)
+    assert cache.get('a') == b'1'
+
+    cache.set('c', b'3', 60)
+    assert cache.get('a') == b'1'
+    assert cache.get('b') is None
+    assert cache.get('c') == b'3'
+
+
+def test_shared_memory_cache_eviction():
+    cache = SharedMemoryCache(capacity=8, max_entry_size=64)
+
+    for i in range(8):
+        cache.set(str(i), b'value', 60)
+    assert cache.get('0') == b'value'
+
+    cache.set('8', b'value', 60)
+    assert cache.get('0') == b'value'
+    assert cache.get('8') == b'value'
+    assert sum(cache.get(str(i)) is not None for i in range(9)) == 8
+
+    cache.set('8', b'updated', 60)
+    assert cache.get('8') == b'updated'
+
+    cache.set('large', b'x' * 64, 60)
+    assert cache.get('large') is None
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork()')
+def test_shared_memory_cache_between_processes():
+    cache = SharedMemoryCache(capacity=16)
+    cache.set('parent', b'from parent', 60)
+
+    pid = os.fork()
+    if pid == 0:  # pragma: nocover
+        try:
+            ok = cache.get('parent') == b'from parent'
+            cache.set('child', b'from child', 60)
+        finally:
+            os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert status == 0
+    assert cache.get('child') == b'from child'
+
+
+def test_base_cache_is_abstract():
+    with pytest.raises(TypeError):
+        BaseCache()
+
+
+def test_streamed_media_not_cached(make_client):
+    class Resource(CountingResource):
+        def on_get(self, req, resp):
+            self.calls += 1
+            resp.cache_control = ['max-age=60']
+            resp.media = iter(range(self.calls))
+
+    resource = Resource()
+    client = make_client(resource)
+
+    assert client.simulate_get('/').json == [0]
+    assert client.simulate_get('/').json == [0, 1]
+
+
+def test_repeated_headers(make_client):
+    class Resource(CountingResource):
+        def on_get(self, req, resp):
+            super().on_get(req, resp)
+            resp.append_header('X-Tag', 'a')
+            resp.append_header('X-Tag', 'b')
+            resp.add_link('/things/2', 'next')
+            resp.add_link('/things/0', 'prev')
+
+            # NOTE: Emulate a response that carries separate header fields
+            #   with the same name (only used by Falcon for Set-Cookie).
+            resp._extra_headers = [('x-trace', '1'), ('x-trace', '2')]
+
+    resource = Resource()
+    client = make_client(resource)
+
+    first = client.simulate_get('/')
+    second = client.simulate_get('/')
+    assert resource.calls == 1
+
+    assert second.headers['X-Tag'] == first.headers['X-Tag'] == 'a, b'
+    assert second.headers['Link'] == first.headers['Link']
+    assert second.headers['X-Trace'] == '1, 2'
@@ -200,3 +200,72 @@ def test_media_rendered_cached(client):
 
     resp.media = 123
     assert first is not resp.render_body()
+
+
+class TestStreamedMedia:
+
+    @pytest.mark.parametrize('count', [0, 1, 999, 1000, 1001, 2500])
+    def test_json_iterator(self, count):
+        documents = [{'id': i, 'name': '♥ item {}'.format(i)} for i in range(count)]
+        app = falcon.App()
+        app.add_route('/', SimpleMediaResource(iter(documents)))
+
+        result = testing.simulate_get(app, '/')
+        assert result.status_code == 200
+        assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+        assert 'Content-Length' not in result.headers
+        assert result.json == documents
+
+    def test_json_batches(self):
+        handler = media.JSONHandler()
+        chunks = list(handler.serialize_stream(iter(range(2500)), falcon.MEDIA_JSON))
+
+        assert len(chunks) == 3
+        assert json.loads(b''.join(chunks).decode()) == list(range(2500))
+
+    def test_generator_consumed_lazily(self, client):
+        produced = []
+
+        def generate():
+            for i in range(3000):
+                produced.append(i)
+                yield i
+
+        client.simulate_get('/')
+        resp = client.resource.captured_resp
+        resp.media = generate()
+
+        assert resp.render_body() is None
+        assert not produced
+
+        # NOTE: Rendering is idempotent.
+        stream = resp.stream
+        assert resp.render_body() is None
+        assert resp.stream is stream
+
+        first = next(iter(stream))
+        assert first.startswith(b'[0,')
+        assert len(produced) == 1000
+
+    def test_fallback_handler(self):
+        class TextHandler(media.BaseHandler):
+            def serialize(self, media, content_type):
+                return '\n'.join(str(item) for item in media).encode()
+
+        app = falcon.App()
+        app.resp_options.media_handlers[falcon.MEDIA_TEXT] = TextHandler()
+        app.add_route('/', SimpleMediaResource(iter([1, 2, 3]), falcon.MEDIA_TEXT))
+
+        result = testing.simulate_get(app, '/')
+        assert result.status_code == 200
+        assert result.text == '1\n2\n3'
+
+    def test_head(self):
+        app = falcon.App()
+        resource = SimpleMediaResource(iter([1, 2, 3]))
+        resource.on_head = resource.on_get
+        app.add_route('/', resource)
+
+        result = testing.simulate_head(app, '/')
+        assert result.status_code == 200
+        assert not result.content
@@ -3,6 +3,7 @@ import re
 import pytest
 
 import falcon
+from falcon.app_helpers import prepare_sinks
 import falcon.testing as testing
 
 from _util import create_app  # NOQA
@@ -137,3 +138,68 @@ class TestDefaultRouting:
         response = client.simulate_request(path='/books/123')
         assert resource.called
         assert response.status == falcon.HTTP_200
+
+    def test_many_patterns(self, client, sink):
+        for name in ('alpha', 'beta', 'gamma', 'delta'):
+            client.app.add_sink(sink, r'/{}/(?P<id>\d+)'.format(name))
+
+        # NOTE: These can not be combined with the other patterns, and must
+        #   be still matched in the right order.
+        client.app.add_sink(sink, re.compile(r'/CASE/(?P<id>\w+)', re.IGNORECASE))
+        client.app.add_sink(sink, r'/(double)/(?P<id>\w+)/\1')
+        client.app.add_sink(sink, r'/alpha/(?P<first>\d+)-(?P<second>\d+)')
+
+        assert len(client.app._sink_matchers) == 4
+
+        for path, expected in (
+            ('/gamma/42', {'id': '42'}),
+            ('/alpha/1-2', {'first': '1', 'second': '2'}),
+            ('/alpha/12', {'id': '12'}),
+            ('/case/Z', {'id': 'Z'}),
+            ('/double/x/double', {'id': 'x'}),
+        ):
+            response = client.simulate_request(path=path)
+            assert response.status == falcon.HTTP_503
+            assert sink.kwargs == expected
+
+        for path in ('/epsilon/42', '/gamma/x', '/double/x/triple'):
+            response = client.simulate_request(path=path)
+            assert response.status == falcon.HTTP_404
+
+    def test_custom_prefix_object(self, client, sink):
+        class Prefix:
+            def match(self, path):
+                return re.match('/custom/(?P<name>.+)', path)
+
+        client.app.add_sink(sink, r'/custom/none')
+        client.app.add_sink(sink, Prefix())
+        client.app.add_sink(sink, r'/(?P<name>other)/?(?(name)|x)(?P=name)?')
+
+        response = client.simulate_request(path='/custom/thing')
+        assert response.status == falcon.HTTP_503
+        assert sink.kwargs == {'name': 'thing'}
+
+        response = client.simulate_request(path='/other')
+        assert response.status == falcon.HTTP_503
+        assert sink.kwargs == {'name': 'other'}
+
+
+@pytest.mark.parametrize('prefix,path,expected', [
+    (r'/[(?P<]x(?P<a>\w)', '/<xy', {'a': 'y'}),
+    (r'/\(?P<b>(?P<a>\w)', '/P<b>y', {'a': 'y'}),
+    (r'/[\](?P<]+(?P<a>\w)$', '/](y', {'a': 'y'}),
+    (r'/(?P<a>\w)-(?P=a)', '/y-y', {'a': 'y'}),
+])
+def test_prepare_sinks_group_names(prefix, path, expected):
+    def sink(req, resp):
+        pass
+
+    matchers = prepare_sinks([(re.compile(prefix), sink), (re.compile('/'), None)])
+    assert len(matchers) == 1
+
+    match, __, sink_map = matchers[0]
+    m = match(path)
+    matched_sink, fields = sink_map[m.lastgroup]
+
+    assert matched_sink is sink
+    assert {name: m.group(group) for name, group in fields} == expected
@@ -6,6 +6,7 @@ import os
 import pytest
 
 import falcon
+from falcon.app_helpers import prepare_static_routes
 from falcon.routing import StaticRoute, StaticRouteAsync
 import falcon.testing as testing
 
@@ -359,6 +360,37 @@ def test_match(asgi, default, path, expected, monkeypatch):
     assert sr.match(path) == expected
 
 
+def test_prepare_static_routes(monkeypatch):
+    class CustomStaticRoute(StaticRoute):
+        def match(self, path):
+            return path.startswith('/custom')
+
+    monkeypatch.setattr('os.path.isfile', lambda file: True)
+
+    routes = [
+        StaticRoute('/static/images', '/var/www/images'),
+        StaticRoute('/static', '/var/www/statics', fallback_filename='index.html'),
+        CustomStaticRoute('/custom', '/var/www/custom'),
+        StaticRoute('/', '/var/www/root'),
+    ]
+    matchers = prepare_static_routes(routes)
+    assert len(matchers) == 3
+
+    def find(path):
+        for match, sr, route_map in matchers:
+            m = match(path)
+            if m:
+                return sr if route_map is None else route_map[m.lastgroup]
+
+    assert find('/static/images/logo.png') is routes[0]
+    assert find('/static/images') is routes[1]
+    assert find('/static') is routes[1]
+    assert find('/staticfoo') is routes[3]
+    assert find('/customized') is routes[2]
+    assert find('/robots.txt') is routes[3]
+    assert find('robots.txt') is None
+
+
 def test_filesystem_traversal_fuse(client, monkeypatch):
 
     def suspicious_normpath(path):
@@ -368,3 +400,37 @@ def test_filesystem_traversal_fuse(client, monkeypatch):
     monkeypatch.setattr('os.path.normpath', suspicious_normpath)
     response = client.simulate_request(path='/static/shadow')
     assert response.status == falcon.HTTP_404
+
+
+def test_head_request_does_not_open_file(client, monkeypatch, tmpdir):
+    tmpdir.join('report.pdf').write_binary(b'%PDF' * 64)
+
+    def fail_open(path, mode):
+        raise AssertionError('file should not be opened for HEAD')
+
+    client.app.add_static_route('/downloads', str(tmpdir))
+    monkeypatch.setattr(io, 'open', fail_open)
+
+    response = client.simulate_head(path='/downloads/report.pdf')
+    assert response.status == falcon.HTTP_200
+    assert response.headers['Content-Length'] == '256'
+    assert response.headers['Content-Type'] == 'application/pdf'
+    assert not response.content
+
+    response = client.simulate_head(path='/downloads/missing.pdf')
+    assert response.status == falcon.HTTP_404
+
+
+def test_head_request_fallback_filename(client, tmpdir):
+    tmpdir.join('index.html').write_binary(b'<html></html>')
+
+    client.app.add_static_route('/', str(tmpdir), fallback_filename='index.html')
+
+    response = client.simulate_head(path='/some/page')
+    assert response.status == falcon.HTTP_200
+    assert response.headers['Content-Length'] == '13'
+    assert response.headers['Content-Type'] == 'text/html'
+
+    response = client.simulate_get(path='/some/page')
+    assert response.status == falcon.HTTP_200
+    assert response.text == '<html></html>'
@@ -4,7 +4,7 @@ import uuid
 
 import pytest
 
-from falcon.routing import converters
+from falcon.routing import CompiledRouter, converters
 
 
 _TEST_UUID = uuid.uuid4()
@@ -12,6 +12,21 @@ _TEST_UUID_STR = str(_TEST_UUID)
 _TEST_UUID_STR_SANS_HYPHENS = _TEST_UUID_STR.replace('-', '')
 
 
+class _Resource:
+    def on_get(self, req, resp):
+        pass
+
+
+def _convert_with_router(value, converter_spec):
+    # NOTE: The router inlines the built-in converters rather than calling
+    #   convert(), so verify that it arrives at the same result.
+    router = CompiledRouter()
+    router.add_route('/cvt/{field:' + converter_spec + '}', _Resource())
+
+    route = router.find('/cvt/' + value)
+    return None if route is None else route[2]['field']
+
+
 @pytest.mark.parametrize('value, num_digits, min, max, expected', [
     ('123', None, None, None, 123),
     ('01', None, None, None, 1),
@@ -44,6 +59,9 @@ def test_int_converter(value, num_digits, min, max, expected):
     c = converters.IntConverter(num_digits, min, max)
     assert c.convert(value) == expected
 
+    spec = 'int({0!r}, {1!r}, {2!r})'.format(num_digits, min, max)
+    assert _convert_with_router(value, spec) == expected
+
 
 @pytest.mark.parametrize('value', (
     ['0x0F', 'something', '', ' '] +
@@ -53,6 +71,7 @@ def test_int_converter(value, num_digits, min, max, expected):
 def test_int_converter_malformed(value):
     c = converters.IntConverter()
     assert c.convert(value) is None
+    assert _convert_with_router(value, 'int') is None
 
 
 @pytest.mark.parametrize('num_digits', [0, -1, -10])
@@ -76,6 +95,7 @@ def test_int_converter_invalid_config(num_digits):
 def test_datetime_converter(value, format_string, expected):
     c = converters.DateTimeConverter(format_string)
     assert c.convert(value) == expected
+    assert _convert_with_router(value, 'dt({0!r})'.format(format_string)) == expected
 
 
 def test_datetime_converter_default_format():
@@ -101,3 +121,35 @@ def test_datetime_converter_default_format():
 def test_uuid_converter(value, expected):
     c = converters.UUIDConverter()
     assert c.convert(value) == expected
+    assert _convert_with_router(value, 'uuid') == expected
+
+
+@pytest.mark.parametrize('uri_template', [
+    '/items/{id:int}',
+    '/items/{id:int(3, min=1, max=999)}',
+    '/items/v{id:int(min=-1)}',
+    '/items/{when:dt}',
+    '/items/{when:dt("%Y-%m-%d")}',
+    '/items/{id:uuid}',
+    '/items/{id:uuid}.{ext}',
+])
+def test_builtin_converters_inlined(uri_template):
+    router = CompiledRouter()
+    router.add_route(uri_template, _Resource())
+
+    assert '.convert(' not in router.finder_src
+
+
+def test_builtin_converter_subclass_not_inlined():
+    class PositiveIntConverter(converters.IntConverter):
+        def convert(self, value):
+            value = super().convert(value)
+            return value if value is not None and value > 0 else None
+
+    router = CompiledRouter()
+    router.options.converters['int'] = PositiveIntConverter
+    router.add_route('/items/{id:int}', _Resource())
+
+    assert 'converters[0].convert(fragment)' in router.finder_src
+    assert router.find('/items/0') is None
+    assert router.find('/items/1')[2] == {'id': 1}
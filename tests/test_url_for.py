@@ -0,0 +1,141 @@
+import pytest
+
+import falcon
+from falcon.routing import compile_uri_builder
+
+from _util import create_app  # NOQA
+
+
+class ThingsResource:
+    app = None
+
+    def on_get(self, req, resp):
+        resp.location = self.app.url_for(self, thing_id=42)
+
+    def on_get_item(self, req, resp, thing_id):
+        pass
+
+
+@pytest.fixture
+def app(asgi):
+    app = create_app(asgi)
+
+    things = ThingsResource()
+    things.app = app
+    app.add_route('/things', things)
+    app.add_route('/things/{thing_id:int}', things, suffix='item', name='thing')
+    app.add_route(
+        '/repos/{org}/{repo}/compare/{usr0}:{branch0}...{usr1}:{branch1:int}',
+        ThingsResource(),
+        name='compare',
+    )
+
+    return app
+
+
+@pytest.mark.parametrize('uri_template,fields,expected', [
+    ('/', {}, '/'),
+    ('/things', {}, '/things'),
+    ('/things/{id}', {'id': 'foo bar/baz'}, '/things/foo%20bar%2Fbaz'),
+    ('/things/{id:int(min=1)}/parts', {'id': 42}, '/things/42/parts'),
+    ('/emojis/{name}.{ext}', {'name': 'smile', 'ext': 'png'}, '/emojis/smile.png'),
+    ('/naïve/{name}', {'name': 'Ünïcode', 'extra': 1}, '/na%C3%AFve/%C3%9Cn%C3%AFcode'),
+])
+def test_compile_uri_builder(uri_template, fields, expected):
+    field_names, build = compile_uri_builder(uri_template)
+
+    assert field_names == frozenset(fields) - {'extra'}
+    assert build(fields) == expected
+
+
+@pytest.mark.parametrize('uri_template', [
+    '/things/{}',
+    '/things/{1d}',
+    '/things/{id}/parts/{id}',
+])
+def test_compile_uri_builder_invalid(uri_template):
+    with pytest.raises(ValueError):
+        compile_uri_builder(uri_template)
+
+
+def test_compile_uri_builder_missing_field():
+    __, build = compile_uri_builder('/things/{id}')
+
+    with pytest.raises(KeyError):
+        build({})
+
+
+def test_url_for_name(app):
+    assert app.url_for('thing', thing_id=7) == '/things/7'
+    assert app.url_for(
+        'compare', org='falcon', repo='falcon',
+        usr0='kgriffs', branch0='master', usr1='vytas7', branch1=3,
+    ) == '/repos/falcon/falcon/compare/kgriffs:master...vytas7:3'
+
+
+def test_url_for_resource(app):
+    things = app._router.find('/things')[0]
+
+    assert app.url_for(things) == '/things'
+    assert app.url_for(things, thing_id=7) == '/things/7'
+
+    client = falcon.testing.TestClient(app)
+    assert client.simulate_get('/things').headers['Location'] == '/things/42'
+
+
+@pytest.mark.parametrize('resource_or_name,fields', [
+    ('thing', {}),
+    ('thing', {'thing_id': 1, 'extra': 2}),
+    ('nope', {}),
+    (ThingsResource(), {}),
+])
+def test_url_for_no_match(app, resource_or_name, fields):
+    with pytest.raises(ValueError):
+        app.url_for(resource_or_name, **fields)
+
+
+def test_url_for_overridden_name(app):
+    app.add_route('/v2/things/{thing_id}', ThingsResource(), name='thing')
+    assert app.url_for('thing', thing_id='x') == '/v2/things/x'
+
+
+def test_url_for_readded_route(app):
+    things = ThingsResource()
+    app.add_route('/things', things)
+
+    old_things = app._router.find('/things/1')[0]
+    assert app.url_for(things) == '/things'
+    assert app.url_for(old_things, thing_id=1) == '/things/1'
+    with pytest.raises(ValueError):
+        app.url_for(old_things)
+
+
+def test_url_for_compiled_lazily(asgi):
+    app = create_app(asgi)
+    app.add_route('/things/{thing_id}', ThingsResource(), name='thing')
+    assert app._url_builders is None
+
+    assert app.url_for('thing', thing_id=1) == '/things/1'
+    assert app._url_builders is not None
+
+    app.add_route('/parts/{part_id}', ThingsResource(), name='part')
+    assert app._url_builders is None
+    assert app.url_for('part', part_id=2) == '/parts/2'
+
+
+def test_url_for_custom_router(asgi):
+    class CustomRouter:
+        def __init__(self):
+            self.routes = {}
+
+        def add_route(self, uri_template, resource, **kwargs):
+            self.routes[uri_template] = resource
+
+        def find(self, uri, req=None):
+            return None
+
+    app = create_app(asgi, router=CustomRouter())
+    app.add_route('/a/{1bad}', ThingsResource(), name='bad')
+
+    with pytest.raises(ValueError):
+        app.url_for('bad')